@@ -1,6 +1,34 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
-from .models import CustomUser, GameWord, GameSession, GameGuess
+from django.db.models import Q
+from .models import CustomUser, DailyStats, GameWord, GameSession, GameGuess, PlayerStats
+from .pagination import EstimatedCountPaginator
+
+class PrefixSearchMixin:
+    """Search ``prefix_search`` fields with a case-sensitive ``startswith``.
+
+    The admin's ``^`` prefix is ``istartswith``, i.e. ``UPPER(col) LIKE`` on
+    PostgreSQL, which no index can serve. A plain ``LIKE 'x%'`` can use the
+    ``_like`` pattern index PostgreSQL gets for each unique varchar column.
+    ``prefix_search`` maps each ``relation__field`` path to the normalization
+    its values use. Each field is matched in a subquery on its own table: an
+    OR across joined tables is a join filter, which no index can serve.
+    """
+    prefix_search = {}
+
+    def get_search_results(self, request, queryset, search_term):
+        term = search_term.strip()
+        if not term:
+            return queryset, False
+        query = Q()
+        for path, normalize in self.prefix_search.items():
+            relation, field = path.rsplit('__', 1)
+            model = queryset.model
+            for name in relation.split('__'):
+                model = model._meta.get_field(name).related_model
+            matches = model._default_manager.filter(**{f'{field}__startswith': normalize(term)})
+            query |= Q(**{f'{relation}__in': matches})
+        return queryset.filter(query), False
 
 @admin.register(CustomUser)
 class CustomUserAdmin(UserAdmin):
@@ -18,15 +46,43 @@ class GameWordAdmin(admin.ModelAdmin):
     ordering = ('word',)
 
 @admin.register(GameSession)
-class GameSessionAdmin(admin.ModelAdmin):
+class GameSessionAdmin(PrefixSearchMixin, admin.ModelAdmin):
     list_display = ('user', 'word', 'is_won', 'is_completed', 'created_at')
+    # A date list filter instead of date_hierarchy: its drill-down bar runs a
+    # SELECT DISTINCT over every matching row on each page view.
     list_filter = ('is_won', 'is_completed', 'created_at')
+    list_select_related = ('user', 'word')
+    # search_fields only turns the search box on; prefix_search runs it.
     search_fields = ('user__username', 'word__word')
+    prefix_search = {'user__username': str, 'word__word': str.upper}
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    raw_id_fields = ('user', 'word')
     readonly_fields = ('created_at', 'completed_at')
+    ordering = ('-created_at',)
 
 @admin.register(GameGuess)
-class GameGuessAdmin(admin.ModelAdmin):
+class GameGuessAdmin(PrefixSearchMixin, admin.ModelAdmin):
     list_display = ('session', 'word', 'is_correct', 'created_at')
     list_filter = ('is_correct', 'created_at')
-    search_fields = ('session__user__username', 'word')
+    list_select_related = ('session__user', 'session__word')
+    search_fields = ('session__user__username',)
+    prefix_search = {'session__user__username': str}
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    raw_id_fields = ('session',)
     readonly_fields = ('created_at',)
+    ordering = ('-created_at',)
+
+@admin.register(DailyStats)
+class DailyStatsAdmin(admin.ModelAdmin):
+    list_display = ('date', 'total_users', 'total_games', 'correct_guesses', 'updated_at')
+    date_hierarchy = 'date'
+    ordering = ('-date',)
+
+@admin.register(PlayerStats)
+class PlayerStatsAdmin(admin.ModelAdmin):
+    list_display = ('user', 'games_played', 'games_won', 'current_streak', 'best_streak', 'last_completed_at')
+    search_fields = ('user__username',)
+    ordering = PlayerStats.RANK_ORDERING
+    raw_id_fields = ('user',)
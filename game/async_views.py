@@ -0,0 +1,119 @@
+import json
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.views import redirect_to_login
+from django.db import close_old_connections
+from django.http import Http404, JsonResponse
+
+from .dictionary import is_accepted_guess
+from .services import LEADERBOARD_SIZE, GameError, GuessError, get_hint, get_leaderboard, get_quota_state, get_session_state, record_guess, start_game
+from .utils import validate_word
+
+
+def run_db(func):
+    """Run ORM work from an async view in the shared thread pool.
+
+    ``thread_sensitive=False`` lets concurrent requests use separate worker
+    threads (and therefore separate connections) instead of queueing on one
+    thread; connections are closed per call just like the request cycle
+    does for sync views.
+    """
+    def call(*args, **kwargs):
+        close_old_connections()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            close_old_connections()
+
+    return sync_to_async(call, thread_sensitive=False)
+
+
+def _record_accepted_guess(user, session_id, guess):
+    # The dictionary check can fall back to the word index, which may
+    # reload from the database, so it runs on the executor as well.
+    if not is_accepted_guess(guess):
+        raise GuessError('Not in word list')
+    return record_guess(user, session_id, guess)
+
+
+def _authenticated_user(request):
+    user = request.user
+    return user if user.is_authenticated else None
+
+
+def async_login_required(view):
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        user = await run_db(_authenticated_user)(request)
+        if user is None:
+            return redirect_to_login(request.get_full_path())
+        return await view(request, user, *args, **kwargs)
+    return wrapper
+
+
+@async_login_required
+async def start_new_game(request, user):
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+
+    try:
+        return JsonResponse(await run_db(start_game)(user))
+    except GameError as e:
+        return JsonResponse({'error': e.message}, status=e.status)
+
+
+@async_login_required
+async def submit_guess(request, user):
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+
+    try:
+        data = json.loads(request.body)
+        session_id = data.get('session_id')
+        guess = data.get('guess', '').upper()
+
+        if not validate_word(guess):
+            return JsonResponse({'error': 'Invalid word format'}, status=400)
+
+        return JsonResponse(await run_db(_record_accepted_guess)(user, session_id, guess))
+
+    except GameError as e:
+        return JsonResponse({'error': e.message}, status=e.status)
+    except Http404:
+        return JsonResponse({'error': 'Game session not found'}, status=404)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+
+# csrf_exempt is not coroutine-aware on Django 3.2, so set the flag directly.
+submit_guess.csrf_exempt = True
+
+
+@async_login_required
+async def get_session_data(request, user, session_id):
+    return JsonResponse(await run_db(get_session_state)(user, session_id))
+
+
+@async_login_required
+async def session_hint(request, user, session_id):
+    try:
+        return JsonResponse(await run_db(get_hint)(user, session_id))
+    except GameError as e:
+        return JsonResponse({'error': e.message}, status=e.status)
+
+
+@async_login_required
+async def get_daily_stats(request, user):
+    return JsonResponse(await run_db(get_quota_state)(user))
+
+
+@async_login_required
+async def leaderboard(request, user):
+    try:
+        limit = int(request.GET.get('limit', LEADERBOARD_SIZE))
+        return JsonResponse(await run_db(get_leaderboard)(user, limit))
+    except ValueError:
+        return JsonResponse({'error': 'limit must be a number'}, status=400)
+    except GameError as e:
+        return JsonResponse({'error': e.message}, status=e.status)
@@ -0,0 +1,42 @@
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from django.db import transaction
+
+USER_CACHE_SECONDS = 300
+# Bump when CustomUser's fields change so workers never unpickle an old shape.
+USER_CACHE_VERSION = 1
+
+
+def _key(user_id):
+    return f'game:user:{user_id}'
+
+
+class CachedModelBackend(ModelBackend):
+    """ModelBackend whose per-request ``get_user`` is served from the cache.
+
+    ``AuthenticationMiddleware`` calls ``get_user`` on every authenticated
+    request; caching the row for a few minutes removes that query. Entries
+    are dropped whenever the user is saved or deleted (see game.signals).
+    With a shared cache, password, role and ``is_active`` changes therefore
+    apply on the next request; the timeout bounds staleness after bulk
+    ``update()`` calls, which send no signals. Without ``SHARED_CACHE`` the
+    drop would only reach the worker that saved the user, so the row is
+    always read from the database instead.
+    """
+
+    def get_user(self, user_id):
+        if not settings.SHARED_CACHE:
+            return super().get_user(user_id)
+        user = cache.get(_key(user_id), version=USER_CACHE_VERSION)
+        if user is None:
+            user = super().get_user(user_id)
+            if user is None:
+                return None
+            cache.set(_key(user_id), user, timeout=USER_CACHE_SECONDS, version=USER_CACHE_VERSION)
+        return user if self.user_can_authenticate(user) else None
+
+
+def invalidate_user(user_id):
+    transaction.on_commit(lambda: cache.delete(_key(user_id), version=USER_CACHE_VERSION))
+
@@ -0,0 +1,98 @@
+import threading
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+
+from django.conf import settings
+
+from .scoring import WORD_LENGTH
+from .word_index import word_index
+
+DEFAULT_PATH = Path(__file__).resolve().parent / 'data' / 'accepted_guesses.txt'
+LETTER_BITS = 5
+
+
+def pack(word):
+    """Pack a five letter A-Z word into a 25-bit integer, or return None."""
+    if len(word) != WORD_LENGTH:
+        return None
+    value = 0
+    for letter in word:
+        offset = ord(letter) - 65
+        if not 0 <= offset < 26:
+            return None
+        value = (value << LETTER_BITS) | offset
+    return value
+
+
+def unpack(value):
+    letters = []
+    for _ in range(WORD_LENGTH):
+        letters.append(chr(65 + (value & 0b11111)))
+        value >>= LETTER_BITS
+    return ''.join(reversed(letters))
+
+
+class GuessDictionary:
+    """Accepted guesses as a sorted array of packed words.
+
+    Each word costs four bytes and membership is a binary search, so the
+    full list stays well under a megabyte per worker. The file is read on
+    first use; one word per line, case-insensitive, ``#`` starts a comment.
+    """
+
+    def __init__(self, path=None):
+        self._path = path
+        self._lock = threading.Lock()
+        self._codes = None
+
+    @property
+    def path(self):
+        return self._path or getattr(settings, 'ACCEPTED_GUESSES_PATH', None) or DEFAULT_PATH
+
+    def __len__(self):
+        return len(self._load())
+
+    def __contains__(self, word):
+        code = pack(word)
+        if code is None:
+            return False
+        codes = self._load()
+        position = bisect_left(codes, code)
+        return position < len(codes) and codes[position] == code
+
+    def _load(self):
+        codes = self._codes
+        if codes is None:
+            with self._lock:
+                if self._codes is None:
+                    self._codes = self.read(self.path)
+                codes = self._codes
+        return codes
+
+    @staticmethod
+    def read(path):
+        codes = set()
+        with open(path, encoding='ascii') as handle:
+            for line in handle:
+                code = pack(line.split('#', 1)[0].strip().upper())
+                if code is not None:
+                    codes.add(code)
+        return array('I', sorted(codes))
+
+    def reload(self):
+        with self._lock:
+            self._codes = None
+
+
+accepted_guesses = GuessDictionary()
+
+
+def is_accepted_guess(word):
+    """True if ``word`` is in the bundled list or is one of the answers.
+
+    The bundled list is checked first and never touches the database; the
+    answer pool is only consulted for words missing from it, so answers
+    added through the admin are always playable.
+    """
+    return word in accepted_guesses or word_index.contains(word)
@@ -0,0 +1,145 @@
+import json
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+
+class LocalEventBackend:
+    """In-process pub/sub; only reaches subscribers in the same worker.
+
+    Good for tests, ``runserver`` and single-process deployments. Use a
+    shared backend such as ``CacheEventBackend`` when several workers serve
+    the same players.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = {}
+
+    def publish(self, channel, event, data):
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for subscriber in subscribers:
+            subscriber.put((event, data))
+
+    def subscribe(self, channel):
+        return LocalSubscription(self, channel)
+
+    def _add(self, channel, subscription):
+        with self._lock:
+            self._subscribers.setdefault(channel, set()).add(subscription)
+
+    def _remove(self, channel, subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[channel]
+
+
+class LocalSubscription:
+    def __init__(self, backend, channel):
+        self.backend = backend
+        self.channel = channel
+        self._queue = queue.Queue()
+        backend._add(channel, self)
+
+    def put(self, item):
+        self._queue.put(item)
+
+    def get(self, timeout):
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self.backend._remove(self.channel, self)
+
+
+class CacheEventBackend:
+    """Pub/sub through the Django cache, shared by every worker using it.
+
+    Each channel is a sequence counter plus one short-lived key per event;
+    subscribers poll the counter, which costs a cache round trip and no SQL.
+    """
+
+    event_timeout = 120
+    poll_interval = 0.5
+
+    def publish(self, channel, event, data):
+        key = f'game:events:{channel}'
+        cache.add(f'{key}:seq', 0, timeout=None)
+        try:
+            sequence = cache.incr(f'{key}:seq')
+        except ValueError:
+            cache.set(f'{key}:seq', 1, timeout=None)
+            sequence = 1
+        cache.set(f'{key}:{sequence}', (event, data), timeout=self.event_timeout)
+
+    def subscribe(self, channel):
+        return CacheSubscription(self, channel)
+
+
+class CacheSubscription:
+    def __init__(self, backend, channel):
+        self.backend = backend
+        self.key = f'game:events:{channel}'
+        self._seen = cache.get(f'{self.key}:seq', 0)
+        self._pending = []
+
+    def get(self, timeout):
+        deadline = time.monotonic() + timeout
+        while True:
+            if self._pending:
+                return self._pending.pop(0)
+            latest = cache.get(f'{self.key}:seq', 0)
+            if latest > self._seen:
+                keys = [f'{self.key}:{sequence}' for sequence in range(self._seen + 1, latest + 1)]
+                found = cache.get_many(keys)
+                self._pending = [found[key] for key in keys if key in found]
+                self._seen = latest
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            time.sleep(min(self.backend.poll_interval, remaining))
+
+    def close(self):
+        pass
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                path = getattr(settings, 'GAME_EVENTS_BACKEND', 'game.events.LocalEventBackend')
+                _backend = import_string(path)()
+    return _backend
+
+
+def session_channel(session_id):
+    return f'session:{session_id}'
+
+
+def publish_on_commit(channel, event, data):
+    """Publish once the current transaction commits; ``data`` may be a callable."""
+    def publish():
+        get_backend().publish(channel, event, data() if callable(data) else data)
+
+    transaction.on_commit(publish)
+
+
+def format_sse(event, data):
+    return f'event: {event}\ndata: {json.dumps(data)}\n\n'
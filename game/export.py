@@ -0,0 +1,154 @@
+import csv
+import json
+import tempfile
+import zlib
+from datetime import datetime
+
+from .models import GameGuess, GameSession
+from .scoring import STATUSES
+from .utils import day_bounds
+
+FORMATS = ('csv', 'jsonl')
+CHUNK_SIZE = 2000
+FLUSH_BYTES = 64 * 1024
+
+SESSION_COLUMNS = (
+    ('session_id', 'id'),
+    ('user_id', 'user_id'),
+    ('username', 'user__username'),
+    ('word', 'word__word'),
+    ('created_at', 'created_at'),
+    ('completed_at', 'completed_at'),
+    ('guess_count', 'guess_count'),
+    ('is_completed', 'is_completed'),
+    ('is_won', 'is_won'),
+)
+
+GUESS_COLUMNS = (
+    ('guess_id', 'id'),
+    ('session_id', 'session_id'),
+    ('user_id', 'session__user_id'),
+    ('username', 'session__user__username'),
+    ('target', 'session__word__word'),
+    ('guess', 'word'),
+    ('pattern', 'feedback'),
+    ('is_correct', 'is_correct'),
+    ('created_at', 'created_at'),
+)
+
+KINDS = {
+    'sessions': (GameSession, SESSION_COLUMNS, 'created_at', 'user'),
+    'guesses': (GameGuess, GUESS_COLUMNS, 'created_at', 'session__user'),
+}
+
+
+def _pattern(feedback):
+    return ''.join(str(STATUSES.index(item['status'])) for item in feedback)
+
+
+def _plain(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, list):
+        return _pattern(value)
+    return value
+
+
+def export_rows(kind, start=None, end=None, user=None, chunk_size=CHUNK_SIZE):
+    """Return ``(headers, rows)`` for ``kind``, ``'sessions'`` or ``'guesses'``.
+
+    ``start`` and ``end`` are inclusive dates and ``user`` is a username.
+    Rows are plain tuples read with ``values_list(...).iterator()``, so
+    memory use does not depend on the size of the range; the joins to the
+    user and the word happen in the same query.
+    """
+    model, columns, date_field, user_field = KINDS[kind]
+    queryset = model.objects.all()
+    if start is not None:
+        queryset = queryset.filter(**{f'{date_field}__gte': day_bounds(start)[0]})
+    if end is not None:
+        queryset = queryset.filter(**{f'{date_field}__lt': day_bounds(end)[1]})
+    if user:
+        queryset = queryset.filter(**{f'{user_field}__username': user})
+
+    return rows_for(kind, queryset, chunk_size)
+
+
+def rows_for(kind, queryset, chunk_size=CHUNK_SIZE):
+    """Like ``export_rows`` but for an already filtered ``queryset`` of ``kind``."""
+    columns = KINDS[kind][1]
+    lookups = [lookup for _, lookup in columns]
+    rows = queryset.order_by('pk').values_list(*lookups).iterator(chunk_size=chunk_size)
+    return [header for header, _ in columns], (tuple(_plain(value) for value in row) for row in rows)
+
+
+class _Line:
+    """File-like object for ``csv.writer`` that hands back each written line."""
+
+    def write(self, value):
+        return value
+
+
+def csv_lines(headers, rows):
+    writer = csv.writer(_Line())
+    yield writer.writerow(headers)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def jsonl_lines(headers, rows):
+    for row in rows:
+        yield json.dumps(dict(zip(headers, row)), separators=(',', ':')) + '\n'
+
+
+def encode_chunks(lines, compress=False):
+    """Join ``lines`` into byte chunks of roughly ``FLUSH_BYTES``, gzipped if asked."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+    buffer = []
+    size = 0
+    for line in lines:
+        data = line.encode('utf-8')
+        buffer.append(data)
+        size += len(data)
+        if size >= FLUSH_BYTES:
+            chunk = b''.join(buffer)
+            buffer = []
+            size = 0
+            if compressor is not None:
+                chunk = compressor.compress(chunk)
+            if chunk:
+                yield chunk
+    chunk = b''.join(buffer)
+    if compressor is not None:
+        chunk = compressor.compress(chunk) + compressor.flush()
+    if chunk:
+        yield chunk
+
+
+def export_stream(kind, output_format='csv', compress=False, **filters):
+    headers, rows = export_rows(kind, **filters)
+    lines = csv_lines(headers, rows) if output_format == 'csv' else jsonl_lines(headers, rows)
+    return encode_chunks(lines, compress=compress)
+
+
+def spool(chunks):
+    """Write ``chunks`` to an anonymous temporary file and return it rewound."""
+    handle = tempfile.TemporaryFile()
+    try:
+        for chunk in chunks:
+            handle.write(chunk)
+    except BaseException:
+        handle.close()
+        raise
+    handle.seek(0)
+    return handle
+
+
+def export_filename(kind, output_format, compress=False, start=None, end=None, **filters):
+    parts = [kind]
+    if start is not None:
+        parts.append(start.isoformat())
+    if end is not None:
+        parts.append(end.isoformat())
+    name = '-'.join(parts) + '.' + output_format
+    return name + '.gz' if compress else name
@@ -0,0 +1,165 @@
+import mmap
+import os
+import struct
+import threading
+import time
+
+from django.conf import settings
+
+from .scoring import WORD_LENGTH, score
+
+MAGIC = b'GTWFBM01'
+HEADER = struct.Struct('<8sI')
+RECHECK_SECONDS = 5
+
+
+class FeedbackMatrix:
+    """Read-only guess x answer table of feedback codes.
+
+    The file holds a small header, the vocabulary as fixed-width ASCII and
+    then one byte per (guess, answer) pair, row-major by guess. It is memory
+    mapped, so every worker on a host shares the same pages.
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        with open(self.path, 'rb') as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, size = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f'{self.path} is not a feedback matrix file')
+        self.size = size
+        words_start = HEADER.size
+        self._codes_start = words_start + size * WORD_LENGTH
+        raw = self._mmap[words_start:self._codes_start].decode('ascii')
+        self.words = [raw[i:i + WORD_LENGTH] for i in range(0, len(raw), WORD_LENGTH)]
+        self.positions = {word: position for position, word in enumerate(self.words)}
+        if len(self._mmap) != self._codes_start + size * size:
+            self._mmap.close()
+            raise ValueError(f'{self.path} is truncated')
+
+    def lookup(self, guess, target):
+        guess_position = self.positions.get(guess)
+        if guess_position is None:
+            return None
+        target_position = self.positions.get(target)
+        if target_position is None:
+            return None
+        return self._mmap[self._codes_start + guess_position * self.size + target_position]
+
+    def row(self, guess):
+        position = self.positions[guess]
+        start = self._codes_start + position * self.size
+        return self._mmap[start:start + self.size]
+
+    def close(self):
+        self._mmap.close()
+
+
+def build(words, path, previous=None):
+    """Write a matrix for ``words`` to ``path`` atomically.
+
+    Codes for pairs already present in ``previous`` are copied instead of
+    being rescored, so adding a handful of words to a large vocabulary only
+    scores the new rows and columns. Returns the number of pairs scored.
+    """
+    import tempfile  # Only the build command writes matrices; keep it off the request path.
+
+    words = sorted(set(words))
+    size = len(words)
+    scored = 0
+    old_positions = previous.positions if previous is not None else {}
+    column_map = [old_positions.get(word) for word in words]
+    reusable_columns = all(position is not None for position in column_map)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.feedback-matrix-')
+    try:
+        with os.fdopen(fd, 'wb') as handle:
+            handle.write(HEADER.pack(MAGIC, size))
+            handle.write(''.join(words).encode('ascii'))
+            for guess in words:
+                if guess in old_positions:
+                    old_row = previous.row(guess)
+                    if reusable_columns:
+                        row = bytes(old_row[position] for position in column_map)
+                    else:
+                        row = bytearray(size)
+                        for index, (target, position) in enumerate(zip(words, column_map)):
+                            if position is None:
+                                row[index] = score(guess, target)
+                                scored += 1
+                            else:
+                                row[index] = old_row[position]
+                else:
+                    row = bytes(score(guess, target) for target in words)
+                    scored += size
+                handle.write(row)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+    return scored
+
+
+class _MatrixHolder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._matrix = None
+        self._identity = None
+        self._checked_at = 0.0
+
+    def get(self):
+        now = time.monotonic()
+        if now - self._checked_at < RECHECK_SECONDS:
+            return self._matrix
+        with self._lock:
+            self._checked_at = now
+            path = getattr(settings, 'FEEDBACK_MATRIX_PATH', None)
+            try:
+                stat = os.stat(path) if path else None
+            except OSError:
+                stat = None
+            identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size) if stat else None
+            if identity != self._identity:
+                self._identity = identity
+                self._matrix = None
+                if identity is not None:
+                    try:
+                        self._matrix = FeedbackMatrix(path)
+                    except (OSError, ValueError, struct.error):
+                        self._matrix = None
+            return self._matrix
+
+
+_holder = _MatrixHolder()
+
+
+def get_matrix():
+    return _holder.get()
+
+
+def feedback_code(guess, target):
+    matrix = _holder.get()
+    if matrix is not None:
+        code = matrix.lookup(guess, target)
+        if code is not None:
+            return code
+    return score(guess, target)
+
+
+def feedback_codes(guess, targets):
+    """Codes for one guess against many targets, reading the matrix row once."""
+    matrix = _holder.get()
+    row = None
+    positions = None
+    if matrix is not None and guess in matrix.positions:
+        row = matrix.row(guess)
+        positions = matrix.positions
+    codes = []
+    for target in targets:
+        position = positions.get(target) if row is not None else None
+        codes.append(row[position] if position is not None else score(guess, target))
+    return codes
@@ -0,0 +1,131 @@
+import json
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, setup_test_environment
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import urlencode
+
+from game.models import CustomUser, GameGuess, GameSession, GameWord
+from game.services import MAX_GUESSES
+
+BENCH_USERNAME = 'benchadmin'
+BATCH_SIZE = 5000
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed GameGuess/GameSession rows inside a transaction, render the admin changelists and '
+        'report the queries and time per page; fails if a page exceeds --max-queries. '
+        'Nothing is left behind: the transaction is rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1000000, help='GameGuess rows to seed.')
+        parser.add_argument('--max-queries', type=int, default=4, help='Query budget per changelist page.')
+        parser.add_argument('--output', help='Write the results as JSON to this file.')
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        words = list(GameWord.objects.values_list('id', 'word')[:MAX_GUESSES + 1])
+        if len(words) <= MAX_GUESSES:
+            raise CommandError(f'Need at least {MAX_GUESSES + 1} words; run seed_words first.')
+
+        results = {}
+        try:
+            with transaction.atomic():
+                self.seed(words, options['rows'])
+                results = self.measure()
+                raise Rollback
+        except Rollback:
+            pass
+
+        self.stdout.write(f"{'page':<28}{'queries':>8}{'ms':>9}")
+        over_budget = []
+        for name, result in results.items():
+            self.stdout.write(f"{name:<28}{result['queries']:>8}{result['ms']:>9.1f}")
+            if result['queries'] > options['max_queries']:
+                over_budget.append(name)
+
+        if options['output']:
+            with open(options['output'], 'w') as handle:
+                json.dump(results, handle, indent=2)
+        if over_budget:
+            raise CommandError(f"Over the {options['max_queries']} query budget: {', '.join(over_budget)}")
+
+    def seed(self, words, rows):
+        start = time.perf_counter()
+        admin = CustomUser.objects.create_superuser(BENCH_USERNAME, role='admin', password=None)
+        players = CustomUser.objects.bulk_create([
+            CustomUser(username=f'{BENCH_USERNAME}{index}', role='player') for index in range(100)
+        ])
+        if players[0].pk is None:
+            players = list(CustomUser.objects.filter(username__startswith=f'{BENCH_USERNAME}').exclude(pk=admin.pk))
+
+        sessions = rows // MAX_GUESSES
+        for offset in range(0, sessions, BATCH_SIZE):
+            count = min(BATCH_SIZE, sessions - offset)
+            GameSession.objects.bulk_create([
+                GameSession(
+                    user=players[index % len(players)], word_id=words[index % len(words)][0],
+                    is_completed=True, guess_count=MAX_GUESSES,
+                )
+                for index in range(offset, offset + count)
+            ])
+        session_ids = GameSession.objects.filter(user__in=players).values_list('id', flat=True).iterator()
+
+        batch = []
+        for session_id in session_ids:
+            batch.extend(
+                GameGuess(session_id=session_id, word=word, feedback=[], is_correct=False)
+                for _, word in words[1:MAX_GUESSES + 1]
+            )
+            if len(batch) >= BATCH_SIZE:
+                GameGuess.objects.bulk_create(batch)
+                batch = []
+        GameGuess.objects.bulk_create(batch)
+
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(f'ANALYZE {GameSession._meta.db_table}, {GameGuess._meta.db_table}')
+        self.stdout.write(
+            f'Seeded {sessions} sessions and {sessions * MAX_GUESSES} guesses in {time.perf_counter() - start:.1f}s'
+        )
+        self.admin = admin
+
+    def measure(self):
+        client = Client()
+        client.force_login(self.admin)
+        # The same range the "Past 7 days" date filter links to.
+        today = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+        past_week = urlencode({'created_at__gte': today - timedelta(days=7), 'created_at__lt': today + timedelta(days=1)})
+        pages = {}
+        for model in ('gamesession', 'gameguess'):
+            url = reverse(f'admin:game_{model}_changelist')
+            pages.update({
+                f'{model}': url,
+                f'{model} page 10': f'{url}?p=10',
+                f'{model} search': f'{url}?q={BENCH_USERNAME}1',
+                f'{model} past 7 days': f'{url}?{past_week}',
+            })
+
+        # Warm the session, user and content type caches so only the changelist itself is counted.
+        client.get(reverse('admin:index'))
+        results = {}
+        for name, url in pages.items():
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                response = client.get(url)
+                elapsed = time.perf_counter() - start
+            if response.status_code != 200:
+                raise CommandError(f'{url} returned HTTP {response.status_code}.')
+            results[name] = {'url': url, 'queries': len(queries), 'ms': elapsed * 1000}
+        return results
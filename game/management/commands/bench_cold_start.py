@@ -0,0 +1,125 @@
+import json
+import subprocess
+import sys
+from collections import defaultdict
+from statistics import median
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Runs in a fresh interpreter so nothing is imported or cached yet.
+CHILD = r'''
+import json, os, sys, time
+options = json.loads(sys.argv[1])
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'guess_the_word_django.settings')
+started = time.perf_counter()
+from guess_the_word_django.wsgi import application
+result = {'import': time.perf_counter() - started, 'warm_up': {}, 'requests': []}
+if options['warm']:
+    from game.warmup import warm_up
+    result['warm_up'] = warm_up()
+
+from wsgiref.util import setup_testing_defaults
+
+for path in options['paths']:
+    for attempt in ('first', 'second'):
+        environ = {'PATH_INFO': path, 'HTTP_HOST': options['host']}
+        setup_testing_defaults(environ)
+        statuses = []
+        started = time.perf_counter()
+        response = application(environ, lambda status, headers, exc_info=None: statuses.append(status))
+        try:
+            for _ in response:
+                pass
+        finally:
+            getattr(response, 'close', lambda: None)()
+        result['requests'].append({
+            'path': path,
+            'attempt': attempt,
+            'status': statuses[0] if statuses else None,
+            'seconds': time.perf_counter() - started,
+        })
+print(json.dumps(result))
+'''
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure worker cold start: time to import the WSGI application and the latency of the '
+        'first and second request, plus an -X importtime breakdown of where the import time goes.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', action='append', dest='paths', help='Path to request (repeatable).')
+        parser.add_argument('--runs', type=int, default=5, help='Fresh interpreters to average over.')
+        parser.add_argument('--host', default='localhost', help='Host header for the requests.')
+        parser.add_argument('--warm', action='store_true',
+                            help='Run game.warmup.warm_up() before the requests, as the preloaded master does.')
+        parser.add_argument('--top', type=int, default=15, help='Modules to list in the import breakdown.')
+        parser.add_argument('--output', help='Write the results as JSON to this file.')
+
+    def handle(self, *args, **options):
+        child_options = json.dumps({
+            'paths': options['paths'] or ['/login/'],
+            'host': options['host'],
+            'warm': options['warm'],
+        })
+
+        runs = [self.run_child([], child_options)[0] for _ in range(options['runs'])]
+        import_ms = median(run['import'] for run in runs) * 1000
+        self.stdout.write(f'WSGI application import: {import_ms:.1f} ms (median of {len(runs)} runs)')
+        if options['warm']:
+            for name in runs[0]['warm_up']:
+                seconds = median(run['warm_up'].get(name, 0) for run in runs)
+                self.stdout.write(f'  warm-up {name}: {seconds * 1000:.1f} ms')
+
+        latencies = defaultdict(list)
+        statuses = {}
+        for run in runs:
+            for request in run['requests']:
+                latencies[request['path'], request['attempt']].append(request['seconds'])
+                statuses[request['path']] = request['status']
+        for path in json.loads(child_options)['paths']:
+            first = median(latencies[path, 'first']) * 1000
+            second = median(latencies[path, 'second']) * 1000
+            self.stdout.write(f'{path} [{statuses[path]}]: first request {first:.1f} ms, second {second:.1f} ms')
+
+        modules, packages = self.import_breakdown(child_options)
+        self.stdout.write('\nSlowest imports (cumulative ms, one run with -X importtime):')
+        for name, cumulative in sorted(modules.items(), key=lambda item: -item[1])[:options['top']]:
+            self.stdout.write(f'{cumulative / 1000:>9.1f}  {name}')
+        self.stdout.write('\nSelf time by top-level package (ms):')
+        for name, total in sorted(packages.items(), key=lambda item: -item[1])[:options['top']]:
+            self.stdout.write(f'{total / 1000:>9.1f}  {name}')
+
+        if options['output']:
+            with open(options['output'], 'w') as handle:
+                json.dump({
+                    'import_ms': import_ms,
+                    'runs': runs,
+                    'imports': modules,
+                    'packages': packages,
+                }, handle, indent=2)
+
+    def run_child(self, flags, child_options):
+        completed = subprocess.run(
+            [sys.executable, *flags, '-c', CHILD, child_options],
+            cwd=str(settings.BASE_DIR),
+            capture_output=True,
+            text=True,
+        )
+        if completed.returncode != 0:
+            raise CommandError(f'Cold start run failed:\n{completed.stderr[-2000:]}')
+        return json.loads(completed.stdout.strip().splitlines()[-1]), completed.stderr
+
+    def import_breakdown(self, child_options):
+        _, stderr = self.run_child(['-X', 'importtime'], child_options)
+        modules = {}
+        packages = defaultdict(int)
+        for line in stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            _, self_us, cumulative_us, name = (part.strip() for part in line.replace('import time:', '|', 1).split('|'))
+            modules[name] = int(cumulative_us)
+            packages[name.split('.')[0]] += int(self_us)
+        return modules, dict(packages)
@@ -0,0 +1,140 @@
+import http.client
+import json
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.cookies import SimpleCookie
+from urllib.parse import urlencode, urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+
+from game.management.commands.bench_game_flow import percentile
+
+
+class Command(BaseCommand):
+    help = (
+        'Hold N concurrent connections against a running server (WSGI or ASGI) and report '
+        'throughput and latency. Run it once against each deployment to compare them.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='http://127.0.0.1:8000')
+        parser.add_argument('--username', required=True)
+        parser.add_argument('--password', required=True)
+        parser.add_argument('--path', default='/api/daily-stats/')
+        parser.add_argument('--connections', default='1,10,50,100',
+                            help='Comma separated list of concurrency levels to try.')
+        parser.add_argument('--duration', type=float, default=10.0, help='Seconds per concurrency level.')
+        parser.add_argument('--timeout', type=float, default=30.0)
+        parser.add_argument('--output', help='Write the results as JSON to this file.')
+
+    def handle(self, *args, **options):
+        url = urlsplit(options['url'])
+        self.host = url.hostname
+        self.port = url.port or (443 if url.scheme == 'https' else 80)
+        self.https = url.scheme == 'https'
+        self.timeout = options['timeout']
+
+        cookies = self.login(options['username'], options['password'])
+        levels = [int(level) for level in options['connections'].split(',') if level.strip()]
+
+        results = []
+        self.stdout.write(f"{'conns':>6}{'reqs':>8}{'errs':>6}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+        for level in levels:
+            result = self.run_level(level, options['path'], cookies, options['duration'])
+            results.append(result)
+            self.stdout.write(
+                f"{level:>6}{result['requests']:>8}{result['errors']:>6}{result['requests_per_second']:>9.1f}"
+                f"{result['p50_ms'] or 0:>9.1f}{result['p95_ms'] or 0:>9.1f}{result['p99_ms'] or 0:>9.1f}"
+            )
+
+        if options['output']:
+            with open(options['output'], 'w') as handle:
+                json.dump({'url': options['url'], 'path': options['path'], 'levels': results}, handle, indent=2)
+
+    def connection(self):
+        cls = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+        return cls(self.host, self.port, timeout=self.timeout)
+
+    def request(self, method, path, cookies, body=None, headers=None):
+        conn = self.connection()
+        try:
+            headers = dict(headers or {})
+            headers['Host'] = f'{self.host}:{self.port}'
+            if cookies:
+                headers['Cookie'] = '; '.join(f'{key}={value}' for key, value in cookies.items())
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            data = response.read()
+            for header in response.headers.get_all('Set-Cookie') or []:
+                cookie = SimpleCookie()
+                cookie.load(header)
+                for key, morsel in cookie.items():
+                    cookies[key] = morsel.value
+            return response.status, data
+        finally:
+            conn.close()
+
+    def login(self, username, password):
+        cookies = {}
+        try:
+            status, body = self.request('GET', '/login/', cookies)
+        except OSError as e:
+            raise CommandError(f'Could not reach {self.host}:{self.port}: {e}')
+        match = re.search(rb'name="csrfmiddlewaretoken" value="([^"]+)"', body)
+        if status != 200 or not match:
+            raise CommandError(f'Could not load the login page (HTTP {status}).')
+        form = urlencode({
+            'csrfmiddlewaretoken': match.group(1).decode(),
+            'username': username,
+            'password': password,
+        })
+        self.request('POST', '/login/', cookies, body=form, headers={
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'Referer': f'http://{self.host}:{self.port}/login/',
+        })
+        if 'sessionid' not in cookies:
+            raise CommandError('Login failed; check --username and --password.')
+        return cookies
+
+    def run_level(self, connections, path, cookies, duration):
+        latencies = []
+        errors = [0]
+        lock = threading.Lock()
+        deadline = time.perf_counter() + duration
+
+        def worker():
+            local_latencies = []
+            local_errors = 0
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    status, _ = self.request('GET', path, dict(cookies))
+                    if status >= 400:
+                        local_errors += 1
+                except (OSError, http.client.HTTPException):
+                    local_errors += 1
+                local_latencies.append(time.perf_counter() - start)
+            with lock:
+                latencies.extend(local_latencies)
+                errors[0] += local_errors
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=connections) as pool:
+            for _ in range(connections):
+                pool.submit(worker)
+        elapsed = time.perf_counter() - started
+
+        def ms(value):
+            return value * 1000 if value is not None else None
+
+        return {
+            'connections': connections,
+            'requests': len(latencies),
+            'errors': errors[0],
+            'requests_per_second': len(latencies) / elapsed if elapsed else 0,
+            'p50_ms': ms(percentile(latencies, 50)),
+            'p95_ms': ms(percentile(latencies, 95)),
+            'p99_ms': ms(percentile(latencies, 99)),
+        }
@@ -0,0 +1,222 @@
+import json
+import random
+import string
+import subprocess
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.test import Client, RequestFactory
+from django.test.utils import setup_test_environment
+from django.urls import reverse
+from django.utils import timezone
+
+from game import views
+from game.models import CustomUser, GameWord
+
+USER_PREFIX = 'benchflow'
+PASSWORD = 'bench$pass1'
+
+
+def percentile(values, pct):
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(int(round(pct / 100 * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class Recorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.queries = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    def add(self, endpoint, seconds, queries, ok):
+        with self._lock:
+            self.latencies[endpoint].append(seconds)
+            self.queries[endpoint].append(queries)
+            if not ok:
+                self.errors[endpoint] += 1
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed users and words, then drive login -> start-game -> submit-guess x5 -> session -> admin dashboard '
+        'through the Django test client and report latency, throughput and SQL per endpoint. '
+        'Run it against a disposable database.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=50)
+        parser.add_argument('--words', type=int, default=500)
+        parser.add_argument('--concurrency', type=int, default=1)
+        parser.add_argument('--games', type=int, default=1, help='Games per user (at most the daily limit).')
+        parser.add_argument('--output', help='Write the results as JSON to this file.')
+        parser.add_argument('--keep', action='store_true', help='Keep the seeded users and words.')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        rng = random.Random(options['seed'])
+        users, admin, new_word_ids = self.seed(rng, options['users'], options['words'])
+        words = list(GameWord.objects.values_list('word', flat=True)[:1000])
+        recorder = Recorder()
+
+        try:
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=options['concurrency']) as pool:
+                futures = [
+                    pool.submit(self.play, recorder, username, admin, words, options['games'], rng.random())
+                    for username in users
+                ]
+                for future in futures:
+                    future.result()
+            elapsed = time.perf_counter() - started
+        finally:
+            if not options['keep']:
+                CustomUser.objects.filter(username__startswith=USER_PREFIX).delete()
+                GameWord.objects.filter(pk__in=new_word_ids).delete()
+
+        results = self.summarize(recorder, elapsed, options)
+        self.report(results)
+        if options['output']:
+            with open(options['output'], 'w') as handle:
+                json.dump(results, handle, indent=2)
+            self.stdout.write(f"Results written to {options['output']}")
+
+    def seed(self, rng, user_count, word_count):
+        existing = set(GameWord.objects.values_list('word', flat=True))
+        new_words = set()
+        while len(existing) + len(new_words) < word_count:
+            word = ''.join(rng.choice(string.ascii_uppercase) for _ in range(5))
+            if word not in existing:
+                new_words.add(word)
+        GameWord.objects.bulk_create([GameWord(word=word) for word in new_words], ignore_conflicts=True)
+        new_word_ids = list(GameWord.objects.filter(word__in=new_words).values_list('pk', flat=True))
+        if not GameWord.objects.exists():
+            raise CommandError('No words available to play with.')
+
+        CustomUser.objects.filter(username__startswith=USER_PREFIX).delete()
+        password = make_password(PASSWORD)
+        usernames = [f'{USER_PREFIX}{i}' for i in range(user_count)]
+        CustomUser.objects.bulk_create(
+            [CustomUser(username=username, password=password, role='player') for username in usernames]
+        )
+        admin = CustomUser.objects.create(
+            username=f'{USER_PREFIX}admin', password=password, role='admin', is_staff=True, is_superuser=True
+        )
+        return usernames, admin, new_word_ids
+
+    def play(self, recorder, username, admin, words, games, salt):
+        rng = random.Random(salt)
+        counter = QueryCounter()
+        try:
+            with connection.execute_wrapper(counter):
+                client = Client()
+
+                def timed(endpoint, func, *args, **kwargs):
+                    counter.count = 0
+                    start = time.perf_counter()
+                    response = func(*args, **kwargs)
+                    recorder.add(endpoint, time.perf_counter() - start, counter.count, response.status_code < 400)
+                    return response
+
+                def call(endpoint, method, path, **kwargs):
+                    return timed(endpoint, getattr(client, method), path, **kwargs)
+
+                call('login', 'post', reverse('login'), data={'username': username, 'password': PASSWORD})
+                for _ in range(games):
+                    response = call('start-game', 'post', reverse('start_new_game'))
+                    if response.status_code != 200:
+                        break
+                    session_id = response.json()['session_id']
+                    for _ in range(5):
+                        response = call(
+                            'submit-guess', 'post', reverse('submit_guess'),
+                            data=json.dumps({'session_id': session_id, 'guess': rng.choice(words)}),
+                            content_type='application/json',
+                        )
+                        if response.status_code != 200 or response.json().get('is_completed'):
+                            break
+                    call('session', 'get', reverse('get_session_data', args=[session_id]))
+                    call('daily-stats', 'get', reverse('get_daily_stats'))
+
+                # The Django admin index shadows the dashboard's /admin/ URL, so
+                # the dashboard view is called directly, without the middleware.
+                request = RequestFactory().get(reverse('admin_dashboard'))
+                request.user = admin
+                timed('dashboard', views.admin_dashboard, request)
+        finally:
+            connections.close_all()
+
+    def summarize(self, recorder, elapsed, options):
+        endpoints = {}
+        total_requests = 0
+        for endpoint, latencies in recorder.latencies.items():
+            queries = recorder.queries[endpoint]
+            total_requests += len(latencies)
+            endpoints[endpoint] = {
+                'requests': len(latencies),
+                'errors': recorder.errors[endpoint],
+                'p50_ms': percentile(latencies, 50) * 1000,
+                'p95_ms': percentile(latencies, 95) * 1000,
+                'p99_ms': percentile(latencies, 99) * 1000,
+                'mean_ms': sum(latencies) / len(latencies) * 1000,
+                'queries_mean': sum(queries) / len(queries),
+                'queries_max': max(queries),
+            }
+        return {
+            'meta': {
+                'timestamp': timezone.now().isoformat(),
+                'commit': self.git_commit(),
+                'database': connection.vendor,
+                'users': options['users'],
+                'words': options['words'],
+                'concurrency': options['concurrency'],
+                'games': options['games'],
+            },
+            'total': {
+                'requests': total_requests,
+                'elapsed_s': elapsed,
+                'requests_per_second': total_requests / elapsed if elapsed else None,
+            },
+            'endpoints': endpoints,
+        }
+
+    def report(self, results):
+        header = f"{'endpoint':<14}{'reqs':>7}{'errs':>6}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'sql/req':>9}"
+        self.stdout.write(header)
+        for endpoint, stats in results['endpoints'].items():
+            self.stdout.write(
+                f"{endpoint:<14}{stats['requests']:>7}{stats['errors']:>6}{stats['p50_ms']:>9.2f}"
+                f"{stats['p95_ms']:>9.2f}{stats['p99_ms']:>9.2f}{stats['queries_mean']:>9.1f}"
+            )
+        total = results['total']
+        self.stdout.write(
+            f"{total['requests']} requests in {total['elapsed_s']:.2f}s ({total['requests_per_second']:.1f} req/s)"
+        )
+
+    def git_commit(self):
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'], cwd=settings.BASE_DIR,
+                capture_output=True, text=True, check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
@@ -0,0 +1,61 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from game.models import CustomUser, GameSession, GameWord
+from game.services import MAX_GUESSES, record_guess
+
+BENCH_USERNAME = 'benchguesswriter'
+
+
+class Command(BaseCommand):
+    help = 'Measure the write cost of the guess pipeline (WAL bytes per guess on PostgreSQL).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--games', type=int, default=200)
+
+    def handle(self, *args, **options):
+        words = list(GameWord.objects.values_list('id', 'word')[:MAX_GUESSES + 1])
+        if len(words) <= MAX_GUESSES:
+            raise CommandError(f'Need at least {MAX_GUESSES + 1} words to run the benchmark.')
+        target_id = words[0][0]
+        wrong_guesses = [word for _, word in words[1:]]
+
+        user, _ = CustomUser.objects.get_or_create(username=BENCH_USERNAME, defaults={'role': 'player'})
+        try:
+            sessions = GameSession.objects.bulk_create(
+                [GameSession(user=user, word_id=target_id) for _ in range(options['games'])]
+            )
+            if sessions[0].pk is None:
+                sessions = list(GameSession.objects.filter(user=user).order_by('pk'))
+
+            wal_before = self.wal_position()
+            start = time.perf_counter()
+            for session in sessions:
+                for guess in wrong_guesses:
+                    record_guess(user, session.pk, guess)
+            elapsed = time.perf_counter() - start
+            wal_after = self.wal_position()
+        finally:
+            user.delete()
+
+        guesses = len(sessions) * MAX_GUESSES
+        self.stdout.write(f'{guesses} guesses in {elapsed:.2f}s ({elapsed / guesses * 1000:.2f} ms/guess)')
+        if wal_before is not None:
+            wal_bytes = self.wal_diff(wal_after, wal_before)
+            self.stdout.write(f'WAL written: {wal_bytes} bytes ({wal_bytes / guesses:.0f} bytes/guess)')
+        else:
+            self.stdout.write('WAL accounting is only available on PostgreSQL.')
+
+    def wal_position(self):
+        if connection.vendor != 'postgresql':
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_current_wal_lsn()')
+            return cursor.fetchone()[0]
+
+    def wal_diff(self, after, before):
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_wal_lsn_diff(%s, %s)', [after, before])
+            return int(cursor.fetchone()[0])
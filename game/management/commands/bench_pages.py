@@ -0,0 +1,92 @@
+import gzip
+import json
+import re
+import time
+from statistics import median
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from django.test.utils import setup_test_environment
+
+from game import views
+from game.models import CustomUser
+
+ASSET_PATTERN = re.compile(r'(?:href|src)="([^"]+\.(?:css|js))(?:\?[^"]*)?"')
+
+
+class Command(BaseCommand):
+    help = (
+        'Render the game board and the admin dashboard and report render time, HTML weight '
+        '(raw and gzipped) and the weight of the local CSS/JS they reference.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--player', help='Username to render the game board for (defaults to the first player).')
+        parser.add_argument('--admin', help='Username to render the dashboard for (defaults to the first admin).')
+        parser.add_argument('--renders', type=int, default=50, help='Renders per page.')
+        parser.add_argument('--output', help='Write the results as JSON to this file.')
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        player = self.get_user(options['player'], role='player')
+        admin = self.get_user(options['admin'], role='admin')
+        pages = {
+            'game_board': (views.game_board, player),
+            'admin_dashboard': (views.admin_dashboard, admin),
+        }
+
+        factory = RequestFactory()
+        results = {}
+        self.stdout.write(f"{'page':<16}{'render ms':>10}{'html':>9}{'html gz':>9}{'assets':>9}{'assets gz':>10}")
+        for name, (view, user) in pages.items():
+            timings = []
+            for _ in range(options['renders']):
+                request = factory.get('/')
+                request.user = user
+                start = time.perf_counter()
+                response = view(request)
+                timings.append(time.perf_counter() - start)
+            if response.status_code != 200:
+                raise CommandError(f'{name} returned HTTP {response.status_code}.')
+            html = response.content
+            assets = self.local_assets(html.decode('utf-8'))
+            result = {
+                'render_ms': median(timings) * 1000,
+                'html_bytes': len(html),
+                'html_gzip_bytes': len(gzip.compress(html)),
+                'assets': assets,
+                'asset_bytes': sum(asset['bytes'] for asset in assets),
+                'asset_gzip_bytes': sum(asset['gzip_bytes'] for asset in assets),
+            }
+            results[name] = result
+            self.stdout.write(
+                f"{name:<16}{result['render_ms']:>10.2f}{result['html_bytes']:>9}{result['html_gzip_bytes']:>9}"
+                f"{result['asset_bytes']:>9}{result['asset_gzip_bytes']:>10}"
+            )
+        self.stdout.write('Local assets are fetched once and then cached; repeat views only transfer the HTML.')
+
+        if options['output']:
+            with open(options['output'], 'w') as handle:
+                json.dump(results, handle, indent=2)
+
+    def get_user(self, username, role):
+        users = CustomUser.objects.filter(role=role)
+        user = users.filter(username=username).first() if username else users.order_by('pk').first()
+        if user is None:
+            raise CommandError(f'No {role} user found; create one or pass --{role}.')
+        return user
+
+    def local_assets(self, html):
+        assets = []
+        for url in ASSET_PATTERN.findall(html):
+            if not url.startswith(settings.STATIC_URL):
+                continue
+            path = finders.find(url[len(settings.STATIC_URL):])
+            if path is None:
+                continue
+            with open(path, 'rb') as handle:
+                data = handle.read()
+            assets.append({'url': url, 'bytes': len(data), 'gzip_bytes': len(gzip.compress(data))})
+        return assets
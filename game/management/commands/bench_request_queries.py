@@ -0,0 +1,107 @@
+import json
+from statistics import median
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext, setup_test_environment
+from django.urls import reverse
+
+from game.models import CustomUser, GameSession
+from game.services import MAX_GUESSES
+from game.word_index import word_index
+
+USERNAME = 'benchqueries'
+PASSWORD = 'bench$pass1'
+
+MODES = {
+    'before': {
+        'SESSION_ENGINE': 'django.contrib.sessions.backends.db',
+        'AUTHENTICATION_BACKENDS': ['django.contrib.auth.backends.ModelBackend'],
+    },
+    'after': {
+        'SHARED_CACHE': True,
+        'SESSION_ENGINE': 'game.session_backend',
+        'AUTHENTICATION_BACKENDS': [
+            'game.auth_backends.CachedModelBackend',
+            'django.contrib.auth.backends.ModelBackend',
+        ],
+    },
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Count SQL queries per request on the JSON API with database sessions and uncached users '
+        '("before") and with the configured session engine and auth backends ("after").'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=20, help='Requests per endpoint and mode.')
+        parser.add_argument('--output', help='Write the results as JSON to this file.')
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        words = [word for _, word in word_index.entries()]
+        if len(words) <= MAX_GUESSES:
+            raise CommandError(f'Need at least {MAX_GUESSES + 1} words; run seed_words first.')
+
+        results = {}
+        try:
+            for mode, overrides in MODES.items():
+                with override_settings(**overrides):
+                    results[mode] = self.run_mode(words, options['requests'])
+        finally:
+            CustomUser.objects.filter(username=USERNAME).delete()
+
+        endpoints = list(results['before'])
+        self.stdout.write(f"{'endpoint':<16}{'before cold':>12}{'before warm':>12}{'after cold':>12}{'after warm':>12}")
+        for endpoint in endpoints:
+            before, after = results['before'][endpoint], results['after'][endpoint]
+            self.stdout.write(
+                f"{endpoint:<16}{before['cold']:>12}{before['warm']:>12.1f}{after['cold']:>12}{after['warm']:>12.1f}"
+            )
+
+        if options['output']:
+            with open(options['output'], 'w') as handle:
+                json.dump(results, handle, indent=2)
+
+    def run_mode(self, words, repeats):
+        cache.clear()
+        CustomUser.objects.filter(username=USERNAME).delete()
+        CustomUser.objects.create_user(USERNAME, password=PASSWORD)
+        client = Client()
+        if not client.login(username=USERNAME, password=PASSWORD):
+            raise CommandError('Could not log the benchmark user in.')
+
+        response = client.post(reverse('start_new_game'))
+        if response.status_code != 200:
+            raise CommandError(f'Could not start a game: {response.content[:200]!r}')
+        session_id = response.json()['session_id']
+        target = GameSession.objects.get(pk=session_id).word.word
+        wrong = [word for word in words if word != target][:MAX_GUESSES - 1]
+
+        def measure(method, url, bodies):
+            counts = []
+            for body in bodies:
+                with CaptureQueriesContext(connection) as queries:
+                    if method == 'post':
+                        client.post(url, json.dumps(body), content_type='application/json')
+                    else:
+                        client.get(url)
+                counts.append(len(queries))
+            return {'cold': counts[0], 'warm': median(counts[1:]) if len(counts) > 1 else counts[0]}
+
+        # Drop everything cached during the setup so the first request of each endpoint is cold.
+        cache.clear()
+        endpoints = {
+            'daily-stats': measure('get', reverse('get_daily_stats'), [None] * repeats),
+            'session': measure('get', reverse('get_session_data', args=[session_id]), [None] * repeats),
+            'hint': measure('get', reverse('session_hint', args=[session_id]), [None] * repeats),
+            'leaderboard': measure('get', reverse('leaderboard'), [None] * repeats),
+            'submit-guess': measure('post', reverse('submit_guess'), [
+                {'session_id': session_id, 'guess': guess} for guess in wrong
+            ]),
+        }
+        return endpoints
@@ -0,0 +1,61 @@
+import random
+import string
+import time
+
+from django.core.management.base import BaseCommand
+
+from game.scoring import score, score_guesses, score_many, to_feedback
+from game.utils import generate_letter_feedback
+
+
+class Command(BaseCommand):
+    help = 'Time the scoring engine against generate_letter_feedback (correctness is covered by game.tests).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--pairs', type=int, default=50000)
+        parser.add_argument('--repeat', type=int, default=3)
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        pairs = self.random_pairs(rng, options['pairs'])
+
+        baseline = self.best_of(options['repeat'], lambda: [generate_letter_feedback(g, t) for g, t in pairs])
+        engine = self.best_of(options['repeat'], lambda: [score(g, t) for g, t in pairs])
+        engine_edge = self.best_of(options['repeat'], lambda: [to_feedback(g, score(g, t)) for g, t in pairs])
+
+        targets = [target for _, target in pairs]
+        guesses = [guess for guess, _ in pairs]
+        batch_targets = self.best_of(options['repeat'], lambda: score_many(guesses[0], targets))
+        batch_guesses = self.best_of(options['repeat'], lambda: score_guesses(guesses, targets[0]))
+
+        rows = [
+            ('generate_letter_feedback', baseline),
+            ('score (code only)', engine),
+            ('score + to_feedback', engine_edge),
+            ('score_many (1 guess x N targets)', batch_targets),
+            ('score_guesses (N guesses x 1 target)', batch_guesses),
+        ]
+        for name, seconds in rows:
+            per_call = seconds / len(pairs) * 1e9
+            self.stdout.write(f'{name:<40} {per_call:8.0f} ns/pair  {baseline / seconds:6.1f}x')
+
+    def random_pairs(self, rng, count):
+        pairs = []
+        for _ in range(count):
+            # Alternate between a full and a tiny alphabet so repeated letters
+            # (the interesting case for yellows) are well represented.
+            alphabet = string.ascii_uppercase if rng.random() < 0.5 else 'AEIST'
+            guess = ''.join(rng.choice(alphabet) for _ in range(5))
+            target = ''.join(rng.choice(alphabet) for _ in range(5))
+            pairs.append((guess, target))
+        return pairs
+
+    def best_of(self, repeat, func):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best
@@ -0,0 +1,45 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from game.feedback_matrix import FeedbackMatrix, build
+from game.models import GameWord
+
+
+class Command(BaseCommand):
+    help = 'Precompute the guess x answer feedback matrix for every GameWord.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', default=None, help='Output file (defaults to FEEDBACK_MATRIX_PATH).')
+        parser.add_argument('--full', action='store_true', help='Rescore every pair instead of reusing the existing file.')
+
+    def handle(self, *args, **options):
+        path = options['path'] or settings.FEEDBACK_MATRIX_PATH
+        words = list(GameWord.objects.values_list('word', flat=True).iterator())
+        if not words:
+            raise CommandError('There are no words to build a matrix from.')
+
+        previous = None
+        if not options['full']:
+            try:
+                previous = FeedbackMatrix(path)
+            except (OSError, ValueError):
+                previous = None
+
+        if previous is not None and set(previous.words) == set(words):
+            self.stdout.write(f'{path} is already up to date ({previous.size} words).')
+            return
+
+        start = time.perf_counter()
+        try:
+            scored = build(words, path, previous=previous)
+        finally:
+            if previous is not None:
+                previous.close()
+        elapsed = time.perf_counter() - start
+
+        size = len(set(words))
+        self.stdout.write(self.style.SUCCESS(
+            f'Wrote {size}x{size} matrix to {path}: scored {scored} of {size * size} pairs in {elapsed:.2f}s.'
+        ))
@@ -0,0 +1,49 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from game.export import CHUNK_SIZE, FORMATS, KINDS, export_stream
+from game.management.commands.rebuild_daily_stats import parse_date
+
+
+class Command(BaseCommand):
+    help = 'Stream game sessions or guesses as CSV or JSON lines, optionally gzipped.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--kind', choices=sorted(KINDS), default='sessions')
+        parser.add_argument('--format', choices=FORMATS, default='csv')
+        parser.add_argument('--start', type=parse_date, help='First day to include (YYYY-MM-DD).')
+        parser.add_argument('--end', type=parse_date, help='Last day to include (YYYY-MM-DD).')
+        parser.add_argument('--user', help='Only export this username.')
+        parser.add_argument('--gzip', action='store_true', help='Compress the output with gzip.')
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='Rows fetched per database round trip.')
+        parser.add_argument('--output', '-o', help='Write to this file instead of stdout.')
+
+    def handle(self, *args, **options):
+        if options['start'] and options['end'] and options['start'] > options['end']:
+            raise CommandError('--start must not be after --end.')
+
+        chunks = export_stream(
+            options['kind'],
+            options['format'],
+            compress=options['gzip'],
+            start=options['start'],
+            end=options['end'],
+            user=options['user'],
+            chunk_size=options['chunk_size'],
+        )
+
+        began = time.perf_counter()
+        written = 0
+        if options['output']:
+            with open(options['output'], 'wb') as handle:
+                for chunk in chunks:
+                    handle.write(chunk)
+                    written += len(chunk)
+            elapsed = time.perf_counter() - began
+            self.stderr.write(f'Wrote {written} bytes to {options["output"]} in {elapsed:.2f}s.')
+        else:
+            for chunk in chunks:
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
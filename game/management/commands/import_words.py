@@ -0,0 +1,91 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from game.models import GameWord
+from game.utils import validate_word
+from game.word_index import bump_shared_version
+
+
+def read_words(handle):
+    """Yield normalized words from ``handle``; blank lines and ``#`` comments are skipped."""
+    for line in handle:
+        word = line.split('#', 1)[0].strip().upper()
+        if word:
+            yield word
+
+
+class Command(BaseCommand):
+    help = 'Stream words from a file (or stdin) into the GameWord answer pool.'
+
+    default_path = None
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', nargs='?', default=self.default_path,
+                            help="One word per line; '-' or no path reads stdin.")
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows per INSERT statement.')
+        parser.add_argument('--transaction-size', type=int, default=20000, help='Rows per transaction.')
+        parser.add_argument('--progress-every', type=int, default=50000, help='Lines between progress reports.')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1 or options['transaction_size'] < 1:
+            raise CommandError('--batch-size and --transaction-size must be positive.')
+
+        path = options['path']
+        if path in (None, '-'):
+            return self.load(sys.stdin, options)
+        try:
+            handle = open(path, encoding='utf-8', errors='replace')
+        except OSError as e:
+            raise CommandError(f'Could not open {path}: {e}')
+        with handle:
+            return self.load(handle, options)
+
+    def load(self, handle, options):
+        batch_size = options['batch_size']
+        transaction_size = options['transaction_size']
+        progress_every = options['progress_every']
+
+        before = GameWord.objects.count()
+        seen = set()
+        pending = []
+        lines = invalid = duplicates = 0
+        start = time.perf_counter()
+
+        for word in read_words(handle):
+            lines += 1
+            if not validate_word(word):
+                invalid += 1
+            elif word in seen:
+                duplicates += 1
+            else:
+                seen.add(word)
+                pending.append(GameWord(word=word))
+                if len(pending) >= transaction_size:
+                    self.flush(pending, batch_size)
+                    pending = []
+            if progress_every and lines % progress_every == 0:
+                elapsed = time.perf_counter() - start
+                self.stdout.write(f'{lines} lines read, {len(seen)} unique words ({lines / elapsed:.0f} lines/s)')
+        self.flush(pending, batch_size)
+
+        elapsed = time.perf_counter() - start
+        added = GameWord.objects.count() - before
+        if added:
+            # bulk_create skips the model signals, so tell every worker's word index directly.
+            bump_shared_version()
+        self.stdout.write(self.style.SUCCESS(
+            f'Read {lines} lines in {elapsed:.2f}s ({lines / elapsed if elapsed else 0:.0f} lines/s): '
+            f'{added} words added, {len(seen) - added} already present, '
+            f'{duplicates} duplicates and {invalid} invalid lines skipped.'
+        ))
+        if added:
+            self.stdout.write('Run build_feedback_matrix to include the new words in the feedback matrix.')
+
+    def flush(self, words, batch_size):
+        if not words:
+            return
+        with transaction.atomic():
+            GameWord.objects.bulk_create(words, batch_size=batch_size, ignore_conflicts=True)
@@ -0,0 +1,122 @@
+import gzip
+import time
+from collections import Counter
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from game import events, quota, session_cache
+from game.export import jsonl_lines, rows_for
+from game.models import GameGuess, GameSession, PlayerStats
+
+
+class Command(BaseCommand):
+    help = (
+        'Close in-progress games older than a TTL as lost, and optionally archive and prune '
+        'old guess rows. Runs once, or forever with --loop.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--ttl-hours', type=float, default=24.0,
+                            help='In-progress games older than this are closed as lost.')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--prune-guesses-days', type=int,
+                            help='Also delete guesses of finished games older than this many days.')
+        parser.add_argument('--archive', help='Append pruned guesses to this gzipped JSON lines file first.')
+        parser.add_argument('--dry-run', action='store_true', help='Only count what would be changed.')
+        parser.add_argument('--loop', action='store_true', help='Keep running, sleeping --interval between passes.')
+        parser.add_argument('--interval', type=float, default=300.0, help='Seconds between passes with --loop.')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be positive.')
+        if options['archive'] and options['prune_guesses_days'] is None:
+            raise CommandError('--archive only applies together with --prune-guesses-days.')
+
+        while True:
+            self.run_pass(options)
+            if not options['loop']:
+                return
+            close_old_connections()
+            try:
+                time.sleep(options['interval'])
+            except KeyboardInterrupt:
+                return
+
+    def run_pass(self, options):
+        now = timezone.now()
+        cutoff = now - timedelta(hours=options['ttl_hours'])
+        stale = GameSession.get_stale_sessions(cutoff)
+        if options['dry_run']:
+            self.stdout.write(f'{stale.count()} sessions started before {cutoff:%Y-%m-%d %H:%M} would be closed.')
+        else:
+            self.report('Closed', 'sessions', *self.reap(stale, now, options['batch_size']))
+
+        if options['prune_guesses_days'] is not None:
+            guesses = GameGuess.objects.filter(
+                session__is_completed=True,
+                created_at__lt=now - timedelta(days=options['prune_guesses_days']),
+            )
+            if options['dry_run']:
+                self.stdout.write(f'{guesses.count()} guesses would be pruned.')
+            else:
+                self.report('Pruned', 'guesses', *self.prune(guesses, options['batch_size'], options['archive']))
+
+    def reap(self, stale, now, batch_size):
+        """Close ``stale`` sessions in primary key order, one UPDATE per batch."""
+        started = time.perf_counter()
+        total = 0
+        last_pk = 0
+        while True:
+            batch = list(
+                stale.filter(pk__gt=last_pk).order_by('pk').values_list('pk', 'user_id', 'created_at')[:batch_size]
+            )
+            if not batch:
+                break
+            last_pk = batch[-1][0]
+            with transaction.atomic():
+                # Re-read under lock: a player may have finished the game since the first SELECT.
+                rows = list(
+                    GameSession.objects.select_for_update()
+                    .filter(pk__in=[row[0] for row in batch], is_completed=False)
+                    .values_list('pk', 'user_id', 'created_at')
+                )
+                if not rows:
+                    continue
+                total += GameSession.objects.filter(pk__in=[row[0] for row in rows]).update(
+                    is_completed=True,
+                    is_won=False,
+                    completed_at=now,
+                )
+                PlayerStats.record_games_abandoned(Counter(user_id for _, user_id, _ in rows), now)
+                session_cache.invalidate_many(user_id for _, user_id, _ in rows)
+                quota.invalidate((user_id, timezone.localdate(created_at)) for _, user_id, created_at in rows)
+                for pk, _, _ in rows:
+                    events.publish_on_commit(events.session_channel(pk), 'end', {})
+        return total, time.perf_counter() - started
+
+    def prune(self, guesses, batch_size, archive_path):
+        started = time.perf_counter()
+        total = 0
+        archive = gzip.open(archive_path, 'at', encoding='utf-8') if archive_path else None
+        try:
+            while True:
+                pks = list(guesses.order_by('pk').values_list('pk', flat=True)[:batch_size])
+                if not pks:
+                    break
+                with transaction.atomic():
+                    if archive is not None:
+                        headers, rows = rows_for('guesses', GameGuess.objects.filter(pk__in=pks))
+                        archive.writelines(jsonl_lines(headers, rows))
+                        archive.flush()
+                    total += GameGuess.objects.filter(pk__in=pks).delete()[0]
+        finally:
+            if archive is not None:
+                archive.close()
+        return total, time.perf_counter() - started
+
+    def report(self, verb, noun, count, elapsed):
+        rate = count / elapsed if elapsed else 0
+        self.stdout.write(f'{verb} {count} {noun} in {elapsed:.2f}s ({rate:.0f} rows/s).')
@@ -0,0 +1,54 @@
+import time
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Min
+from django.utils import timezone
+
+from game.models import DailyStats, GameSession
+
+
+def parse_date(value):
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        raise CommandError(f'Invalid date {value!r}, expected YYYY-MM-DD.')
+
+
+class Command(BaseCommand):
+    help = 'Backfill or rebuild the DailyStats/DailyUserStats rollups for a date range.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start', type=parse_date, help='First date to rebuild (defaults to the first game ever played).')
+        parser.add_argument('--end', type=parse_date, help='Last date to rebuild (defaults to today).')
+        parser.add_argument('--chunk-days', type=int, default=31)
+
+    def handle(self, *args, **options):
+        if options['chunk_days'] < 1:
+            raise CommandError('--chunk-days must be positive.')
+        end = options['end'] or timezone.localdate()
+        start = options['start']
+        if start is None:
+            first = GameSession.objects.aggregate(first=Min('created_at'))['first']
+            if first is None:
+                self.stdout.write('No game sessions to roll up.')
+                return
+            start = timezone.localdate(first)
+        if start > end:
+            raise CommandError('--start must not be after --end.')
+
+        began = time.perf_counter()
+        total_days = total_rows = 0
+        chunk_start = start
+        while chunk_start <= end:
+            chunk_end = min(chunk_start + timedelta(days=options['chunk_days'] - 1), end)
+            days, rows = DailyStats.rebuild_range(chunk_start, chunk_end)
+            total_days += days
+            total_rows += rows
+            self.stdout.write(f'{chunk_start} .. {chunk_end}: {days} days, {rows} user rows')
+            chunk_start = chunk_end + timedelta(days=1)
+
+        elapsed = time.perf_counter() - began
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt {start} .. {end}: {total_days} days with games, {total_rows} user rows in {elapsed:.2f}s.'
+        ))
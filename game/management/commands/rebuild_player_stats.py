@@ -0,0 +1,20 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from game.models import PlayerStats
+
+
+class Command(BaseCommand):
+    help = 'Rebuild every PlayerStats row (totals, streaks, guess distribution) from GameSession history.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be positive.')
+        start = time.perf_counter()
+        rows = PlayerStats.rebuild(batch_size=options['batch_size'])
+        elapsed = time.perf_counter() - start
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt stats for {rows} players in {elapsed:.2f}s.'))
@@ -0,0 +1,11 @@
+from pathlib import Path
+
+from game.management.commands.import_words import Command as ImportWordsCommand
+
+ANSWERS_PATH = Path(__file__).resolve().parents[2] / 'data' / 'answers.txt'
+
+
+class Command(ImportWordsCommand):
+    help = 'Load the bundled answer list (or the given file) into the GameWord answer pool.'
+
+    default_path = str(ANSWERS_PATH)
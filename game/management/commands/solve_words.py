@@ -0,0 +1,70 @@
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+
+from game.services import MAX_GUESSES
+from game.solver import OPENING_EVALUATED_GUESSES, CandidateIndex, best_guess, solve
+from game.word_index import word_index
+
+_worker_index = None
+_worker_opening = None
+
+
+def _init_worker(words, opening):
+    global _worker_index, _worker_opening
+    import django
+
+    django.setup()
+    _worker_index = CandidateIndex(words)
+    _worker_opening = opening
+
+
+def _solve_chunk(targets):
+    return [len(solve(_worker_index, target, _worker_opening)) for target in targets]
+
+
+class Command(BaseCommand):
+    help = 'Play every answer with the hint engine and report the average number of guesses it needs.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--opening', help='First guess to use (defaults to the best one by expected information).')
+        parser.add_argument('--limit', type=int, help='Only solve the first N answers.')
+        parser.add_argument('--workers', type=int, default=0,
+                            help='Worker processes (0 solves in this process).')
+        parser.add_argument('--chunk-size', type=int, default=50, help='Answers per task sent to a worker.')
+
+    def handle(self, *args, **options):
+        words = sorted(word for _, word in word_index.entries())
+        if not words:
+            raise CommandError('There are no words to solve.')
+        index = CandidateIndex(words)
+
+        started = time.perf_counter()
+        opening = (options['opening'] or '').upper() or None
+        if opening is None:
+            opening, bits = best_guess(index.words, OPENING_EVALUATED_GUESSES, None)
+            self.stdout.write(f'Opening {opening} ({bits:.2f} bits, {time.perf_counter() - started:.2f}s)')
+
+        targets = words[:options['limit']] if options['limit'] else words
+        chunks = [targets[i:i + options['chunk_size']] for i in range(0, len(targets), options['chunk_size'])]
+        solving = time.perf_counter()
+        if options['workers'] > 0:
+            with ProcessPoolExecutor(
+                max_workers=options['workers'],
+                initializer=_init_worker,
+                initargs=(words, opening),
+            ) as pool:
+                depths = [depth for chunk in pool.map(_solve_chunk, chunks) for depth in chunk]
+        else:
+            depths = [len(solve(index, target, opening)) for target in targets]
+        elapsed = time.perf_counter() - solving
+
+        distribution = Counter(depths)
+        solved = sum(count for depth, count in distribution.items() if depth <= MAX_GUESSES)
+        self.stdout.write(f'Solved {len(depths)} words in {elapsed:.2f}s ({len(depths) / elapsed:.0f} words/s)')
+        self.stdout.write(f'Average guesses: {sum(depths) / len(depths):.3f}, worst: {max(depths)}')
+        self.stdout.write(f'Within {MAX_GUESSES} guesses: {solved}/{len(depths)} ({solved * 100 / len(depths):.1f}%)')
+        for depth in sorted(distribution):
+            self.stdout.write(f'  {depth}: {distribution[depth]}')
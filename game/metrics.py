@@ -0,0 +1,210 @@
+import contextvars
+import os
+import threading
+import time
+from collections import Counter
+
+# Upper bounds of the latency histogram buckets, in milliseconds.
+LATENCY_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, float('inf'))
+WINDOW_SLOT_SECONDS = 60
+WINDOW_SLOTS = 15
+MAX_FINGERPRINTS = 20
+
+# The tracker of the request being measured. Context variables follow the
+# request onto the threads that sync_to_async runs its ORM work on, so the
+# queries are counted whichever thread (and connection) executes them.
+current_tracker = contextvars.ContextVar('current_tracker', default=None)
+
+
+class QueryTracker:
+    """``connection.execute_wrapper`` hook that counts and times queries."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.statements = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.count += 1
+            self.statements[sql] += 1
+
+    def duplicates(self):
+        return {sql: count for sql, count in self.statements.items() if count > 1}
+
+
+def track_queries(execute, sql, params, many, context):
+    """Execute wrapper on every connection; feeds the current request's tracker."""
+    tracker = current_tracker.get()
+    if tracker is None:
+        return execute(sql, params, many, context)
+    return tracker(execute, sql, params, many, context)
+
+
+def install_query_hook(connection):
+    # Put first: connection.execute_wrapper() pops the last wrapper on exit.
+    if track_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, track_queries)
+
+
+class EndpointStats:
+    __slots__ = ('requests', 'latency_buckets', 'latency_sum', 'latency_max',
+                 'sql_queries', 'sql_seconds', 'duplicate_queries', 'fingerprints')
+
+    def __init__(self):
+        self.requests = 0
+        self.latency_buckets = [0] * len(LATENCY_BUCKETS_MS)
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.sql_queries = 0
+        self.sql_seconds = 0.0
+        self.duplicate_queries = 0
+        self.fingerprints = Counter()
+
+    def add(self, seconds, queries, sql_seconds, duplicates):
+        self.requests += 1
+        milliseconds = seconds * 1000
+        for index, bound in enumerate(LATENCY_BUCKETS_MS):
+            if milliseconds <= bound:
+                self.latency_buckets[index] += 1
+                break
+        self.latency_sum += seconds
+        self.latency_max = max(self.latency_max, seconds)
+        self.sql_queries += queries
+        self.sql_seconds += sql_seconds
+        for sql, count in duplicates.items():
+            self.duplicate_queries += count - 1
+            self.fingerprints[sql] += count - 1
+        if len(self.fingerprints) > MAX_FINGERPRINTS * 2:
+            self.fingerprints = Counter(dict(self.fingerprints.most_common(MAX_FINGERPRINTS)))
+
+    def merge(self, other):
+        self.requests += other.requests
+        self.latency_buckets = [a + b for a, b in zip(self.latency_buckets, other.latency_buckets)]
+        self.latency_sum += other.latency_sum
+        self.latency_max = max(self.latency_max, other.latency_max)
+        self.sql_queries += other.sql_queries
+        self.sql_seconds += other.sql_seconds
+        self.duplicate_queries += other.duplicate_queries
+        self.fingerprints.update(other.fingerprints)
+
+    def percentile_ms(self, pct):
+        if not self.requests:
+            return None
+        threshold = self.requests * pct / 100
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self.latency_buckets):
+            seen += count
+            if seen >= threshold:
+                return self.latency_max * 1000 if bound == float('inf') else bound
+        return self.latency_max * 1000
+
+    def as_dict(self):
+        requests = self.requests or 1
+        return {
+            'requests': self.requests,
+            'latency_mean_ms': self.latency_sum / requests * 1000,
+            'latency_p50_ms': self.percentile_ms(50),
+            'latency_p95_ms': self.percentile_ms(95),
+            'latency_p99_ms': self.percentile_ms(99),
+            'latency_max_ms': self.latency_max * 1000,
+            'sql_queries_per_request': self.sql_queries / requests,
+            'sql_ms_per_request': self.sql_seconds / requests * 1000,
+            'duplicate_queries': self.duplicate_queries,
+            'top_duplicates': [
+                {'sql': sql, 'count': count} for sql, count in self.fingerprints.most_common(5)
+            ],
+        }
+
+
+class MetricsRegistry:
+    """In-memory per-endpoint request metrics.
+
+    Keeps cumulative totals (for Prometheus counters) plus a ring of
+    one-minute slots so the JSON view can report the recent window.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.totals = {}
+        self._slots = {}
+
+    def record(self, endpoint, seconds, tracker):
+        slot = int(time.time() // WINDOW_SLOT_SECONDS)
+        duplicates = tracker.duplicates()
+        with self._lock:
+            self.totals.setdefault(endpoint, EndpointStats()).add(
+                seconds, tracker.count, tracker.seconds, duplicates
+            )
+            bucket = self._slots.get(slot)
+            if bucket is None:
+                bucket = self._slots[slot] = {}
+                for old in [key for key in self._slots if key <= slot - WINDOW_SLOTS]:
+                    del self._slots[old]
+            bucket.setdefault(endpoint, EndpointStats()).add(
+                seconds, tracker.count, tracker.seconds, duplicates
+            )
+
+    def window(self):
+        oldest = int(time.time() // WINDOW_SLOT_SECONDS) - WINDOW_SLOTS
+        merged = {}
+        with self._lock:
+            for slot, endpoints in self._slots.items():
+                if slot <= oldest:
+                    continue
+                for endpoint, stats in endpoints.items():
+                    merged.setdefault(endpoint, EndpointStats()).merge(stats)
+        return merged
+
+    def snapshot(self):
+        return {
+            'window_seconds': WINDOW_SLOT_SECONDS * WINDOW_SLOTS,
+            'endpoints': {endpoint: stats.as_dict() for endpoint, stats in sorted(self.window().items())},
+        }
+
+    def prometheus(self):
+        """Render the totals in the Prometheus text format.
+
+        Totals are per process, so every series carries a ``worker`` label
+        (the pid); each gunicorn worker is its own series and a scrape that
+        lands on another worker is not mistaken for a counter reset. Sum
+        over ``worker`` in queries, e.g. ``sum without (worker) (rate(...))``.
+        """
+        worker = os.getpid()
+        lines = [
+            '# HELP game_request_duration_seconds Request wall time per endpoint.',
+            '# TYPE game_request_duration_seconds histogram',
+        ]
+        with self._lock:
+            totals = sorted(self.totals.items())
+            for endpoint, stats in totals:
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS_MS, stats.latency_buckets):
+                    cumulative += count
+                    le = '+Inf' if bound == float('inf') else repr(bound / 1000)
+                    lines.append(f'game_request_duration_seconds_bucket{{endpoint="{endpoint}",worker="{worker}",le="{le}"}} {cumulative}')
+                lines.append(f'game_request_duration_seconds_sum{{endpoint="{endpoint}",worker="{worker}"}} {stats.latency_sum}')
+                lines.append(f'game_request_duration_seconds_count{{endpoint="{endpoint}",worker="{worker}"}} {stats.requests}')
+            counters = (
+                ('game_sql_queries_total', 'SQL queries executed per endpoint.', 'sql_queries'),
+                ('game_sql_seconds_total', 'Time spent in SQL per endpoint.', 'sql_seconds'),
+                ('game_duplicate_queries_total', 'Repeated identical SQL statements per endpoint.', 'duplicate_queries'),
+            )
+            for name, help_text, attribute in counters:
+                lines.append(f'# HELP {name} {help_text}')
+                lines.append(f'# TYPE {name} counter')
+                for endpoint, stats in totals:
+                    lines.append(f'{name}{{endpoint="{endpoint}",worker="{worker}"}} {getattr(stats, attribute)}')
+        return '\n'.join(lines) + '\n'
+
+    def reset(self):
+        with self._lock:
+            self.totals.clear()
+            self._slots.clear()
+
+
+registry = MetricsRegistry()
@@ -0,0 +1,102 @@
+import asyncio
+import random
+import time
+
+from django.conf import settings
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from .metrics import QueryTracker, current_tracker, registry
+
+
+class RequestMetricsMiddleware:
+    """Record wall time and SQL usage for a sample of requests.
+
+    ``REQUEST_METRICS_SAMPLE_RATE`` (0.0 - 1.0) controls the fraction of
+    requests that are measured; unsampled requests pay for one random draw.
+    The middleware is async-capable, so under ASGI it does not pin requests
+    to the single thread Django uses for sync-only middleware. Queries are
+    counted by ``metrics.track_queries`` on whichever thread runs them.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, 'REQUEST_METRICS_SAMPLE_RATE', 1.0)
+        self.is_async = asyncio.iscoroutinefunction(get_response)
+        if self.is_async:
+            # Lets Django await the instance directly, as MiddlewareMixin does.
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        if not self.sampled():
+            return self.get_response(request)
+
+        tracker = QueryTracker()
+        token = current_tracker.set(tracker)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            current_tracker.reset(token)
+        self.record(request, time.perf_counter() - start, tracker)
+        return response
+
+    async def __acall__(self, request):
+        if not self.sampled():
+            return await self.get_response(request)
+
+        tracker = QueryTracker()
+        token = current_tracker.set(tracker)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_tracker.reset(token)
+        self.record(request, time.perf_counter() - start, tracker)
+        return response
+
+    def sampled(self):
+        return self.sample_rate >= 1 or (self.sample_rate > 0 and random.random() < self.sample_rate)
+
+    def record(self, request, elapsed, tracker):
+        match = getattr(request, 'resolver_match', None)
+        endpoint = match.view_name if match else 'unresolved'
+        registry.record(endpoint, elapsed, tracker)
+
+
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    """WhiteNoise without the thread hop under ASGI.
+
+    ``WhiteNoiseMiddleware`` is sync-only, so Django 3.2 would run every
+    ASGI request below it on its single sync thread and requests could no
+    longer overlap. Finding a file is a dictionary lookup (a ``stat`` with
+    autorefresh in development) and ``serve`` only opens it, so both run
+    inline here; every other request is awaited straight through.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, settings=settings):
+        super().__init__(get_response, settings=settings)
+        self.is_async = asyncio.iscoroutinefunction(get_response)
+        if self.is_async:
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = self.find_file(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return self.serve(static_file, request)
+        return await self.get_response(request)
@@ -0,0 +1,47 @@
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_guess_count(apps, schema_editor):
+    GameSession = apps.get_model('game', 'GameSession')
+    GameGuess = apps.get_model('game', 'GameGuess')
+    counts = (
+        GameGuess.objects.filter(session=OuterRef('pk'))
+        .order_by()
+        .values('session')
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+    GameSession.objects.update(guess_count=Coalesce(Subquery(counts), 0))
+
+
+def restore_guesses(apps, schema_editor):
+    GameSession = apps.get_model('game', 'GameSession')
+    GameGuess = apps.get_model('game', 'GameGuess')
+    sessions = GameSession.objects.filter(guess_count__gt=0).only('pk')
+    for session in sessions.iterator(chunk_size=1000):
+        words = list(
+            GameGuess.objects.filter(session=session).order_by('created_at', 'pk').values_list('word', flat=True)
+        )
+        GameSession.objects.filter(pk=session.pk).update(guesses=words)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gamesession',
+            name='guess_count',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_guess_count, restore_guesses),
+        migrations.RemoveField(
+            model_name='gamesession',
+            name='guesses',
+        ),
+    ]
@@ -0,0 +1,82 @@
+# Generated by Django 3.2.25 on 2026-10-18 08:50
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDate
+import django.db.models.deletion
+
+
+def backfill_rollups(apps, schema_editor):
+    """Roll up every game played before this migration (see DailyStats.rebuild_range)."""
+    GameSession = apps.get_model('game', 'GameSession')
+    DailyStats = apps.get_model('game', 'DailyStats')
+    DailyUserStats = apps.get_model('game', 'DailyUserStats')
+
+    rows = GameSession.objects.annotate(
+        date=TruncDate('created_at')
+    ).values('date', 'user').annotate(
+        games_played=Count('id'),
+        games_won=Count('id', filter=Q(is_won=True)),
+    ).order_by()
+
+    user_stats = []
+    daily = {}
+    for row in rows.iterator():
+        user_stats.append(DailyUserStats(
+            date=row['date'],
+            user_id=row['user'],
+            games_played=row['games_played'],
+            games_won=row['games_won'],
+        ))
+        if len(user_stats) >= 1000:
+            DailyUserStats.objects.bulk_create(user_stats)
+            user_stats = []
+        stats = daily.setdefault(row['date'], DailyStats(date=row['date']))
+        stats.total_users += 1
+        stats.total_games += row['games_played']
+        stats.correct_guesses += row['games_won']
+    DailyUserStats.objects.bulk_create(user_stats)
+    DailyStats.objects.bulk_create(daily.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0002_session_guess_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(unique=True)),
+                ('total_users', models.PositiveIntegerField(default=0)),
+                ('total_games', models.PositiveIntegerField(default=0)),
+                ('correct_guesses', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'daily stats',
+            },
+        ),
+        migrations.CreateModel(
+            name='DailyUserStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('games_played', models.PositiveIntegerField(default=0)),
+                ('games_won', models.PositiveIntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name_plural': 'daily user stats',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='dailyuserstats',
+            constraint=models.UniqueConstraint(fields=('date', 'user'), name='unique_daily_user_stats'),
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 3.2.25 on 2026-10-18 08:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0003_daily_stats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='gamesession',
+            index=models.Index(fields=['user', 'is_completed', 'created_at'], name='session_user_done_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='gamesession',
+            index=models.Index(fields=['created_at'], name='session_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='gamesession',
+            index=models.Index(condition=models.Q(('is_completed', False)), fields=['user'], name='session_active_user_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-10-18 09:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0004_session_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='gamesession',
+            index=models.Index(condition=models.Q(('is_completed', False)), fields=['created_at'], name='session_active_created_idx'),
+        ),
+    ]
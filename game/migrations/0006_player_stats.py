@@ -0,0 +1,72 @@
+# Generated by Django 3.2.25 on 2026-10-18 09:06
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_player_stats(apps, schema_editor):
+    """Replay every finished game into PlayerStats (see PlayerStats.rebuild)."""
+    GameSession = apps.get_model('game', 'GameSession')
+    PlayerStats = apps.get_model('game', 'PlayerStats')
+
+    sessions = GameSession.objects.filter(is_completed=True).order_by(
+        'user_id', 'completed_at', 'id'
+    ).values_list('user_id', 'is_won', 'guess_count', 'completed_at')
+
+    pending = []
+    stats = None
+    for user_id, is_won, guess_count, completed_at in sessions.iterator():
+        if stats is None or stats.user_id != user_id:
+            if len(pending) >= 1000:
+                PlayerStats.objects.bulk_create(pending)
+                pending = []
+            stats = PlayerStats(user_id=user_id)
+            pending.append(stats)
+        stats.games_played += 1
+        stats.last_completed_at = completed_at
+        if is_won:
+            stats.games_won += 1
+            stats.current_streak += 1
+            stats.best_streak = max(stats.best_streak, stats.current_streak)
+            # Games from before the guess cap held under concurrency can
+            # exceed five guesses (see PlayerStats.wins_field).
+            field = f'wins_{min(max(guess_count, 1), 5)}'
+            setattr(stats, field, getattr(stats, field) + 1)
+        else:
+            stats.current_streak = 0
+    PlayerStats.objects.bulk_create(pending)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0005_session_active_created_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlayerStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='player_stats', serialize=False, to='game.customuser')),
+                ('games_played', models.PositiveIntegerField(default=0)),
+                ('games_won', models.PositiveIntegerField(default=0)),
+                ('current_streak', models.PositiveIntegerField(default=0)),
+                ('best_streak', models.PositiveIntegerField(default=0)),
+                ('wins_1', models.PositiveIntegerField(default=0)),
+                ('wins_2', models.PositiveIntegerField(default=0)),
+                ('wins_3', models.PositiveIntegerField(default=0)),
+                ('wins_4', models.PositiveIntegerField(default=0)),
+                ('wins_5', models.PositiveIntegerField(default=0)),
+                ('last_completed_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'player stats',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='playerstats',
+            index=models.Index(fields=['-games_won', '-best_streak', 'user'], name='player_stats_rank_idx'),
+        ),
+        migrations.RunPython(backfill_player_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-10-18 09:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0006_player_stats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='gameguess',
+            index=models.Index(fields=['created_at'], name='guess_created_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 3.2.25 on 2026-10-18 09:34
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0007_guess_created_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='gamesession',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -1,7 +1,13 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import RegexValidator
-import random
+from django.db import IntegrityError, router, transaction
+from django.db.models import Count, ExpressionWrapper, F, FloatField, Q
+from django.db.models.functions import Greatest, NullIf, TruncDate
+from django.utils import timezone
+
+from .utils import day_bounds
+from .word_index import word_index
 
 class CustomUser(AbstractUser):
     ROLE_CHOICES = [
@@ -29,43 +35,83 @@ class GameWord(models.Model):
     
     @classmethod
     def get_random_word(cls):
-        words = cls.objects.all()
-        if words.exists():
-            return random.choice(words)
-        return None
+        entry = word_index.random_entry()
+        if entry is None:
+            return None
+        return cls.from_db(router.db_for_read(cls), ['id', 'word'], entry)
 
 class GameSession(models.Model):
-    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE)
+    # session_user_done_created_idx leads with user and serves every user lookup.
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, db_index=False)
     word = models.ForeignKey(GameWord, on_delete=models.CASCADE)
-    guesses = models.JSONField(default=list)
+    guess_count = models.PositiveSmallIntegerField(default=0)
     is_completed = models.BooleanField(default=False)
     is_won = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     completed_at = models.DateTimeField(null=True, blank=True)
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'is_completed', 'created_at'], name='session_user_done_created_idx'),
+            models.Index(fields=['created_at'], name='session_created_idx'),
+            models.Index(fields=['user'], condition=Q(is_completed=False), name='session_active_user_idx'),
+            models.Index(fields=['created_at'], condition=Q(is_completed=False), name='session_active_created_idx'),
+        ]
+    
     def __str__(self):
         return f"{self.user.username} - {self.word.word} - {'Won' if self.is_won else 'Lost'}"
     
+    @classmethod
+    def get_active_session(cls, user):
+        return cls.objects.filter(
+            user=user,
+            is_completed=False
+        ).first()
+    
+    @classmethod
+    def get_stale_sessions(cls, before):
+        return cls.objects.filter(
+            is_completed=False,
+            created_at__lt=before
+        )
+    
     @classmethod
     def get_user_daily_sessions(cls, user, date):
+        start, end = day_bounds(date)
         return cls.objects.filter(
             user=user,
-            created_at__date=date,
-            is_completed=True
+            is_completed=True,
+            created_at__gte=start,
+            created_at__lt=end
         )
     
+    @classmethod
+    def get_sessions_for_date(cls, date):
+        start, end = day_bounds(date)
+        return cls.objects.filter(created_at__gte=start, created_at__lt=end)
+    
     @classmethod
     def get_daily_stats(cls, date):
-        sessions = cls.objects.filter(created_at__date=date)
-        unique_users = sessions.values('user').distinct().count()
-        correct_guesses = sessions.filter(is_won=True).count()
-        total_games = sessions.count()
-        
-        return {
-            'total_users': unique_users,
-            'correct_guesses': correct_guesses,
-            'total_games': total_games
-        }
+        return cls.get_sessions_for_date(date).aggregate(
+            total_users=Count('user', distinct=True),
+            correct_guesses=Count('id', filter=Q(is_won=True)),
+            total_games=Count('id'),
+        )
+    
+    @classmethod
+    def get_daily_user_reports(cls, date, ordering=('username',)):
+        return cls.get_sessions_for_date(date).filter(
+            user__role='player'
+        ).values('user').annotate(
+            username=F('user__username'),
+            words_tried=Count('id'),
+            correct_guesses=Count('id', filter=Q(is_won=True)),
+        ).annotate(
+            success_rate=ExpressionWrapper(
+                F('correct_guesses') * 100.0 / F('words_tried'),
+                output_field=FloatField()
+            )
+        ).order_by(*ordering)
 
 class GameGuess(models.Model):
     session = models.ForeignKey(GameSession, on_delete=models.CASCADE, related_name='game_guesses')
@@ -73,6 +119,268 @@ class GameGuess(models.Model):
     feedback = models.JSONField()
     is_correct = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at'], name='guess_created_idx'),
+        ]
     
     def __str__(self):
         return f"{self.session.user.username} - {self.word} - {self.created_at}"
+
+class DailyStats(models.Model):
+    date = models.DateField(unique=True)
+    total_users = models.PositiveIntegerField(default=0)
+    total_games = models.PositiveIntegerField(default=0)
+    correct_guesses = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name_plural = 'daily stats'
+    
+    def __str__(self):
+        return f"{self.date} - {self.total_games} games"
+    
+    @classmethod
+    def get_for_date(cls, date):
+        row = cls.objects.filter(date=date).values('total_users', 'correct_guesses', 'total_games').first()
+        return row or {'total_users': 0, 'correct_guesses': 0, 'total_games': 0}
+    
+    @classmethod
+    def record_game_started(cls, session):
+        date = timezone.localdate(session.created_at)
+        new_user = DailyUserStats.increment(date, session.user_id, games_played=1)
+        cls.increment(date, total_games=1, total_users=int(new_user))
+    
+    @classmethod
+    def record_game_won(cls, session):
+        date = timezone.localdate(session.created_at)
+        DailyUserStats.increment(date, session.user_id, games_won=1)
+        cls.increment(date, correct_guesses=1)
+    
+    @classmethod
+    def increment(cls, date, **counts):
+        changes = {field: F(field) + value for field, value in counts.items() if value}
+        if not changes or cls.objects.filter(date=date).update(**changes):
+            return
+        try:
+            with transaction.atomic():
+                cls.objects.create(date=date, **counts)
+        except IntegrityError:
+            cls.objects.filter(date=date).update(**changes)
+    
+    @classmethod
+    def rebuild_range(cls, start, end):
+        """Recompute the rollups for every date in ``[start, end]`` from GameSession."""
+        start_at, _ = day_bounds(start)
+        _, end_at = day_bounds(end)
+        rows = GameSession.objects.filter(
+            created_at__gte=start_at,
+            created_at__lt=end_at
+        ).annotate(
+            date=TruncDate('created_at')
+        ).values('date', 'user').annotate(
+            games_played=Count('id'),
+            games_won=Count('id', filter=Q(is_won=True)),
+        ).order_by()
+        
+        user_stats = []
+        daily = {}
+        for row in rows.iterator():
+            user_stats.append(DailyUserStats(
+                date=row['date'],
+                user_id=row['user'],
+                games_played=row['games_played'],
+                games_won=row['games_won'],
+            ))
+            stats = daily.setdefault(row['date'], cls(date=row['date']))
+            stats.total_users += 1
+            stats.total_games += row['games_played']
+            stats.correct_guesses += row['games_won']
+        
+        with transaction.atomic():
+            DailyUserStats.objects.filter(date__range=(start, end)).delete()
+            cls.objects.filter(date__range=(start, end)).delete()
+            DailyUserStats.objects.bulk_create(user_stats, batch_size=1000)
+            cls.objects.bulk_create(daily.values(), batch_size=1000)
+        return len(daily), len(user_stats)
+
+class DailyUserStats(models.Model):
+    date = models.DateField()
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='daily_stats')
+    games_played = models.PositiveIntegerField(default=0)
+    games_won = models.PositiveIntegerField(default=0)
+    
+    class Meta:
+        verbose_name_plural = 'daily user stats'
+        constraints = [
+            models.UniqueConstraint(fields=['date', 'user'], name='unique_daily_user_stats'),
+        ]
+    
+    def __str__(self):
+        return f"{self.user_id} - {self.date}"
+    
+    @classmethod
+    def increment(cls, date, user_id, **counts):
+        """Add ``counts`` to the row for (date, user); return True if it was created."""
+        changes = {field: F(field) + value for field, value in counts.items() if value}
+        if cls.objects.filter(date=date, user_id=user_id).update(**changes):
+            return False
+        try:
+            with transaction.atomic():
+                cls.objects.create(date=date, user_id=user_id, **counts)
+            return True
+        except IntegrityError:
+            cls.objects.filter(date=date, user_id=user_id).update(**changes)
+            return False
+    
+    @classmethod
+    def get_reports(cls, date, ordering=('username',)):
+        return cls.objects.filter(
+            date=date,
+            user__role='player'
+        ).values('user').annotate(
+            username=F('user__username'),
+            words_tried=F('games_played'),
+            correct_guesses=F('games_won'),
+            # A game started before the rollups existed can be won without
+            # ever having been counted as played.
+            success_rate=ExpressionWrapper(
+                F('games_won') * 100.0 / NullIf(F('games_played'), 0),
+                output_field=FloatField()
+            )
+        ).order_by(*ordering)
+
+class PlayerStats(models.Model):
+    user = models.OneToOneField(CustomUser, on_delete=models.CASCADE, primary_key=True, related_name='player_stats')
+    games_played = models.PositiveIntegerField(default=0)
+    games_won = models.PositiveIntegerField(default=0)
+    current_streak = models.PositiveIntegerField(default=0)
+    best_streak = models.PositiveIntegerField(default=0)
+    # Wins by the number of guesses they took.
+    wins_1 = models.PositiveIntegerField(default=0)
+    wins_2 = models.PositiveIntegerField(default=0)
+    wins_3 = models.PositiveIntegerField(default=0)
+    wins_4 = models.PositiveIntegerField(default=0)
+    wins_5 = models.PositiveIntegerField(default=0)
+    last_completed_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    RANK_ORDERING = ('-games_won', '-best_streak', 'user_id')
+    WIN_BUCKETS = 5
+    
+    class Meta:
+        verbose_name_plural = 'player stats'
+        indexes = [
+            models.Index(fields=['-games_won', '-best_streak', 'user'], name='player_stats_rank_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.user_id} - {self.games_won}/{self.games_played}"
+    
+    @property
+    def distribution(self):
+        return [self.wins_1, self.wins_2, self.wins_3, self.wins_4, self.wins_5]
+    
+    @classmethod
+    def wins_field(cls, guess_count):
+        # Games from before the guess cap was enforced under concurrency can
+        # have more guesses than buckets; count those in the last one.
+        return f'wins_{min(max(guess_count, 1), cls.WIN_BUCKETS)}'
+    
+    @classmethod
+    def record_game_completed(cls, session):
+        """Fold one finished game into the player's row with a single UPDATE."""
+        changes = {
+            'games_played': F('games_played') + 1,
+            'last_completed_at': session.completed_at,
+        }
+        initial = {'games_played': 1, 'last_completed_at': session.completed_at}
+        if session.is_won:
+            distribution_field = cls.wins_field(session.guess_count)
+            changes.update({
+                'games_won': F('games_won') + 1,
+                'current_streak': F('current_streak') + 1,
+                'best_streak': Greatest('best_streak', F('current_streak') + 1),
+                distribution_field: F(distribution_field) + 1,
+            })
+            initial.update({'games_won': 1, 'current_streak': 1, 'best_streak': 1, distribution_field: 1})
+        else:
+            changes['current_streak'] = 0
+        
+        if cls.objects.filter(user_id=session.user_id).update(**changes):
+            return
+        try:
+            with transaction.atomic():
+                cls.objects.create(user_id=session.user_id, **initial)
+        except IntegrityError:
+            cls.objects.filter(user_id=session.user_id).update(**changes)
+    
+    @classmethod
+    def record_games_abandoned(cls, counts, completed_at):
+        """Count abandoned games (``{user_id: games}``) as losses in bulk."""
+        cls.objects.bulk_create(
+            [cls(user_id=user_id) for user_id in counts],
+            ignore_conflicts=True
+        )
+        by_count = {}
+        for user_id, games in counts.items():
+            by_count.setdefault(games, []).append(user_id)
+        for games, user_ids in by_count.items():
+            cls.objects.filter(user_id__in=user_ids).update(
+                games_played=F('games_played') + games,
+                current_streak=0,
+                last_completed_at=completed_at
+            )
+    
+    @classmethod
+    def get_top(cls, limit):
+        return cls.objects.filter(games_played__gt=0).select_related('user').order_by(*cls.RANK_ORDERING)[:limit]
+    
+    def get_rank(self):
+        ahead = PlayerStats.objects.filter(games_played__gt=0).filter(
+            Q(games_won__gt=self.games_won) |
+            Q(games_won=self.games_won, best_streak__gt=self.best_streak) |
+            Q(games_won=self.games_won, best_streak=self.best_streak, user_id__lt=self.user_id)
+        ).count()
+        return ahead + 1
+    
+    @classmethod
+    def rebuild(cls, batch_size=1000):
+        """Recompute every row from the finished games in GameSession.
+        
+        Sessions are streamed in (user, completion) order so streaks can be
+        replayed one user at a time without holding the history in memory.
+        Returns the number of rows written.
+        """
+        sessions = GameSession.objects.filter(is_completed=True).order_by(
+            'user_id', 'completed_at', 'id'
+        ).values_list('user_id', 'is_won', 'guess_count', 'completed_at')
+        
+        with transaction.atomic():
+            cls.objects.all().delete()
+            pending = []
+            written = 0
+            stats = None
+            for user_id, is_won, guess_count, completed_at in sessions.iterator(chunk_size=batch_size):
+                if stats is None or stats.user_id != user_id:
+                    stats = cls(user_id=user_id)
+                    pending.append(stats)
+                    if len(pending) > batch_size:
+                        # Everything but the row still being filled in is final.
+                        cls.objects.bulk_create(pending[:-1], batch_size=batch_size)
+                        written += len(pending) - 1
+                        pending = pending[-1:]
+                stats.games_played += 1
+                stats.last_completed_at = completed_at
+                if is_won:
+                    stats.games_won += 1
+                    stats.current_streak += 1
+                    stats.best_streak = max(stats.best_streak, stats.current_streak)
+                    field = cls.wins_field(guess_count)
+                    setattr(stats, field, getattr(stats, field) + 1)
+                else:
+                    stats.current_streak = 0
+            cls.objects.bulk_create(pending, batch_size=batch_size)
+            written += len(pending)
+        return written
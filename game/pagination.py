@@ -0,0 +1,42 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+# Below this many rows an exact COUNT(*) is cheap enough to keep.
+ESTIMATE_THRESHOLD = 100000
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that trusts the planner's row estimate for whole tables.
+
+    An unfiltered admin changelist otherwise runs an exact ``COUNT(*)`` over
+    the whole table on every page view. On PostgreSQL the count of an
+    unfiltered queryset is read from ``pg_class.reltuples`` (kept up to date
+    by autovacuum) once the table is past ``ESTIMATE_THRESHOLD`` rows.
+    Filtered querysets, small tables and other databases count exactly.
+    """
+
+    @cached_property
+    def count(self):
+        estimate = self.estimated_count()
+        if estimate is not None and estimate >= ESTIMATE_THRESHOLD:
+            return estimate
+        return super().count
+
+    def estimated_count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is None or query.where or query.distinct or query.combinator:
+            return None
+        connection = connections[self.object_list.db]
+        if connection.vendor != 'postgresql':
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples FROM pg_class WHERE oid = to_regclass(%s)',
+                [connection.ops.quote_name(query.model._meta.db_table)],
+            )
+            row = cursor.fetchone()
+        # reltuples is -1 (or 0) until the table has been vacuumed or analyzed.
+        if row is None or row[0] is None or row[0] <= 0:
+            return None
+        return int(row[0])
@@ -0,0 +1,74 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from .models import GameSession
+from .utils import day_bounds
+
+DAILY_GAME_LIMIT = 3
+
+
+def _key(user_id, date):
+    return f'game:quota:{user_id}:{date.isoformat()}'
+
+
+def _seconds_until_day_end(date):
+    _, end = day_bounds(date)
+    return max(int((end - timezone.now()).total_seconds()), 1)
+
+
+def get_games_played(user, date=None):
+    """Completed games ``user`` played on ``date`` (today by default).
+
+    With a shared cache this is served from the cache; a miss falls back to
+    a COUNT on GameSession and primes the key until the end of that day. A
+    per-process cache would let each worker hold its own count, so without
+    one (``SHARED_CACHE``) every call counts in the database.
+
+    Either way the result is advisory: ``services.start_game`` enforces the
+    limit with ``count_games_played`` under a lock.
+    """
+    if not settings.SHARED_CACHE:
+        return GameSession.get_user_daily_sessions(user, date or timezone.localdate()).count()
+
+    date = date or timezone.localdate()
+    key = _key(user.pk, date)
+    played = cache.get(key)
+    if played is None:
+        played = GameSession.get_user_daily_sessions(user, date).count()
+        cache.add(key, played, timeout=_seconds_until_day_end(date))
+    return played
+
+
+def count_games_played(user, date=None):
+    """Count in the database and overwrite the cached value with the result.
+
+    The overwrite repairs a count primed by a miss that raced a completing
+    game (whose ``incr`` found no key yet).
+    """
+    date = date or timezone.localdate()
+    played = GameSession.get_user_daily_sessions(user, date).count()
+    if settings.SHARED_CACHE:
+        cache.set(_key(user.pk, date), played, timeout=_seconds_until_day_end(date))
+    return played
+
+
+def record_game_completed(session):
+    key = _key(session.user_id, timezone.localdate(session.created_at))
+
+    def increment():
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Not cached yet; the next read counts it from the database.
+            pass
+
+    transaction.on_commit(increment)
+
+
+def invalidate(pairs):
+    """Drop the cached counts for ``(user_id, date)`` pairs after a bulk change."""
+    keys = [_key(user_id, date) for user_id, date in set(pairs)]
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
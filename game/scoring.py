@@ -0,0 +1,104 @@
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+WORD_LENGTH = 5
+
+ABSENT = 0
+PRESENT = 1
+CORRECT = 2
+
+STATUSES = ('absent', 'present', 'correct')
+
+# Feedback for a whole word is packed into a base-3 integer: the status of
+# position ``i`` is stored in digit ``i``. 3 ** 5 = 243 codes fit in a byte.
+POWERS = tuple(3 ** i for i in range(WORD_LENGTH))
+PATTERN_COUNT = 3 ** WORD_LENGTH
+ALL_CORRECT = sum(CORRECT * power for power in POWERS)
+
+
+def score(guess: str, target: str) -> int:
+    # Unrolled over the five positions: the first block awards greens and
+    # collects the unmatched target letters, the second consumes that pool
+    # left to right for yellows, exactly like generate_letter_feedback.
+    g0, g1, g2, g3, g4 = guess
+    t0, t1, t2, t3, t4 = target
+    code = 0
+    pool = ''
+    if g0 == t0:
+        code += 2
+    else:
+        pool += t0
+    if g1 == t1:
+        code += 6
+    else:
+        pool += t1
+    if g2 == t2:
+        code += 18
+    else:
+        pool += t2
+    if g3 == t3:
+        code += 54
+    else:
+        pool += t3
+    if g4 == t4:
+        code += 162
+    else:
+        pool += t4
+    if not pool:
+        return code
+    if g0 != t0 and g0 in pool:
+        code += 1
+        pool = pool.replace(g0, '', 1)
+    if g1 != t1 and g1 in pool:
+        code += 3
+        pool = pool.replace(g1, '', 1)
+    if g2 != t2 and g2 in pool:
+        code += 9
+        pool = pool.replace(g2, '', 1)
+    if g3 != t3 and g3 in pool:
+        code += 27
+        pool = pool.replace(g3, '', 1)
+    if g4 != t4 and g4 in pool:
+        code += 81
+    return code
+
+
+def score_many(guess: str, targets: Iterable[str]) -> List[int]:
+    return [score(guess, target) for target in targets]
+
+
+def score_guesses(guesses: Iterable[str], target: str) -> List[int]:
+    return [score(guess, target) for guess in guesses]
+
+
+def score_pairs(pairs: Iterable[Sequence[str]]) -> List[int]:
+    return [score(guess, target) for guess, target in pairs]
+
+
+def _digits(code: int) -> Tuple[int, ...]:
+    digits = []
+    for _ in range(WORD_LENGTH):
+        code, digit = divmod(code, 3)
+        digits.append(digit)
+    return tuple(digits)
+
+
+_DIGITS = tuple(_digits(code) for code in range(PATTERN_COUNT))
+
+
+def decode(code: int) -> Tuple[int, ...]:
+    return _DIGITS[code]
+
+
+def encode(digits: Sequence[int]) -> int:
+    return sum(digit * power for digit, power in zip(digits, POWERS))
+
+
+def to_feedback(guess: str, code: int) -> List[Dict[str, Any]]:
+    return [
+        {'letter': letter, 'status': STATUSES[digit], 'position': position}
+        for position, (letter, digit) in enumerate(zip(guess, decode(code)))
+    ]
+
+
+def from_feedback(feedback: Sequence[Dict[str, Any]]) -> int:
+    return encode([STATUSES.index(item['status']) for item in feedback])
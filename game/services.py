@@ -0,0 +1,282 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+
+from . import events, quota, session_cache, solver
+from .feedback_matrix import feedback_code
+from .models import CustomUser, DailyStats, GameSession, GameGuess, GameWord, PlayerStats
+from .scoring import ALL_CORRECT, to_feedback
+from .utils import is_word_correct
+
+MAX_GUESSES = 5
+LEADERBOARD_SIZE = 10
+MAX_LEADERBOARD_SIZE = 100
+LEADERBOARD_CACHE_SECONDS = 30
+
+
+class GameError(Exception):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+
+
+class GuessError(GameError):
+    pass
+
+
+def start_game(user):
+    word = GameWord.get_random_word()
+    if not word:
+        raise GameError('No words available', status=500)
+
+    with transaction.atomic():
+        # Lock the player's row so concurrent starts are serialized, then
+        # check against the database rather than the cache: a cached "no
+        # active game" or quota count may be stale in a per-process cache.
+        CustomUser.objects.select_for_update().filter(pk=user.pk).values_list('pk', flat=True).get()
+        if GameSession.objects.filter(user=user, is_completed=False).exists():
+            # Whatever the board was shown is out of date; make it re-read.
+            session_cache.discard(user.pk)
+            raise GameError('You already have an active game. Please complete it first.')
+
+        if quota.count_games_played(user) >= quota.DAILY_GAME_LIMIT:
+            raise GameError('Daily limit reached')
+
+        session = GameSession.objects.create(
+            user=user,
+            word=word
+        )
+        DailyStats.record_game_started(session)
+        session_cache.store_state(session_cache.build_state(session, []))
+
+    return {
+        'success': True,
+        'session_id': session.id,
+        'word_length': 5
+    }
+
+
+def get_session_state(user, session_id):
+    state = session_cache.get_active_state(user)
+    if state is not None and str(state['id']) == str(session_id):
+        return {
+            'session_id': state['id'],
+            'guesses': [
+                {'word': word, 'feedback': to_feedback(word, code), 'is_correct': is_correct}
+                for word, code, is_correct in state['guesses']
+            ],
+            'is_completed': False,
+            'is_won': False,
+            'remaining_guesses': MAX_GUESSES - state['guess_count']
+        }
+
+    session = get_object_or_404(GameSession, id=session_id, user=user)
+
+    guesses_data = []
+    for guess in session.game_guesses.all().order_by('created_at'):
+        guesses_data.append({
+            'word': guess.word,
+            'feedback': guess.feedback,
+            'is_correct': guess.is_correct
+        })
+
+    return {
+        'session_id': session.id,
+        'guesses': guesses_data,
+        'is_completed': session.is_completed,
+        'is_won': session.is_won,
+        'remaining_guesses': MAX_GUESSES - session.guess_count
+    }
+
+
+def get_hint(user, session_id):
+    state = session_cache.get_active_state(user)
+    if state is None or str(state['id']) != str(session_id):
+        get_object_or_404(GameSession, id=session_id, user=user)
+        raise GameError('Hints are only available for a game in progress')
+
+    result = solver.hint([(word, code) for word, code, _ in state['guesses']])
+    result.update(success=True, session_id=state['id'])
+    return result
+
+
+def get_quota_state(user):
+    games_played = quota.get_games_played(user)
+
+    return {
+        'success': True,
+        'games_played': games_played,
+        'daily_limit': quota.DAILY_GAME_LIMIT,
+        'can_play': games_played < quota.DAILY_GAME_LIMIT
+    }
+
+
+def _leaderboard_entry(stats, rank, username):
+    return {
+        'rank': rank,
+        'username': username,
+        'games_played': stats.games_played,
+        'games_won': stats.games_won,
+        'win_rate': round(stats.games_won * 100.0 / stats.games_played, 1) if stats.games_played else 0.0,
+        'current_streak': stats.current_streak,
+        'best_streak': stats.best_streak,
+        'distribution': stats.distribution,
+    }
+
+
+def get_leaderboard(user, limit=LEADERBOARD_SIZE):
+    """Top ``limit`` players plus the requesting player's own rank.
+
+    The top list is one indexed range scan and is shared through the cache
+    for a few seconds; the player's rank is a COUNT of the rows ahead of
+    them on the same index.
+    """
+    if limit < 1 or limit > MAX_LEADERBOARD_SIZE:
+        raise GameError(f'limit must be between 1 and {MAX_LEADERBOARD_SIZE}')
+
+    key = f'game:leaderboard:top:{limit}'
+    top = cache.get(key)
+    if top is None:
+        top = [
+            _leaderboard_entry(stats, rank, stats.user.username)
+            for rank, stats in enumerate(PlayerStats.get_top(limit), start=1)
+        ]
+        cache.set(key, top, timeout=LEADERBOARD_CACHE_SECONDS)
+
+    stats = PlayerStats.objects.filter(user=user, games_played__gt=0).first()
+    me = _leaderboard_entry(stats, stats.get_rank(), user.username) if stats else None
+
+    return {
+        'success': True,
+        'top': top,
+        'me': me
+    }
+
+
+def record_guess(user, session_id, guess):
+    """Score ``guess`` and store it.
+
+    An in-progress game is normally served from the active-session cache:
+    the guess costs a guarded ``UPDATE`` of the session and the guess
+    ``INSERT``, with no reads. The ``UPDATE`` only matches while the row
+    still has the guess count the cache saw, so a stale entry (another
+    worker, an admin edit) updates nothing and the guess is replayed on the
+    locking path instead. Subscribers of the session's event channel are
+    notified once the transaction commits.
+    """
+    state = session_cache.get_cached_state(user)
+    if state is not None and str(state['id']) == str(session_id):
+        result = _record_cached_guess(user, state, guess)
+        if result is not None:
+            return result
+    return _record_locked_guess(user, session_id, guess)
+
+
+def _record_cached_guess(user, state, guess):
+    if state['guess_count'] >= MAX_GUESSES:
+        raise GuessError('Maximum guesses reached')
+
+    session = GameSession(
+        pk=state['id'],
+        user_id=state['user_id'],
+        word_id=state['word_id'],
+        created_at=state['created_at'],
+        guess_count=state['guess_count'],
+    )
+    target = state['word']
+    code = feedback_code(guess, target)
+    is_correct = is_word_correct(guess, target)
+    changes = _advance(session, is_correct)
+
+    with transaction.atomic():
+        updated = GameSession.objects.filter(
+            pk=session.pk,
+            user=user,
+            is_completed=False,
+            guess_count=state['guess_count'],
+        ).update(**changes)
+        if not updated:
+            session_cache.invalidate(user.pk)
+            return None
+
+        state = dict(state, guess_count=session.guess_count, guesses=state['guesses'] + [(guess, code, is_correct)])
+        return _save_guess(user, session, target, guess, code, state)
+
+
+def _record_locked_guess(user, session_id, guess):
+    # The session row is locked for the duration so concurrent guesses for
+    # the same game are serialized and cannot push it past MAX_GUESSES.
+    with transaction.atomic():
+        session = get_object_or_404(
+            GameSession.objects.select_related('word').select_for_update(of=('self',)),
+            id=session_id,
+            user=user,
+        )
+
+        if session.is_completed:
+            raise GuessError('Game session completed')
+
+        if session.guess_count >= MAX_GUESSES:
+            raise GuessError('Maximum guesses reached')
+
+        target = session.word.word
+        code = feedback_code(guess, target)
+        changes = _advance(session, is_word_correct(guess, target))
+        GameSession.objects.filter(pk=session.pk).update(**changes)
+        return _save_guess(user, session, target, guess, code, None)
+
+
+def _advance(session, is_correct):
+    """Apply one guess to ``session`` in memory and return the matching UPDATE."""
+    session.guess_count += 1
+    changes = {'guess_count': F('guess_count') + 1}
+    if is_correct or session.guess_count >= MAX_GUESSES:
+        session.is_completed = True
+        session.is_won = is_correct
+        session.completed_at = timezone.now()
+        changes.update(is_completed=True, is_won=is_correct, completed_at=session.completed_at)
+    return changes
+
+
+def _save_guess(user, session, target, guess, code, state):
+    feedback = to_feedback(guess, code)
+    is_correct = code == ALL_CORRECT
+
+    GameGuess.objects.create(
+        session_id=session.pk,
+        word=guess,
+        feedback=feedback,
+        is_correct=is_correct
+    )
+
+    if session.is_completed:
+        quota.record_game_completed(session)
+        PlayerStats.record_game_completed(session)
+        session_cache.invalidate(user.pk)
+    elif state is not None:
+        session_cache.store_state(state)
+    else:
+        session_cache.invalidate(user.pk)
+    if session.is_won:
+        DailyStats.record_game_won(session)
+
+    result = {
+        'success': True,
+        'feedback': feedback,
+        'is_correct': is_correct,
+        'is_completed': session.is_completed,
+        'is_won': session.is_won,
+        'remaining_guesses': MAX_GUESSES - session.guess_count,
+        'correct_word': target if session.is_completed and not session.is_won else None,
+        'guess_number': session.guess_count
+    }
+
+    channel = events.session_channel(session.pk)
+    events.publish_on_commit(channel, 'guess', dict(result, word=guess))
+    if session.is_completed:
+        events.publish_on_commit(channel, 'end', {})
+
+    return result
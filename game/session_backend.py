@@ -0,0 +1,32 @@
+import hashlib
+
+from django.conf import settings
+from django.contrib.sessions.backends.cached_db import SessionStore as CachedDBStore
+
+
+class SessionStore(CachedDBStore):
+    """Cache-first database sessions that skip saves which would change nothing.
+
+    Reads come from the cache and only fall back to the database on a miss.
+    ``SessionMiddleware`` saves whenever the session is marked modified, which
+    also happens when a view writes a key back with the value it already had;
+    here such a save is dropped when the encoded data and the expiry match
+    what was loaded, so an unchanged session costs neither a cache write nor
+    an ``UPDATE``.
+    """
+
+    def load(self):
+        data = super().load()
+        self._loaded_fingerprint = self._fingerprint(data)
+        return data
+
+    def save(self, must_create=False):
+        if not must_create and self.session_key is not None and not settings.SESSION_SAVE_EVERY_REQUEST:
+            if self._fingerprint(self._get_session(no_load=True)) == getattr(self, '_loaded_fingerprint', None):
+                return
+        super().save(must_create=must_create)
+        self._loaded_fingerprint = self._fingerprint(self._get_session(no_load=True))
+
+    def _fingerprint(self, data):
+        # The expiry is stored in the data when set_expiry() is used, so it is covered too.
+        return hashlib.sha1(self.encode(data).encode()).hexdigest() if data else None
@@ -0,0 +1,95 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import GameSession
+from .scoring import from_feedback
+
+ACTIVE_SESSION_TIMEOUT = 60 * 60
+# Cached for users without an active game so the board doesn't query for them either.
+NO_ACTIVE_SESSION = 0
+
+
+def _key(user_id):
+    return f'game:active_session:{user_id}'
+
+
+def build_state(session, guesses):
+    """Compact state of an in-progress game.
+
+    ``guesses`` is a list of ``(word, code, is_correct)`` tuples in the
+    order they were played, with ``code`` as produced by ``scoring.score``.
+    """
+    return {
+        'id': session.pk,
+        'user_id': session.user_id,
+        'word_id': session.word_id,
+        'word': session.word.word,
+        'created_at': session.created_at,
+        'guess_count': session.guess_count,
+        'guesses': guesses,
+    }
+
+
+def load_state(user):
+    session = (
+        GameSession.objects.filter(user=user, is_completed=False)
+        .select_related('word')
+        .order_by('pk')
+        .first()
+    )
+    if session is None:
+        return None
+    guesses = [
+        (word, from_feedback(feedback), is_correct)
+        for word, feedback, is_correct in session.game_guesses.order_by('created_at', 'pk').values_list(
+            'word', 'feedback', 'is_correct'
+        )
+    ]
+    return build_state(session, guesses)
+
+
+def get_active_state(user):
+    """The user's in-progress game as a dict, or None.
+
+    Read through the cache only when it is shared (``SHARED_CACHE``). A
+    per-process cache can hold another worker's entry for up to
+    ``ACTIVE_SESSION_TIMEOUT`` after the game ended there, so without one
+    the state comes from the database.
+    """
+    if not settings.SHARED_CACHE:
+        return load_state(user)
+    return get_cached_state(user)
+
+
+def get_cached_state(user):
+    """Like ``get_active_state``, but always read through the cache.
+
+    Only for fast paths that verify the state against the database before
+    acting on it, such as the guarded ``UPDATE`` in ``services.record_guess``.
+    """
+    state = cache.get(_key(user.pk))
+    if state is None:
+        state = load_state(user)
+        cache.set(_key(user.pk), state or NO_ACTIVE_SESSION, timeout=ACTIVE_SESSION_TIMEOUT)
+    return state or None
+
+
+def store_state(state):
+    """Write ``state`` to the cache once the current transaction commits."""
+    transaction.on_commit(lambda: cache.set(_key(state['user_id']), state, timeout=ACTIVE_SESSION_TIMEOUT))
+
+
+def discard(user_id):
+    """Drop the cached state right away, even if the current transaction rolls back."""
+    cache.delete(_key(user_id))
+
+
+def invalidate(user_id):
+    transaction.on_commit(lambda: cache.delete(_key(user_id)))
+
+
+def invalidate_many(user_ids):
+    keys = [_key(user_id) for user_id in set(user_ids)]
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
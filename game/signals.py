@@ -0,0 +1,37 @@
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import metrics, session_cache
+from .auth_backends import invalidate_user
+from .models import CustomUser, GameSession, GameWord
+from .word_index import word_index
+
+
+@receiver(post_save, sender=GameWord)
+def add_word_to_index(sender, instance, **kwargs):
+    transaction.on_commit(lambda: word_index.add(instance.pk, instance.word))
+
+
+@receiver(post_delete, sender=GameWord)
+def remove_word_from_index(sender, instance, **kwargs):
+    word_id = instance.pk
+    transaction.on_commit(lambda: word_index.remove(word_id))
+
+
+@receiver(post_save, sender=GameSession)
+@receiver(post_delete, sender=GameSession)
+def invalidate_active_session(sender, instance, **kwargs):
+    session_cache.invalidate(instance.user_id)
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def invalidate_cached_user(sender, instance, **kwargs):
+    invalidate_user(instance.pk)
+
+
+@receiver(connection_created)
+def track_connection_queries(sender, connection, **kwargs):
+    metrics.install_query_hook(connection)
@@ -0,0 +1,224 @@
+import math
+import threading
+from collections import Counter
+
+from django.core.cache import cache
+
+from .feedback_matrix import feedback_codes
+from .scoring import ALL_CORRECT, CORRECT, WORD_LENGTH, decode
+from .word_index import get_shared_version, word_index
+
+# Scoring every candidate against every other one is quadratic, so a hint
+# tries at most MAX_EVALUATED_GUESSES of them as guesses and scores those
+# against at most MAX_SCORED_CANDIDATES, both evenly spaced samples. The
+# opening, computed once per vocabulary, tries more guesses against them all.
+MAX_EVALUATED_GUESSES = 100
+MAX_SCORED_CANDIDATES = 250
+OPENING_EVALUATED_GUESSES = 500
+MAX_SOLVE_STEPS = 10
+HINT_CACHE_SECONDS = 60 * 60
+
+
+class CandidateIndex:
+    """Bitsets over a fixed vocabulary for filtering by feedback.
+
+    Word ``i`` is bit ``i`` of a Python int. ``positions[p][letter]`` holds
+    the words with ``letter`` at position ``p`` and ``at_least[letter][k]``
+    the words containing ``letter`` at least ``k`` times, so the words that
+    agree with one scored guess are a handful of ANDs over those ints.
+    """
+
+    def __init__(self, words):
+        self.words = sorted(set(words))
+        self.all = (1 << len(self.words)) - 1
+        self.positions = [{} for _ in range(WORD_LENGTH)]
+        self.at_least = {}
+        for bit, word in enumerate(self.words):
+            flag = 1 << bit
+            for position, letter in enumerate(word):
+                self.positions[position][letter] = self.positions[position].get(letter, 0) | flag
+            for letter, count in Counter(word).items():
+                thresholds = self.at_least.setdefault(letter, [self.all, 0, 0, 0, 0, 0, 0])
+                for k in range(1, count + 1):
+                    thresholds[k] |= flag
+
+    def __len__(self):
+        return len(self.words)
+
+    def matching(self, guess, code, mask=None):
+        """Narrow ``mask`` (default: every word) to the words ``guess`` would score ``code`` against.
+
+        The rules mirror ``generate_letter_feedback``: a green pins the letter
+        to its position, any other colour rules it out there, and the greens
+        plus yellows of a letter give its minimum count; a grey copy of the
+        letter makes that count exact.
+        """
+        mask = self.all if mask is None else mask
+        statuses = decode(code)
+        found = Counter()
+        capped = set()
+        for position, (letter, status) in enumerate(zip(guess, statuses)):
+            words_here = self.positions[position].get(letter, 0)
+            if status == CORRECT:
+                mask &= words_here
+            else:
+                mask &= ~words_here
+            if status:
+                found[letter] += 1
+            else:
+                capped.add(letter)
+        for letter in set(guess):
+            thresholds = self.at_least.get(letter)
+            minimum = found[letter]
+            if thresholds is None:
+                if minimum:
+                    return 0
+                continue
+            if minimum:
+                mask &= thresholds[minimum]
+            if letter in capped:
+                mask &= ~thresholds[minimum + 1]
+        return mask
+
+    def filter(self, history, mask=None):
+        """Words consistent with every ``(guess, code)`` pair in ``history``."""
+        for guess, code in history:
+            mask = self.matching(guess, code, mask)
+        return self.all if mask is None else mask
+
+    def words_in(self, mask):
+        words = []
+        while mask:
+            low = mask & -mask
+            words.append(self.words[low.bit_length() - 1])
+            mask ^= low
+        return words
+
+    @staticmethod
+    def count(mask):
+        return bin(mask).count('1')
+
+
+def expected_information(guess, candidates):
+    """Expected bits of information from playing ``guess`` against ``candidates``."""
+    total = len(candidates)
+    if total <= 1:
+        return 0.0
+    buckets = Counter(feedback_codes(guess, candidates))
+    return math.log2(total) - sum(size * math.log2(size) for size in buckets.values()) / total
+
+
+def _spread(items, limit):
+    if limit is None or len(items) <= limit:
+        return items
+    step = len(items) / limit
+    return [items[int(i * step)] for i in range(limit)]
+
+
+def best_guess(candidates, max_guesses=MAX_EVALUATED_GUESSES, max_scored=MAX_SCORED_CANDIDATES):
+    """The candidate whose feedback is expected to split ``candidates`` the most.
+
+    At most ``max_guesses`` candidates are tried, each scored against at
+    most ``max_scored`` of them (``None`` for no limit). Returns ``(guess,
+    bits)`` with the bits measured over all candidates; ties go to the
+    alphabetically first word.
+    """
+    if not candidates:
+        return None, 0.0
+    if len(candidates) <= 2:
+        return candidates[0], expected_information(candidates[0], candidates)
+    sample = _spread(candidates, max_scored)
+    best, best_bits = None, -1.0
+    for guess in _spread(candidates, max_guesses):
+        bits = expected_information(guess, sample)
+        if bits > best_bits:
+            best, best_bits = guess, bits
+    if sample is not candidates:
+        best_bits = expected_information(best, candidates)
+    return best, best_bits
+
+
+def solve(index, target, opening=None):
+    """Play ``target`` with best-guess play; return the list of guesses made."""
+    mask = index.all
+    guesses = []
+    while len(guesses) < MAX_SOLVE_STEPS:
+        if guesses or opening is None:
+            guess, _ = best_guess(index.words_in(mask))
+        else:
+            guess = opening
+        guesses.append(guess)
+        code = feedback_codes(guess, [target])[0]
+        if code == ALL_CORRECT:
+            break
+        mask = index.matching(guess, code, mask)
+    return guesses
+
+
+class _IndexHolder:
+    """The answer pool's CandidateIndex, rebuilt when the word index version changes."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._index = None
+        self._version = None
+        self._opening = None
+
+    def get(self):
+        version = get_shared_version()
+        if self._index is None or version != self._version:
+            with self._lock:
+                if self._index is None or version != self._version:
+                    self._index = CandidateIndex(word for _, word in word_index.entries())
+                    self._version = version
+                    self._opening = None
+        return self._index
+
+    def opening(self):
+        # The first hint is the same for every game, so compute it once per vocabulary.
+        index = self.get()
+        if self._opening is None or self._opening[0] is not index:
+            self._opening = (index, best_guess(index.words, OPENING_EVALUATED_GUESSES, None))
+        return self._opening[1]
+
+
+_holder = _IndexHolder()
+
+
+def get_index():
+    return _holder.get()
+
+
+def get_opening():
+    return _holder.opening()
+
+
+def hint(history, limit=20):
+    """Remaining answers and the best next guess after ``history`` of ``(guess, code)`` pairs.
+
+    The result only depends on the vocabulary and the history, so it is
+    cached on both: repeated requests for a game, and other games with the
+    same guesses and feedback so far, skip the search.
+    """
+    index = get_index()
+    key = 'game:hint:{}:{}:{}'.format(
+        get_shared_version(), limit, ','.join(f'{guess}{code}' for guess, code in history)
+    )
+    result = cache.get(key)
+    if result is not None:
+        return dict(result)
+
+    if not history:
+        guess, bits = get_opening()
+        mask = index.all
+    else:
+        mask = index.filter(history)
+        guess, bits = best_guess(index.words_in(mask))
+    result = {
+        'remaining': index.count(mask),
+        'candidates': index.words_in(mask)[:limit] if limit else [],
+        'best_guess': guess,
+        'expected_bits': round(bits, 3),
+    }
+    cache.set(key, result, timeout=HINT_CACHE_SECONDS)
+    return dict(result)
@@ -0,0 +1,634 @@
+import asyncio
+import importlib
+import io
+import itertools
+import os
+import random
+import string
+import threading
+import time
+import unittest
+from datetime import timedelta
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.apps import apps
+from django.contrib.admin import site
+from django.db import connection
+from django.http import HttpResponse
+from django.test import AsyncClient, RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.urls import path
+from django.utils import timezone
+
+from . import async_views, quota, session_cache, solver, views
+from .auth_backends import CachedModelBackend
+from .metrics import MetricsRegistry, QueryTracker, registry
+from .middleware import RequestMetricsMiddleware
+from .models import CustomUser, DailyUserStats, GameGuess, GameSession, GameWord, PlayerStats
+from .scoring import ALL_CORRECT, from_feedback, score, score_guesses, score_many, to_feedback
+from .services import MAX_GUESSES, GameError, GuessError, get_hint, record_guess, start_game
+from .utils import generate_letter_feedback
+from .word_index import word_index
+
+# Routes the JSON API to the async views for the tests that need them.
+urlpatterns = [
+    path('api/daily-stats/', async_views.get_daily_stats, name='get_daily_stats'),
+    path('api/submit-guess/', async_views.submit_guess, name='submit_guess'),
+    path('api/leaderboard/', views.leaderboard, name='leaderboard'),
+]
+
+WRONG_GUESSES = ['BREAD', 'CLOUD', 'DRINK', 'FLAME', 'GHOST', 'PLANT', 'STORM', 'TRAIN']
+
+
+def create_game(username='player'):
+    user = CustomUser.objects.create_user(username, password='secret$1', role='player')
+    word = GameWord.objects.create(word='APPLE')
+    return user, GameSession.objects.create(user=user, word=word)
+
+
+class ScoringTests(SimpleTestCase):
+    """The scoring engine must agree with generate_letter_feedback everywhere."""
+
+    def assertMatchesReference(self, pairs):
+        for guess, target in pairs:
+            self.assertEqual(
+                to_feedback(guess, score(guess, target)),
+                generate_letter_feedback(guess, target),
+                f'guess={guess} target={target}'
+            )
+
+    def test_random_pairs(self):
+        rng = random.Random(0)
+        pairs = []
+        for _ in range(20000):
+            # Alternate between a full and a tiny alphabet so repeated letters
+            # (the interesting case for yellows) are well represented.
+            alphabet = string.ascii_uppercase if rng.random() < 0.5 else 'AEIST'
+            pairs.append((
+                ''.join(rng.choice(alphabet) for _ in range(5)),
+                ''.join(rng.choice(alphabet) for _ in range(5)),
+            ))
+        self.assertMatchesReference(pairs)
+
+    def test_every_pair_over_three_letters(self):
+        # Every guess against every target spelled from A-C covers each way
+        # letters can repeat across and within the two words.
+        words = [''.join(letters) for letters in itertools.product('ABC', repeat=5)]
+        self.assertMatchesReference(itertools.product(words, words))
+
+    def test_batch_helpers_match_score(self):
+        words = ['CRANE', 'SPEED', 'EERIE', 'ABBEY', 'LLAMA']
+        self.assertEqual(score_many('EERIE', words), [score('EERIE', word) for word in words])
+        self.assertEqual(score_guesses(words, 'SPEED'), [score(word, 'SPEED') for word in words])
+
+    def test_feedback_round_trip(self):
+        self.assertEqual(score('CRANE', 'CRANE'), ALL_CORRECT)
+        for guess, target in (('CRANE', 'REACT'), ('EERIE', 'SPEED'), ('LLAMA', 'ALPHA')):
+            code = score(guess, target)
+            self.assertEqual(from_feedback(to_feedback(guess, code)), code)
+
+
+class RecordGuessQueryTests(TestCase):
+    """Query budget of the guess pipeline; the counts include the savepoint
+    pair that ``transaction.atomic`` issues inside the test transaction."""
+
+    def setUp(self):
+        cache.clear()
+        self.user, self.session = create_game()
+
+    def test_locked_path(self):
+        with mock.patch.object(session_cache, 'get_cached_state', return_value=None):
+            # SAVEPOINT, SELECT ... FOR UPDATE, UPDATE session, INSERT guess, RELEASE.
+            with self.assertNumQueries(5):
+                result = record_guess(self.user, self.session.pk, 'BREAD')
+        self.assertEqual(result['guess_number'], 1)
+
+    def test_cached_path(self):
+        session_cache.get_cached_state(self.user)
+        # SAVEPOINT, guarded UPDATE session, INSERT guess, RELEASE.
+        with self.assertNumQueries(4):
+            result = record_guess(self.user, self.session.pk, 'BREAD')
+        self.assertEqual(result['guess_number'], 1)
+
+    def test_stale_cache_falls_back_to_locked_path(self):
+        session_cache.get_cached_state(self.user)
+        GameSession.objects.filter(pk=self.session.pk).update(guess_count=1)
+        result = record_guess(self.user, self.session.pk, 'BREAD')
+        self.assertEqual(result['guess_number'], 2)
+        self.assertEqual(GameSession.objects.get(pk=self.session.pk).guess_count, 2)
+
+
+@unittest.skipIf(connection.vendor == 'sqlite', 'needs row locks and concurrent connections')
+class ConcurrentGuessTests(TransactionTestCase):
+    def setUp(self):
+        cache.clear()
+        self.user, self.session = create_game()
+
+    def play_concurrently(self):
+        barrier = threading.Barrier(len(WRONG_GUESSES))
+        outcomes = []
+
+        def play(guess):
+            try:
+                barrier.wait()
+                record_guess(self.user, self.session.pk, guess)
+                outcomes.append('ok')
+            except GuessError:
+                outcomes.append('rejected')
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=play, args=(guess,)) for guess in WRONG_GUESSES]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        session = GameSession.objects.get(pk=self.session.pk)
+        self.assertEqual(outcomes.count('ok'), MAX_GUESSES)
+        self.assertEqual(outcomes.count('rejected'), len(WRONG_GUESSES) - MAX_GUESSES)
+        self.assertEqual(session.guess_count, MAX_GUESSES)
+        self.assertTrue(session.is_completed)
+        self.assertEqual(GameGuess.objects.filter(session=session).count(), MAX_GUESSES)
+
+    def test_parallel_guesses_respect_the_cap(self):
+        # Nothing cached: every guess takes the row-locking path.
+        with mock.patch.object(session_cache, 'get_cached_state', return_value=None):
+            self.play_concurrently()
+
+    def test_parallel_cached_guesses_respect_the_cap(self):
+        # Every thread starts from the same cached state, so all but one
+        # guarded UPDATE miss and fall back to the row-locking path.
+        state = session_cache.build_state(self.session, [])
+        with mock.patch.object(session_cache, 'get_cached_state', return_value=state):
+            self.play_concurrently()
+
+
+class DailyUserStatsTests(TestCase):
+    def test_report_for_a_win_without_a_counted_game(self):
+        # A game started before the rollups existed and won afterwards.
+        user = CustomUser.objects.create_user('player', password='secret$1', role='player')
+        today = timezone.localdate()
+        DailyUserStats.increment(today, user.pk, games_won=1)
+        report = DailyUserStats.get_reports(today).get()
+        self.assertEqual(report['correct_guesses'], 1)
+        self.assertIsNone(report['success_rate'])
+
+    def test_rebuild_rejects_empty_chunks(self):
+        for chunk_days in (0, -1):
+            with self.subTest(chunk_days=chunk_days), self.assertRaisesMessage(CommandError, '--chunk-days'):
+                call_command('rebuild_daily_stats', '--start', '2026-01-01', '--chunk-days', str(chunk_days))
+
+
+class QueryPlanTests(TestCase):
+    """The hot GameSession queries must be served by the indexes added for them."""
+
+    @classmethod
+    def setUpTestData(cls):
+        word = GameWord.objects.create(word='APPLE')
+        players = CustomUser.objects.bulk_create(
+            [CustomUser(username=f'planseed{i}', role='player') for i in range(200)]
+        )
+        if players[0].pk is None:
+            players = list(CustomUser.objects.filter(username__startswith='planseed'))
+        rng = random.Random(0)
+        sessions = []
+        for _ in range(5000):
+            completed = rng.random() < 0.97
+            sessions.append(GameSession(
+                user=rng.choice(players),
+                word=word,
+                is_completed=completed,
+                is_won=completed and rng.random() < 0.5,
+            ))
+        GameSession.objects.bulk_create(sessions, batch_size=1000)
+        # auto_now_add ignores explicit values, so spread the rows over the
+        # last 60 days afterwards.
+        now = timezone.now()
+        ids = list(GameSession.objects.order_by('pk').values_list('pk', flat=True))
+        per_day = len(ids) // 60
+        for day in range(60):
+            chunk = ids[day * per_day:(day + 1) * per_day]
+            GameSession.objects.filter(pk__gte=chunk[0], pk__lte=chunk[-1]).update(
+                created_at=now - timedelta(days=day, hours=rng.randrange(24))
+            )
+        cls.player = players[0]
+
+    def setUp(self):
+        with connection.cursor() as cursor:
+            for model in (CustomUser, GameSession):
+                cursor.execute(f'ANALYZE {model._meta.db_table}')
+            if connection.vendor == 'postgresql':
+                # The test tables are small; make the planner pick between indexes only.
+                cursor.execute('SET LOCAL enable_seqscan = off')
+
+    def assertUsesIndex(self, queryset, *indexes):
+        plan = queryset.explain()
+        self.assertTrue(any(index in plan for index in indexes), f'expected one of {indexes} in:\n{plan}')
+
+    def test_active_session_lookup(self):
+        self.assertUsesIndex(
+            GameSession.objects.filter(user=self.player, is_completed=False).order_by(),
+            'session_active_user_idx', 'session_user_done_created_idx',
+        )
+
+    def test_user_daily_sessions(self):
+        self.assertUsesIndex(
+            GameSession.get_user_daily_sessions(self.player, timezone.localdate()),
+            'session_user_done_created_idx',
+        )
+
+    def test_daily_stats(self):
+        yesterday = timezone.localdate() - timedelta(days=1)
+        self.assertUsesIndex(GameSession.get_sessions_for_date(yesterday), 'session_created_idx')
+        self.assertUsesIndex(GameSession.get_daily_user_reports(yesterday), 'session_created_idx')
+
+
+class QuotaTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user, session = create_game()
+        word_index.reload()
+        GameSession.objects.filter(pk=session.pk).update(is_completed=True)
+        GameSession.objects.bulk_create([
+            GameSession(user=self.user, word_id=session.word_id, is_completed=True)
+            for _ in range(quota.DAILY_GAME_LIMIT - 1)
+        ])
+        self.key = quota._key(self.user.pk, timezone.localdate())
+
+    @override_settings(SHARED_CACHE=True)
+    def test_start_game_ignores_a_stale_cached_count(self):
+        cache.set(self.key, 0)
+        self.assertEqual(quota.get_games_played(self.user), 0)
+        with self.assertRaisesMessage(GameError, 'Daily limit reached'):
+            start_game(self.user)
+        self.assertEqual(cache.get(self.key), quota.DAILY_GAME_LIMIT)
+        self.assertEqual(GameSession.objects.filter(user=self.user).count(), quota.DAILY_GAME_LIMIT)
+
+    @override_settings(SHARED_CACHE=False)
+    def test_per_process_cache_is_not_trusted(self):
+        cache.set(self.key, 0)
+        self.assertEqual(quota.get_games_played(self.user), quota.DAILY_GAME_LIMIT)
+
+
+class MetricsTests(SimpleTestCase):
+    def test_prometheus_series_carry_the_worker(self):
+        registry = MetricsRegistry()
+        registry.record('submit_guess', 0.004, QueryTracker())
+        lines = [line for line in registry.prometheus().splitlines() if not line.startswith('#')]
+        self.assertTrue(lines)
+        for line in lines:
+            self.assertIn(f'worker="{os.getpid()}"', line)
+
+    async def test_middleware_stays_async_in_an_async_chain(self):
+        async def get_response(request):
+            return HttpResponse()
+
+        middleware = RequestMetricsMiddleware(get_response)
+        self.assertTrue(asyncio.iscoroutinefunction(middleware))
+        registry.reset()
+        response = await middleware(RequestFactory().get('/'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(registry.totals['unresolved'].requests, 1)
+
+
+@override_settings(ROOT_URLCONF='game.tests')
+class AsyncMetricsTests(TransactionTestCase):
+    async def test_async_views_report_their_queries(self):
+        user = await async_views.run_db(CustomUser.objects.create_user)('player', password='secret$1', role='player')
+        client = AsyncClient()
+        await async_views.run_db(client.force_login)(user)
+        registry.reset()
+
+        response = await client.get('/api/daily-stats/')
+
+        self.assertEqual(response.status_code, 200)
+        stats = registry.totals['get_daily_stats']
+        self.assertEqual(stats.requests, 1)
+        # The user lookup and the quota COUNT both run on executor threads.
+        self.assertGreaterEqual(stats.sql_queries, 2)
+
+    async def test_sync_views_report_their_queries(self):
+        user = await async_views.run_db(CustomUser.objects.create_user)('player', password='secret$1', role='player')
+        client = AsyncClient()
+        await async_views.run_db(client.force_login)(user)
+        registry.reset()
+
+        response = await client.get('/api/leaderboard/')
+
+        self.assertEqual(response.status_code, 200)
+        # Session, user and the leaderboard itself, run on Django's sync thread.
+        self.assertGreaterEqual(registry.totals['leaderboard'].sql_queries, 3)
+
+
+@override_settings(ROOT_URLCONF='game.tests')
+class AsyncConcurrencyTests(TransactionTestCase):
+    async def test_requests_overlap(self):
+        # No middleware in the stack may pin requests to Django's single
+        # sync thread; five slow requests must run side by side.
+        user = await async_views.run_db(CustomUser.objects.create_user)('player', password='secret$1', role='player')
+        client = AsyncClient()
+        await async_views.run_db(client.force_login)(user)
+
+        def slow_quota_state(user):
+            time.sleep(0.5)
+            return {}
+
+        with mock.patch.object(async_views, 'get_quota_state', slow_quota_state):
+            started = time.perf_counter()
+            responses = await asyncio.gather(*(client.get('/api/daily-stats/') for _ in range(5)))
+            elapsed = time.perf_counter() - started
+
+        self.assertEqual([response.status_code for response in responses], [200] * 5)
+        self.assertLess(elapsed, 1.5)
+
+    @override_settings(WHITENOISE_USE_FINDERS=True)
+    async def test_static_files_are_served(self):
+        response = await AsyncClient().get('/static/css/base.css')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'{', b''.join(response.streaming_content))
+
+
+# Pages are rendered without running collectstatic first.
+@override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+class GameEventsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user, self.session = create_game()
+        self.client.force_login(self.user)
+
+    def test_disabled_by_default(self):
+        response = self.client.get(f'/api/session/{self.session.pk}/events/')
+        self.assertEqual(response.status_code, 404)
+        self.assertNotContains(self.client.get('/game/'), 'data-events-url')
+
+    @override_settings(GAME_EVENTS_ENABLED=True, GAME_EVENTS_STREAM_SECONDS=0)
+    def test_stream_when_enabled(self):
+        self.assertContains(self.client.get('/game/'), 'data-events-url')
+        response = self.client.get(f'/api/session/{self.session.pk}/events/')
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        self.assertIn(b'event: state', b''.join(response.streaming_content))
+
+
+@override_settings(
+    STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage',
+    GAME_EVENTS_ENABLED=True,
+)
+class AsgiGameEventsTests(TransactionTestCase):
+    async def test_refused_under_asgi(self):
+        user, session = await async_views.run_db(create_game)()
+        client = AsyncClient()
+        await async_views.run_db(client.force_login)(user)
+
+        response = await client.get(f'/api/session/{session.pk}/events/')
+        self.assertEqual(response.status_code, 404)
+        board = await client.get('/game/')
+        self.assertEqual(board.status_code, 200)
+        self.assertNotIn(b'data-events-url', board.content)
+
+
+@override_settings(ROOT_URLCONF='game.tests')
+class AsyncSubmitGuessTests(TransactionTestCase):
+    async def test_unknown_word_on_a_cold_word_index(self):
+        user, session = await async_views.run_db(create_game)()
+        client = AsyncClient()
+        await async_views.run_db(client.force_login)(user)
+        # A fresh worker (or a version bump) makes the index reload on next use.
+        word_index._version = None
+
+        response = await client.post(
+            '/api/submit-guess/', {'session_id': session.pk, 'guess': 'QQQQZ'}, content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'error': 'Not in word list'})
+
+
+class StartGameTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user, self.session = create_game()
+        word_index.reload()
+
+    def test_stale_no_active_session_marker(self):
+        # Another worker cached "no active game" before this one was started.
+        cache.set(session_cache._key(self.user.pk), session_cache.NO_ACTIVE_SESSION)
+        with self.assertRaisesMessage(GameError, 'You already have an active game'):
+            start_game(self.user)
+        self.assertEqual(GameSession.objects.filter(user=self.user).count(), 1)
+        self.assertIsNone(cache.get(session_cache._key(self.user.pk)))
+        self.assertEqual(session_cache.get_active_state(self.user)['id'], self.session.pk)
+
+
+class CachedModelBackendTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = CustomUser.objects.create_user('player', password='secret$1', role='player')
+        self.backend = CachedModelBackend()
+
+    @override_settings(SHARED_CACHE=True)
+    def test_shared_cache_serves_the_user(self):
+        self.backend.get_user(self.user.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.backend.get_user(self.user.pk), self.user)
+
+    @override_settings(SHARED_CACHE=False)
+    def test_per_process_cache_is_not_trusted(self):
+        self.backend.get_user(self.user.pk)
+        # Deactivated by another worker, whose signal never reaches this cache.
+        CustomUser.objects.filter(pk=self.user.pk).update(is_active=False)
+        with self.assertNumQueries(1):
+            self.assertIsNone(self.backend.get_user(self.user.pk))
+
+
+# Pages are rendered without running collectstatic first.
+@override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+class AdminChangelistTests(TestCase):
+    """Queries per changelist page stay flat as rows are added.
+
+    bench_admin_changelists covers the same pages at 1M rows for manual runs.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        admin = CustomUser.objects.create_superuser('admin', 'admin@example.com', 'secret$1')
+        words = [GameWord.objects.create(word=word) for word in WRONG_GUESSES]
+        # More rows than one page (100) of either list.
+        GameSession.objects.bulk_create(
+            GameSession(user=admin, word=words[i % len(words)], is_completed=True) for i in range(120)
+        )
+        GameGuess.objects.bulk_create(
+            GameGuess(session=session, word=word, feedback=generate_letter_feedback(word, session.word.word))
+            for session in GameSession.objects.select_related('word') for word in WRONG_GUESSES[:3]
+        )
+        cls.admin = admin
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def test_changelist_queries(self):
+        today = timezone.localdate()
+        past_week = f'created_at__gte={today - timedelta(days=7)}&created_at__lt={today + timedelta(days=1)}'
+        # Unfiltered pages on PostgreSQL also read the reltuples estimate.
+        unfiltered = 5 if connection.vendor == 'postgresql' else 4
+        for url in ('/admin/game/gamesession/', '/admin/game/gameguess/'):
+            for query, queries in (('', unfiltered), ('?p=1', unfiltered), ('?q=adm', 4), (f'?{past_week}', 4)):
+                with self.subTest(url=url + query), self.assertNumQueries(queries):
+                    response = self.client.get(url + query)
+                    self.assertEqual(response.status_code, 200)
+
+    def test_search_matches_prefixes(self):
+        cases = [
+            ('/admin/game/gamesession/', 'adm', 120),
+            ('/admin/game/gamesession/', 'min', 0),
+            ('/admin/game/gamesession/', 'bre', 15),
+            ('/admin/game/gamesession/', 'BRE', 15),
+            ('/admin/game/gameguess/', 'adm', 360),
+            ('/admin/game/gameguess/', 'bre', 0),
+        ]
+        for url, term, count in cases:
+            with self.subTest(url=url, term=term):
+                response = self.client.get(url, {'q': term})
+                self.assertEqual(response.context['cl'].result_count, count)
+
+    @unittest.skipUnless(connection.vendor == 'postgresql', 'needs the varchar_pattern_ops indexes')
+    def test_search_uses_the_pattern_indexes(self):
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+        for model, index in ((CustomUser, 'username'), (GameWord, 'word')):
+            term = 'adm' if model is CustomUser else 'bre'
+            queryset, _ = site._registry[GameSession].get_search_results(None, GameSession.objects.all(), term)
+            plan = queryset.explain()
+            with self.subTest(model=model.__name__):
+                self.assertRegex(plan, rf'{model._meta.db_table}_{index}_\w+_like', plan)
+
+
+class ExportTests(TransactionTestCase):
+    def setUp(self):
+        self.player, self.session = create_game()
+        self.admin = CustomUser.objects.create_user('boss', password='secret$1', role='admin')
+
+    def test_streams_under_wsgi(self):
+        self.client.force_login(self.admin)
+        response = self.client.get('/api/export/?kind=sessions')
+        self.assertTrue(response.streaming)
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[1].startswith(f'{self.session.pk},'))
+
+    async def test_exports_under_asgi(self):
+        client = AsyncClient()
+        await async_views.run_db(client.force_login)(self.admin)
+        response = await client.get('/api/export/?kind=sessions')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="sessions.csv"')
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[1].startswith(f'{self.session.pk},'))
+
+
+# Pages are rendered without running collectstatic first.
+@override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+class ActiveStateTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user, self.session = create_game()
+        self.client.force_login(self.user)
+        # Cache the game as active, then finish it the way another worker's
+        # cache would never hear about.
+        session_cache.get_cached_state(self.user)
+        GameSession.objects.filter(pk=self.session.pk).update(is_completed=True, guess_count=MAX_GUESSES)
+
+    @override_settings(SHARED_CACHE=False)
+    def test_per_process_cache_is_not_trusted(self):
+        state = self.client.get(f'/api/session/{self.session.pk}/').json()
+        self.assertTrue(state['is_completed'])
+        self.assertEqual(state['remaining_guesses'], 0)
+        response = self.client.get(f'/api/session/{self.session.pk}/hint/')
+        self.assertEqual(response.status_code, 400)
+        self.assertIsNone(self.client.get('/game/').context['active_session'])
+
+    @override_settings(SHARED_CACHE=True)
+    def test_shared_cache_serves_the_state(self):
+        with self.assertNumQueries(0):
+            state = session_cache.get_active_state(self.user)
+        self.assertEqual(state['id'], self.session.pk)
+
+
+class PlayerStatsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.word = GameWord.objects.create(word='APPLE')
+
+    def play(self, user, guesses):
+        session = GameSession.objects.create(user=user, word=self.word)
+        for guess in guesses:
+            record_guess(user, session.pk, guess)
+        return session
+
+    def snapshot(self):
+        return list(PlayerStats.objects.order_by('user_id').values_list(
+            'user_id', 'games_played', 'games_won', 'current_streak', 'best_streak',
+            'wins_1', 'wins_2', 'wins_3', 'wins_4', 'wins_5', 'last_completed_at',
+        ))
+
+    def test_incremental_rows_match_a_rebuild(self):
+        alice = CustomUser.objects.create_user('alice', password='secret$1', role='player')
+        bob = CustomUser.objects.create_user('bob', password='secret$1', role='player')
+        self.play(alice, ['APPLE'])
+        self.play(alice, ['BREAD', 'APPLE'])
+        self.play(alice, WRONG_GUESSES[:MAX_GUESSES])
+        self.play(alice, ['BREAD', 'CLOUD', 'APPLE'])
+        self.play(bob, WRONG_GUESSES[:MAX_GUESSES])
+        self.play(bob, WRONG_GUESSES[:4] + ['APPLE'])
+        self.play(bob, ['BREAD'])
+        call_command('reap_sessions', '--ttl-hours', '0', stdout=io.StringIO())
+
+        incremental = self.snapshot()
+        self.assertEqual(len(incremental), 2)
+        PlayerStats.rebuild()
+        self.assertEqual(self.snapshot(), incremental)
+
+    def test_legacy_games_over_the_cap(self):
+        user = CustomUser.objects.create_user('player', password='secret$1', role='player')
+        session = GameSession.objects.create(user=user, word=self.word)
+        GameSession.objects.filter(pk=session.pk).update(
+            is_completed=True, is_won=True, guess_count=MAX_GUESSES + 2, completed_at=timezone.now()
+        )
+        PlayerStats.rebuild()
+        self.assertEqual(PlayerStats.objects.get(user=user).distribution, [0, 0, 0, 0, 1])
+
+        PlayerStats.objects.all().delete()
+        migration = importlib.import_module('game.migrations.0006_player_stats')
+        migration.backfill_player_stats(apps, None)
+        self.assertEqual(PlayerStats.objects.get(user=user).distribution, [0, 0, 0, 0, 1])
+
+
+class SolverTests(TestCase):
+    def test_filter_matches_rescoring(self):
+        with open(settings.ACCEPTED_GUESSES_PATH) as handle:
+            words = sorted({line.strip().upper() for line in handle if line.strip()})
+        index = solver.CandidateIndex(words)
+        rng = random.Random(0)
+        pairs = [('MUMMY', 'ABOVE'), ('SPEED', 'ERASE'), ('LLAMA', 'ALLAY')]
+        pairs += [(rng.choice(words), rng.choice(words)) for _ in range(100)]
+        for guess, target in pairs:
+            history = [(guess, score(guess, target))]
+            if rng.random() < 0.5:
+                second = rng.choice(words)
+                history.append((second, score(second, target)))
+            expected = [word for word in words if all(score(g, word) == code for g, code in history)]
+            self.assertEqual(index.words_in(index.filter(history)), expected, history)
+
+    def test_hints_are_cached(self):
+        cache.clear()
+        user, session = create_game()
+        word_index.reload()
+        record_guess(user, session.pk, 'BREAD')
+        with mock.patch.object(solver, 'best_guess', wraps=solver.best_guess) as search:
+            first = get_hint(user, session.pk)
+            second = get_hint(user, session.pk)
+        self.assertEqual(first, second)
+        self.assertEqual(search.call_count, 1)
@@ -1,14 +1,27 @@
+from django.conf import settings
 from django.urls import path
 from . import views
 
+if settings.ASYNC_API:
+    from . import async_views as api_views
+else:
+    api_views = views
+
 urlpatterns = [
     path('', views.home, name='home'),
     path('login/', views.login_view, name='login'),
     path('register/', views.register_view, name='register'),
     path('game/', views.game_board, name='game_board'),
     path('admin/', views.admin_dashboard, name='admin_dashboard'),
-    path('api/start-game/', views.start_new_game, name='start_new_game'),
-    path('api/submit-guess/', views.submit_guess, name='submit_guess'),
-    path('api/session/<int:session_id>/', views.get_session_data, name='get_session_data'),
-    path('api/daily-stats/', views.get_daily_stats, name='get_daily_stats'),
+    path('api/start-game/', api_views.start_new_game, name='start_new_game'),
+    path('api/submit-guess/', api_views.submit_guess, name='submit_guess'),
+    path('api/session/<int:session_id>/', api_views.get_session_data, name='get_session_data'),
+    path('api/session/<int:session_id>/hint/', api_views.session_hint, name='session_hint'),
+    path('api/session/<int:session_id>/events/', views.session_events, name='session_events'),
+    path('api/leaderboard/', api_views.leaderboard, name='leaderboard'),
+    path('api/score-batch/', views.score_batch, name='score_batch'),
+    path('api/daily-stats/', api_views.get_daily_stats, name='get_daily_stats'),
+    path('api/export/', views.export_games, name='export_games'),
+    path('api/metrics/', views.metrics_json, name='metrics_json'),
+    path('metrics', views.metrics_prometheus, name='metrics_prometheus'),
 ]
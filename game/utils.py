@@ -1,5 +1,11 @@
 import re
-from typing import List, Dict, Any
+from datetime import datetime, time, timedelta
+from typing import Any, Dict, Iterable, List, Sequence
+
+from django.utils import timezone
+
+from .feedback_matrix import feedback_codes
+from .scoring import ALL_CORRECT, to_feedback
 
 def validate_username(username: str) -> bool:
     return len(username) >= 5 and re.match(r'^[a-zA-Z]+$', username) is not None
@@ -64,5 +70,46 @@ def generate_letter_feedback(guess: str, target_word: str) -> List[Dict[str, Any
     
     return feedback
 
+MAX_BATCH_SIZE = 5000
+
+def score_batch(pairs: Iterable[Sequence[str]], include_feedback: bool = False) -> List[Dict[str, Any]]:
+    """Validate and score many (guess, target) pairs in one call.
+
+    Pairs are grouped by guess so each guess reads its feedback-matrix row
+    once; the results keep the input order.
+    """
+    results: List[Dict[str, Any]] = []
+    by_guess: Dict[str, List[int]] = {}
+    for index, (guess, target) in enumerate(pairs):
+        guess = str(guess).upper()
+        target = str(target).upper()
+        valid = validate_word(guess) and validate_word(target)
+        results.append({'guess': guess, 'target': target, 'valid': valid})
+        if valid:
+            by_guess.setdefault(guess, []).append(index)
+
+    for guess, indexes in by_guess.items():
+        codes = feedback_codes(guess, [results[index]['target'] for index in indexes])
+        for index, code in zip(indexes, codes):
+            _fill_result(results[index], code, include_feedback)
+    return results
+
+def score_batch_against(guesses: Iterable[str], target: str, include_feedback: bool = False) -> List[Dict[str, Any]]:
+    """Score many guesses against one hidden ``target``; the target is not echoed back."""
+    results = score_batch(((guess, target) for guess in guesses), include_feedback)
+    for result in results:
+        del result['target']
+    return results
+
+def _fill_result(result: Dict[str, Any], code: int, include_feedback: bool) -> None:
+    result['code'] = code
+    result['is_correct'] = code == ALL_CORRECT
+    if include_feedback:
+        result['feedback'] = to_feedback(result['guess'], code)
+
 def is_word_correct(guess: str, target_word: str) -> bool:
     return guess == target_word
+
+def day_bounds(date):
+    start = timezone.make_aware(datetime.combine(date, time.min))
+    return start, start + timedelta(days=1)
@@ -1,17 +1,27 @@
-from django.shortcuts import render, redirect, get_object_or_404
+from django.shortcuts import render, redirect
 from django.contrib.auth import login, authenticate
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.http import JsonResponse
+from django.core.paginator import Paginator
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.db import close_old_connections
+from django.http import FileResponse, Http404, HttpResponse, JsonResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.utils import timezone
 from django.db.models import Q
 import json
+import time
 from datetime import date, datetime
 
-from .models import CustomUser, GameWord, GameSession, GameGuess
-from .utils import validate_username, validate_password, validate_word, generate_letter_feedback, is_word_correct
+from . import quota, session_cache
+from .dictionary import is_accepted_guess
+from .events import format_sse, get_backend, session_channel
+from .metrics import registry
+from .models import CustomUser, DailyStats, DailyUserStats, GameSession
+from .services import LEADERBOARD_SIZE, GameError, get_hint, get_leaderboard, get_quota_state, get_session_state, record_guess, start_game
+from .utils import MAX_BATCH_SIZE, score_batch as score_batch_pairs, score_batch_against, validate_username, validate_password, validate_word
 
 def home(request):
     if request.user.is_authenticated:
@@ -70,19 +80,15 @@ def register_view(request):
 
 @login_required
 def game_board(request):
-    today = timezone.now().date()
-    daily_sessions = GameSession.get_user_daily_sessions(request.user, today)
-    can_play_today = daily_sessions.count() < 3
+    games_played = quota.get_games_played(request.user)
     
-    active_session = GameSession.objects.filter(
-        user=request.user,
-        is_completed=False
-    ).first()
+    active_session = session_cache.get_active_state(request.user)
     
     context = {
-        'can_play_today': can_play_today,
-        'daily_games_played': daily_sessions.count(),
+        'can_play_today': games_played < quota.DAILY_GAME_LIMIT,
+        'daily_games_played': games_played,
         'active_session': active_session,
+        'events_enabled': events_available(request),
     }
     
     return render(request, 'game/game_board.html', context)
@@ -92,33 +98,10 @@ def start_new_game(request):
     if request.method != 'POST':
         return JsonResponse({'error': 'Method not allowed'}, status=405)
     
-    active_session = GameSession.objects.filter(
-        user=request.user,
-        is_completed=False
-    ).first()
-    
-    if active_session:
-        return JsonResponse({'error': 'You already have an active game. Please complete it first.'}, status=400)
-    
-    today = timezone.now().date()
-    daily_sessions = GameSession.get_user_daily_sessions(request.user, today)
-    if daily_sessions.count() >= 3:
-        return JsonResponse({'error': 'Daily limit reached'}, status=400)
-    
-    word = GameWord.get_random_word()
-    if not word:
-        return JsonResponse({'error': 'No words available'}, status=500)
-    
-    session = GameSession.objects.create(
-        user=request.user,
-        word=word
-    )
-    
-    return JsonResponse({
-        'success': True,
-        'session_id': session.id,
-        'word_length': 5
-    })
+    try:
+        return JsonResponse(start_game(request.user))
+    except GameError as e:
+        return JsonResponse({'error': e.message}, status=e.status)
 
 @login_required
 @csrf_exempt
@@ -134,51 +117,31 @@ def submit_guess(request):
         if not validate_word(guess):
             return JsonResponse({'error': 'Invalid word format'}, status=400)
         
-        session = get_object_or_404(GameSession, id=session_id, user=request.user)
-        
-        if session.is_completed:
-            return JsonResponse({'error': 'Game session completed'}, status=400)
+        if not is_accepted_guess(guess):
+            return JsonResponse({'error': 'Not in word list'}, status=400)
         
-        if len(session.guesses) >= 5:
-            return JsonResponse({'error': 'Maximum guesses reached'}, status=400)
-        
-        feedback = generate_letter_feedback(guess, session.word.word)
-        is_correct = is_word_correct(guess, session.word.word)
-        
-        GameGuess.objects.create(
-            session=session,
-            word=guess,
-            feedback=feedback,
-            is_correct=is_correct
-        )
-        
-        session.guesses.append(guess)
-        session.save()
-        
-        if is_correct:
-            session.is_completed = True
-            session.is_won = True
-            session.completed_at = timezone.now()
-            session.save()
-        elif len(session.guesses) >= 5:
-            session.is_completed = True
-            session.is_won = False
-            session.completed_at = timezone.now()
-            session.save()
-        
-        return JsonResponse({
-            'success': True,
-            'feedback': feedback,
-            'is_correct': is_correct,
-            'is_completed': session.is_completed,
-            'is_won': session.is_won,
-            'remaining_guesses': 5 - len(session.guesses),
-            'correct_word': session.word.word if session.is_completed and not session.is_won else None
-        })
+        return JsonResponse(record_guess(request.user, session_id, guess))
         
+    except GameError as e:
+        return JsonResponse({'error': e.message}, status=e.status)
+    except Http404:
+        return JsonResponse({'error': 'Game session not found'}, status=404)
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
 
+@login_required
+def leaderboard(request):
+    try:
+        limit = int(request.GET.get('limit', LEADERBOARD_SIZE))
+        return JsonResponse(get_leaderboard(request.user, limit))
+    except ValueError:
+        return JsonResponse({'error': 'limit must be a number'}, status=400)
+    except GameError as e:
+        return JsonResponse({'error': e.message}, status=e.status)
+
+REPORTS_PER_PAGE = 50
+REPORT_SORT_FIELDS = ('username', 'words_tried', 'correct_guesses', 'success_rate')
+
 @login_required
 def admin_dashboard(request):
     if request.user.role != 'admin':
@@ -190,25 +153,23 @@ def admin_dashboard(request):
     except ValueError:
         filter_date = timezone.now().date()
     
-    daily_stats = GameSession.get_daily_stats(filter_date)
-    
-    user_sessions = GameSession.objects.filter(created_at__date=filter_date)
-    user_reports = []
+    sort = request.GET.get('sort', 'username')
+    if sort.lstrip('-') not in REPORT_SORT_FIELDS:
+        sort = 'username'
     
-    for user in CustomUser.objects.filter(role='player'):
-        user_daily_sessions = user_sessions.filter(user=user)
-        if user_daily_sessions.exists():
-            correct_guesses = user_daily_sessions.filter(is_won=True).count()
-            user_reports.append({
-                'user': user,
-                'words_tried': user_daily_sessions.count(),
-                'correct_guesses': correct_guesses,
-                'success_rate': (correct_guesses / user_daily_sessions.count() * 100) if user_daily_sessions.count() > 0 else 0
-            })
+    if filter_date < timezone.localdate():
+        daily_stats = DailyStats.get_for_date(filter_date)
+        user_reports = DailyUserStats.get_reports(filter_date, ordering=(sort, 'user'))
+    else:
+        daily_stats = GameSession.get_daily_stats(filter_date)
+        user_reports = GameSession.get_daily_user_reports(filter_date, ordering=(sort, 'user'))
+    page = Paginator(user_reports, REPORTS_PER_PAGE).get_page(request.GET.get('page'))
     
     context = {
         'daily_stats': daily_stats,
-        'user_reports': user_reports,
+        'user_reports': page,
+        'page_obj': page,
+        'sort': sort,
         'selected_date': filter_date.isoformat(),
     }
     
@@ -216,32 +177,166 @@ def admin_dashboard(request):
 
 @login_required
 def get_session_data(request, session_id):
-    session = get_object_or_404(GameSession, id=session_id, user=request.user)
-    
-    guesses_data = []
-    for guess in session.game_guesses.all().order_by('created_at'):
-        guesses_data.append({
-            'word': guess.word,
-            'feedback': guess.feedback,
-            'is_correct': guess.is_correct
-        })
-    
-    return JsonResponse({
-        'session_id': session.id,
-        'guesses': guesses_data,
-        'is_completed': session.is_completed,
-        'is_won': session.is_won,
-        'remaining_guesses': 5 - len(session.guesses)
-    })
+    return JsonResponse(get_session_state(request.user, session_id))
+
+@login_required
+def session_hint(request, session_id):
+    try:
+        return JsonResponse(get_hint(request.user, session_id))
+    except GameError as e:
+        return JsonResponse({'error': e.message}, status=e.status)
 
 @login_required
 def get_daily_stats(request):
-    today = timezone.now().date()
-    daily_sessions = GameSession.get_user_daily_sessions(request.user, today)
-    
-    return JsonResponse({
-        'success': True,
-        'games_played': daily_sessions.count(),
-        'daily_limit': 3,
-        'can_play': daily_sessions.count() < 3
-    })
+    return JsonResponse(get_quota_state(request.user))
+
+@login_required
+@csrf_exempt
+def score_batch(request):
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    
+    try:
+        data = json.loads(request.body)
+    except ValueError:
+        return JsonResponse({'error': 'Invalid JSON'}, status=400)
+    if not isinstance(data, dict):
+        return JsonResponse({'error': 'Invalid JSON'}, status=400)
+    
+    include_feedback = bool(data.get('feedback', False))
+    session_id = data.get('session_id')
+    items = data.get('guesses') if session_id is not None else data.get('pairs')
+    if not isinstance(items, list):
+        return JsonResponse({'error': 'Expected a list of "pairs" or a "session_id" with "guesses"'}, status=400)
+    if len(items) > MAX_BATCH_SIZE:
+        return JsonResponse({'error': f'At most {MAX_BATCH_SIZE} items per batch'}, status=400)
+    
+    if session_id is None:
+        if not all(isinstance(pair, (list, tuple)) and len(pair) == 2 for pair in items):
+            return JsonResponse({'error': 'Each pair must be [guess, target]'}, status=400)
+        results = score_batch_pairs(items, include_feedback)
+    else:
+        sessions = GameSession.objects.select_related('word').only('is_completed', 'word__word')
+        if request.user.role != 'admin':
+            sessions = sessions.filter(user=request.user)
+        session = sessions.filter(id=session_id).first()
+        if session is None:
+            return JsonResponse({'error': 'Game session not found'}, status=404)
+        # Scoring against a game that is still being played would leak the answer.
+        if not session.is_completed and request.user.role != 'admin':
+            return JsonResponse({'error': 'Game session is still in progress'}, status=400)
+        results = score_batch_against(items, session.word.word, include_feedback)
+    
+    return JsonResponse({'success': True, 'count': len(results), 'results': results})
+
+@login_required
+def export_games(request):
+    if request.user.role != 'admin':
+        return JsonResponse({'error': 'Forbidden'}, status=403)
+    
+    # Exports are rare; don't make every worker import csv/zlib at boot.
+    from . import export
+    
+    kind = request.GET.get('kind', 'sessions')
+    output_format = request.GET.get('format', 'csv')
+    compress = request.GET.get('gzip') in ('1', 'true')
+    if kind not in export.KINDS:
+        return JsonResponse({'error': f'kind must be one of {", ".join(export.KINDS)}'}, status=400)
+    if output_format not in export.FORMATS:
+        return JsonResponse({'error': f'format must be one of {", ".join(export.FORMATS)}'}, status=400)
+    
+    filters = {'user': request.GET.get('user') or None}
+    try:
+        for name in ('start', 'end'):
+            value = request.GET.get(name)
+            filters[name] = datetime.strptime(value, '%Y-%m-%d').date() if value else None
+    except ValueError:
+        return JsonResponse({'error': 'Dates must be YYYY-MM-DD'}, status=400)
+    
+    content_type = 'application/gzip' if compress else (
+        'text/csv; charset=utf-8' if output_format == 'csv' else 'application/x-ndjson')
+    chunks = export.export_stream(kind, output_format, compress=compress, **filters)
+    if isinstance(request, ASGIRequest):
+        # Under ASGI, Django 3.2 iterates streaming responses on the event
+        # loop, where the ORM cannot run; write the export to disk on this
+        # thread and send the file instead.
+        response = FileResponse(export.spool(chunks), content_type=content_type)
+    else:
+        response = StreamingHttpResponse(chunks, content_type=content_type)
+    filename = export.export_filename(kind, output_format, compress=compress, **filters)
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+EVENT_HEARTBEAT_SECONDS = 15
+
+def events_available(request):
+    # A stream blocks on its subscription between events. Under ASGI,
+    # Django 3.2 iterates sync streaming responses on the event loop, which
+    # that would freeze, so only WSGI (gthread) workers serve streams.
+    return settings.GAME_EVENTS_ENABLED and not isinstance(request, ASGIRequest)
+
+@login_required
+def session_events(request, session_id):
+    if not events_available(request):
+        raise Http404('Game events are disabled')
+    
+    subscription = get_backend().subscribe(session_channel(session_id))
+    try:
+        state = {
+            'session': get_session_state(request.user, session_id),
+            'quota': get_quota_state(request.user),
+        }
+    except Exception:
+        subscription.close()
+        raise
+    
+    # The stream can stay open for minutes; don't hold a database connection.
+    close_old_connections()
+    
+    response = StreamingHttpResponse(
+        stream_session_events(subscription, state),
+        content_type='text/event-stream'
+    )
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+def stream_session_events(subscription, state):
+    try:
+        yield format_sse('state', state)
+        if state['session']['is_completed']:
+            yield format_sse('end', {})
+            return
+        
+        deadline = time.monotonic() + settings.GAME_EVENTS_STREAM_SECONDS
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            item = subscription.get(timeout=min(EVENT_HEARTBEAT_SECONDS, remaining))
+            if item is None:
+                yield ': keepalive\n\n'
+                continue
+            event, data = item
+            yield format_sse(event, data)
+            if event == 'end':
+                return
+    finally:
+        subscription.close()
+
+@login_required
+def metrics_json(request):
+    if request.user.role != 'admin':
+        return JsonResponse({'error': 'Forbidden'}, status=403)
+    
+    return JsonResponse(registry.snapshot())
+
+def metrics_prometheus(request):
+    token = settings.METRICS_TOKEN
+    authorized = request.user.is_authenticated and request.user.role == 'admin'
+    if token and request.headers.get('Authorization') == f'Bearer {token}':
+        authorized = True
+    if not authorized:
+        return HttpResponse('Forbidden\n', status=403, content_type='text/plain')
+    
+    return HttpResponse(registry.prometheus(), content_type='text/plain; version=0.0.4')
@@ -0,0 +1,53 @@
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def warm_up():
+    """Load the per-process lookup tables up front instead of on first use.
+
+    Meant for the gunicorn master with ``preload_app`` (see gunicorn.conf.py):
+    tables built before the fork are shared copy-on-write by every worker.
+    Each step is optional; one that fails (for example because the database
+    is not reachable yet) is logged and left to load lazily. Returns the
+    seconds spent per step.
+    """
+    from .dictionary import accepted_guesses
+    from .feedback_matrix import get_matrix
+    from .solver import get_opening
+    from .word_index import word_index
+
+    steps = (
+        ('views', _import_views),
+        ('templates', _load_templates),
+        ('word_index', word_index.reload),
+        ('accepted_guesses', accepted_guesses.__len__),
+        ('feedback_matrix', get_matrix),
+        ('hint_opening', get_opening),
+    )
+    timings = {}
+    for name, step in steps:
+        start = time.perf_counter()
+        try:
+            step()
+        except Exception:
+            logger.warning('Warm-up step %s failed; it will load on first use.', name, exc_info=True)
+            continue
+        timings[name] = time.perf_counter() - start
+    return timings
+
+
+def _import_views():
+    from django.urls import get_resolver
+
+    # Resolving the URLconf imports every view module and the admin.
+    get_resolver().url_patterns
+
+
+def _load_templates():
+    from django.template.loader import get_template
+
+    # Only sticks with the cached template loader (CACHED_TEMPLATES).
+    for name in ('game/game_board.html', 'game/admin_dashboard.html'):
+        get_template(name)
@@ -0,0 +1,133 @@
+import random
+import threading
+import time
+from array import array
+
+from django.conf import settings
+from django.core.cache import cache
+
+VERSION_KEY = 'game:word_index:version'
+# Without a shared cache other workers' changes are invisible to the version
+# counter, so the index is reloaded from the database this often instead.
+UNSHARED_RELOAD_SECONDS = 60
+
+
+def get_shared_version():
+    cache.add(VERSION_KEY, 0, timeout=None)
+    return cache.get(VERSION_KEY, 0)
+
+
+def bump_shared_version():
+    try:
+        return cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, 1, timeout=None)
+        return 1
+
+
+class WordIndex:
+    """Process-local copy of the GameWord answer pool.
+
+    IDs live in a compact ``array`` and words in a parallel list so a random
+    pick is a single index operation. Local changes arrive through model
+    signals; changes made by other workers are detected through a version
+    counter kept in the cache, which triggers a reload.
+
+    The counter only reaches other workers when the cache is shared
+    (``SHARED_CACHE``, e.g. Redis or Memcached). With the default
+    local-memory cache each worker sees its own counter, so the index is
+    also reloaded every ``UNSHARED_RELOAD_SECONDS``: words added through the
+    admin reach the other workers within that interval rather than at once.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._ids = array('q')
+        self._words = []
+        self._positions = {}
+        self._members = set()
+        self._version = None
+        self._loaded_at = 0.0
+
+    def __len__(self):
+        self._ensure_fresh()
+        return len(self._ids)
+
+    def _ensure_fresh(self):
+        if self._version is None or self._version != get_shared_version():
+            self.reload()
+        elif not settings.SHARED_CACHE and time.monotonic() - self._loaded_at > UNSHARED_RELOAD_SECONDS:
+            self.reload()
+
+    def reload(self):
+        from .models import GameWord
+
+        with self._lock:
+            version = get_shared_version()
+            ids = array('q')
+            words = []
+            for word_id, word in GameWord.objects.order_by('id').values_list('id', 'word').iterator():
+                ids.append(word_id)
+                words.append(word)
+            self._ids = ids
+            self._words = words
+            self._positions = {word_id: position for position, word_id in enumerate(ids)}
+            self._members = set(words)
+            self._version = version
+            self._loaded_at = time.monotonic()
+
+    def random_entry(self):
+        self._ensure_fresh()
+        with self._lock:
+            if not self._ids:
+                return None
+            position = random.randrange(len(self._ids))
+            return self._ids[position], self._words[position]
+
+    def contains(self, word):
+        self._ensure_fresh()
+        return word in self._members
+
+    def entries(self):
+        self._ensure_fresh()
+        with self._lock:
+            return list(zip(self._ids, self._words))
+
+    def add(self, word_id, word):
+        with self._lock:
+            position = self._positions.get(word_id)
+            if position is None:
+                self._positions[word_id] = len(self._ids)
+                self._ids.append(word_id)
+                self._words.append(word)
+            else:
+                self._members.discard(self._words[position])
+                self._words[position] = word
+            self._members.add(word)
+        self._sync_version()
+
+    def remove(self, word_id):
+        with self._lock:
+            position = self._positions.pop(word_id, None)
+            if position is not None:
+                self._members.discard(self._words[position])
+                last = len(self._ids) - 1
+                if position != last:
+                    self._ids[position] = self._ids[last]
+                    self._words[position] = self._words[last]
+                    self._positions[self._ids[position]] = position
+                self._ids.pop()
+                self._words.pop()
+        self._sync_version()
+
+    def _sync_version(self):
+        new_version = bump_shared_version()
+        with self._lock:
+            if self._version is not None and new_version == self._version + 1:
+                self._version = new_version
+            else:
+                # Another process changed the pool as well; reload on next use.
+                self._version = None
+
+
+word_index = WordIndex()
@@ -21,8 +21,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'game.middleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'game.middleware.StaticFilesMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -33,12 +34,21 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = 'guess_the_word_django.urls'
 
+TEMPLATE_LOADERS = [
+    'django.template.loaders.filesystem.Loader',
+    'django.template.loaders.app_directories.Loader',
+]
+
+# Compile templates once per process instead of on every render. Defaults to
+# on whenever DEBUG is off and can be forced either way from the environment.
+CACHED_TEMPLATES = config('CACHED_TEMPLATES', default=not DEBUG, cast=bool)
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [BASE_DIR / 'templates'],
-        'APP_DIRS': True,
         'OPTIONS': {
+            'loaders': [('django.template.loaders.cached.Loader', TEMPLATE_LOADERS)] if CACHED_TEMPLATES else TEMPLATE_LOADERS,
             'context_processors': [
                 'django.template.context_processors.debug',
                 'django.template.context_processors.request',
@@ -51,6 +61,10 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'guess_the_word_django.wsgi.application'
 
+# Serve the JSON API from the async views in game/async_views.py; only
+# useful when running under ASGI (see the README).
+ASYNC_API = config('ASYNC_API', default=False, cast=bool)
+
 DATABASES = {
     'default': dj_database_url.config(
         default=config('DATABASE_URL', default=f'sqlite:///{BASE_DIR / "db.sqlite3"}')
@@ -97,3 +111,53 @@ LOGOUT_REDIRECT_URL = '/login/'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 AUTH_USER_MODEL = 'game.CustomUser'
+
+# Several workers need a shared cache (e.g. Redis) for the cached sessions,
+# users and game state to stay coherent; the default is per process.
+CACHE_BACKEND = config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache')
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKEND,
+        'LOCATION': config('CACHE_LOCATION', default=''),
+    }
+}
+
+# Whether every worker sees the same cache. Anything that relies on the cache
+# for cross-worker coherence checks this; local-memory and dummy caches are
+# per process, so it is off for them unless forced.
+SHARED_CACHE = config('SHARED_CACHE', default=CACHE_BACKEND not in (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+), cast=bool)
+
+# Cached sessions and users are only coherent when every worker sees the same
+# cache; otherwise a logout or a password change would not reach the others.
+SESSION_ENGINE = config(
+    'SESSION_ENGINE',
+    default='game.session_backend' if SHARED_CACHE else 'django.contrib.sessions.backends.db',
+)
+
+# Both stay listed so sessions created under either one keep working when
+# SHARED_CACHE changes; the first one is used for new logins.
+AUTHENTICATION_BACKENDS = [
+    'game.auth_backends.CachedModelBackend',
+    'django.contrib.auth.backends.ModelBackend',
+]
+if not SHARED_CACHE:
+    AUTHENTICATION_BACKENDS.reverse()
+
+FEEDBACK_MATRIX_PATH = config('FEEDBACK_MATRIX_PATH', default=str(BASE_DIR / 'feedback_matrix.bin'))
+
+ACCEPTED_GUESSES_PATH = config('ACCEPTED_GUESSES_PATH', default=str(BASE_DIR / 'game' / 'data' / 'accepted_guesses.txt'))
+
+REQUEST_METRICS_SAMPLE_RATE = config('REQUEST_METRICS_SAMPLE_RATE', default=1.0, cast=float)
+METRICS_TOKEN = config('METRICS_TOKEN', default='')
+
+# Push game updates to the board over Server-Sent Events. Each open stream
+# holds a worker thread for up to GAME_EVENTS_STREAM_SECONDS, which a sync
+# gunicorn worker cannot afford (gunicorn.conf.py switches to gthread workers
+# when this is on). Without it, or under ASGI, the board fetches state with
+# plain requests.
+GAME_EVENTS_ENABLED = config('GAME_EVENTS_ENABLED', default=False, cast=bool)
+GAME_EVENTS_BACKEND = config('GAME_EVENTS_BACKEND', default='game.events.LocalEventBackend')
+GAME_EVENTS_STREAM_SECONDS = config('GAME_EVENTS_STREAM_SECONDS', default=300, cast=int)
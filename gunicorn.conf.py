@@ -0,0 +1,35 @@
+# Picked up automatically by gunicorn when started from this directory
+# (the Procfile does). Loading the app in the master lets the word index,
+# accepted-guess list and feedback matrix be built once and shared
+# copy-on-write by every worker, so recycled workers start warm.
+import gc
+
+import decouple
+
+preload_app = True
+
+# A Server-Sent Events stream stays open for minutes. A sync worker would
+# be blocked (and killed by the timeout) while serving one; gthread workers
+# keep heartbeating and serve other requests on their remaining threads.
+if decouple.config('GAME_EVENTS_ENABLED', default=False, cast=bool):
+    worker_class = 'gthread'
+    threads = decouple.config('GUNICORN_THREADS', default=32, cast=int)
+
+
+def when_ready(server):
+    from django.db import connections
+
+    from game.warmup import warm_up
+
+    timings = warm_up()
+    server.log.info('Warmed up: %s', ', '.join(f'{name} {seconds * 1000:.0f}ms' for name, seconds in timings.items()))
+    # Workers must not inherit the master's database connections.
+    connections.close_all()
+    # Keep the collector from touching (and so copying) the preloaded objects in each worker.
+    gc.freeze()
+
+
+def pre_fork(server, worker):
+    from django.db import connections
+
+    connections.close_all()
@@ -0,0 +1,562 @@
+// URLs and the active session come from data attributes on #gameConfig.
+const gameConfig = document.getElementById('gameConfig').dataset;
+let currentSessionId = null;
+let currentGuessCount = 0;
+let gameCompleted = false;
+let gameResultModal = null;
+let sessionEvents = null;
+
+// Animation and notification functions
+function createConfetti() {
+    const colors = ['#ff6b6b', '#4ecdc4', '#45b7d1', '#f9ca24', '#6c5ce7'];
+    for (let i = 0; i < 50; i++) {
+        const confetti = document.createElement('div');
+        confetti.className = 'confetti';
+        confetti.style.left = Math.random() * 100 + 'vw';
+        confetti.style.animationDelay = Math.random() * 3 + 's';
+        confetti.style.background = colors[Math.floor(Math.random() * colors.length)];
+        document.body.appendChild(confetti);
+        
+        setTimeout(() => {
+            confetti.remove();
+        }, 3000);
+    }
+}
+
+function showNotification(message, type = 'info', duration = 3000) {
+    const notification = document.createElement('div');
+    notification.className = `notification ${type}`;
+    notification.innerHTML = `
+        <div class="d-flex align-items-center">
+            <i class="bi bi-${type === 'success' ? 'check-circle' : type === 'error' ? 'x-circle' : 'info-circle'} me-2"></i>
+            <span>${message}</span>
+        </div>
+    `;
+    
+    document.body.appendChild(notification);
+    
+    setTimeout(() => {
+        notification.style.animation = 'fade-out-notification 0.3s ease-out';
+        setTimeout(() => notification.remove(), 300);
+    }, duration);
+}
+
+function setButtonLoading(button, isLoading) {
+    if (isLoading) {
+        button.classList.add('btn-loading');
+        button.disabled = true;
+        const originalText = button.innerHTML;
+        button.setAttribute('data-original-text', originalText);
+        button.innerHTML = '<div class="loading-spinner"></div><span class="btn-text" style="opacity: 0;">Loading...</span>';
+    } else {
+        button.classList.remove('btn-loading');
+        button.disabled = false;
+        const originalText = button.getAttribute('data-original-text');
+        if (originalText) {
+            button.innerHTML = originalText;
+        }
+    }
+}
+
+function applyDailyStats(data, announce = true) {
+    if (data.success) {
+        const gamesPlayedElement = document.querySelector('.stats-card h4');
+        if (gamesPlayedElement) {
+            // Add animation to the counter
+            gamesPlayedElement.style.transform = 'scale(1.2)';
+            gamesPlayedElement.style.color = '#ff6b6b';
+            gamesPlayedElement.textContent = data.games_played;
+            
+            setTimeout(() => {
+                gamesPlayedElement.style.transform = 'scale(1)';
+                gamesPlayedElement.style.color = '';
+            }, 300);
+        }
+        
+        if (!announce) return;
+        
+        // Update the daily limit warning if needed
+        if (data.games_played >= 3) {
+            const startGameBtn = document.getElementById('startGameBtn');
+            if (startGameBtn) {
+                startGameBtn.disabled = true;
+                startGameBtn.innerHTML = '<i class="bi bi-lock me-2"></i>Daily Limit Reached';
+            }
+            
+            // Show warning notification
+            showNotification('🚫 Daily limit reached! Come back tomorrow!', 'warning', 5000);
+        } else if (data.games_played === 2) {
+            // Show warning when approaching limit
+            showNotification('⚠️ Last game of the day! Make it count!', 'warning', 3000);
+        }
+    }
+}
+
+function updateDailyGamesCount() {
+    fetch(gameConfig.dailyStatsUrl)
+    .then(response => response.json())
+    .then(data => applyDailyStats(data))
+    .catch(error => {
+        console.error('Error fetching daily stats:', error);
+    });
+}
+
+// With GAME_EVENTS_ENABLED the server pushes the game over Server-Sent
+// Events; otherwise the state is fetched once and kept up to date from the
+// submit-guess responses.
+function loadSession() {
+    if (!currentSessionId) return;
+    if (gameConfig.eventsUrl && window.EventSource) {
+        connectSessionEvents();
+    } else {
+        loadSessionData();
+    }
+}
+
+function loadSessionData() {
+    fetch(gameConfig.sessionUrl.replace('/0/', `/${currentSessionId}/`))
+    .then(response => response.json())
+    .then(data => applySessionState(data))
+    .catch(error => {
+        console.error('Error loading session:', error);
+    });
+}
+
+// Events: an initial "state" snapshot, then "guess" and finally "end".
+function connectSessionEvents() {
+    if (sessionEvents) sessionEvents.close();
+    
+    sessionEvents = new EventSource(gameConfig.eventsUrl.replace('/0/', `/${currentSessionId}/`));
+    
+    sessionEvents.addEventListener('state', event => {
+        const data = JSON.parse(event.data);
+        applySessionState(data.session);
+        applyDailyStats(data.quota, false);
+    });
+    
+    sessionEvents.addEventListener('guess', event => {
+        const data = JSON.parse(event.data);
+        if (renderGuess(data.word, data) && data.is_completed) {
+            finishGame();
+        }
+    });
+    
+    sessionEvents.addEventListener('end', () => {
+        sessionEvents.close();
+        sessionEvents = null;
+    });
+}
+
+function renderGuess(word, data) {
+    // Guesses can arrive both as the submit response and as a pushed event;
+    // draw each row once.
+    if (data.guess_number <= currentGuessCount) return false;
+    displayGuess(word, data.feedback, data.guess_number - 1);
+    currentGuessCount = data.guess_number;
+    document.getElementById('attemptsCount').textContent = currentGuessCount;
+    return true;
+}
+
+function finishGame() {
+    if (gameCompleted) return;
+    gameCompleted = true;
+    document.getElementById('guessInput').disabled = true;
+    document.getElementById('submitGuessBtn').disabled = true;
+    
+    // The game now counts against the daily limit.
+    updateDailyGamesCount();
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+    const startGameBtn = document.getElementById('startGameBtn');
+    const newGameBtn = document.getElementById('newGameBtn');
+    const resumeGameBtn = document.getElementById('resumeGameBtn');
+    const guessInput = document.getElementById('guessInput');
+    const submitGuessBtn = document.getElementById('submitGuessBtn');
+    gameResultModal = new bootstrap.Modal(document.getElementById('gameResultModal'));
+
+    if (startGameBtn) {
+        startGameBtn.addEventListener('click', startNewGame);
+    }
+
+    if (newGameBtn) {
+        newGameBtn.addEventListener('click', startNewGame);
+    }
+
+    if (resumeGameBtn) {
+        resumeGameBtn.addEventListener('click', resumeGame);
+    }
+
+    if (guessInput) {
+        guessInput.addEventListener('input', function(e) {
+            e.target.value = e.target.value.toUpperCase().replace(/[^A-Z]/g, '');
+        });
+
+        guessInput.addEventListener('keypress', function(e) {
+            if (e.key === 'Enter' && e.target.value.length === 5) {
+                submitGuess();
+            }
+        });
+    }
+
+    if (submitGuessBtn) {
+        submitGuessBtn.addEventListener('click', submitGuess);
+    }
+
+    if (gameConfig.activeSessionId) {
+        currentSessionId = parseInt(gameConfig.activeSessionId, 10);
+        loadSession();
+    }
+});
+
+function resumeGame() {
+    console.log('Resume game clicked');
+    // Hide the resume button and show the game board
+    const resumeGameBtn = document.getElementById('resumeGameBtn');
+    if (resumeGameBtn) {
+        resumeGameBtn.style.display = 'none';
+    }
+    
+    // Show game elements
+    document.getElementById('gameStatus').style.display = 'block';
+    document.getElementById('gameBoard').style.display = 'block';
+    document.getElementById('gameControls').style.display = 'block';
+    document.getElementById('guessInput').disabled = false;
+    document.getElementById('submitGuessBtn').disabled = false;
+    
+    // Load the existing session data
+    if (!sessionEvents) loadSession();
+    
+    showNotification('🎮 Game resumed! Continue where you left off.', 'info');
+}
+
+function startNewGame() {
+    console.log('Start new game clicked');
+    const csrfToken = document.querySelector('[name=csrfmiddlewaretoken]');
+    const startGameBtn = document.getElementById('startGameBtn');
+    const newGameBtn = document.getElementById('newGameBtn');
+    
+    // Show loading animation
+    if (startGameBtn) setButtonLoading(startGameBtn, true);
+    if (newGameBtn) setButtonLoading(newGameBtn, true);
+    
+    fetch(gameConfig.startGameUrl, {
+        method: 'POST',
+        headers: {
+            'X-CSRFToken': csrfToken ? csrfToken.value : '',
+            'Content-Type': 'application/json',
+        },
+    })
+    .then(async response => {
+        console.log('Response status:', response.status);
+        const redirectedToLogin = response.url.includes('/login');
+        const contentType = response.headers.get('content-type') || '';
+        let data = null;
+        if (contentType.includes('application/json')) {
+            try { data = await response.json(); } catch (e) { data = null; }
+        }
+
+        if (redirectedToLogin) {
+            showNotification('🔒 Session expired. Please log in again.', 'warning', 4000);
+            setTimeout(() => { window.location.href = '/login/?next=/game/'; }, 500);
+            throw new Error('Redirected to login');
+        }
+
+        if (!response.ok) {
+            const errMsg = data && data.error ? data.error : `Request failed (HTTP ${response.status})`;
+            throw new Error(errMsg);
+        }
+
+        if (!data) {
+            throw new Error('Unexpected server response');
+        }
+
+        return data;
+    })
+    .then(data => {
+        console.log('Response data:', data);
+        if (data.success) {
+            currentSessionId = data.session_id;
+            currentGuessCount = 0;
+            gameCompleted = false;
+            clearGameBoard();
+            
+            // Hide the start button and show the game board
+            if (startGameBtn) {
+                startGameBtn.style.display = 'none';
+            }
+            
+            // Show game elements with animation
+            document.getElementById('gameStatus').style.display = 'block';
+            document.getElementById('gameBoard').style.display = 'block';
+            document.getElementById('gameControls').style.display = 'block';
+            document.getElementById('guessInput').disabled = false;
+            document.getElementById('submitGuessBtn').disabled = false;
+            document.getElementById('attemptsCount').textContent = '0';
+            
+            loadSession();
+            
+            // Focus on input with animation
+            const input = document.getElementById('guessInput');
+            input.focus();
+            input.classList.add('success-pulse');
+            setTimeout(() => input.classList.remove('success-pulse'), 500);
+            
+            showNotification('🎮 New game started! Good luck!', 'success');
+        } else {
+            showNotification(`❌ ${data.error}`, 'error');
+        }
+    })
+    .catch(error => {
+        console.error('Error:', error);
+        if (String(error.message).includes('Redirected to login')) return;
+        showNotification(`❌ ${error.message || 'Connection error. Please try again.'}`, 'error');
+    })
+    .finally(() => {
+        // Remove loading animation
+        if (startGameBtn) setButtonLoading(startGameBtn, false);
+        if (newGameBtn) setButtonLoading(newGameBtn, false);
+    });
+}
+
+function submitGuess() {
+    const guess = document.getElementById('guessInput').value;
+    const submitBtn = document.getElementById('submitGuessBtn');
+    
+    if (guess.length !== 5) {
+        showNotification('⚠️ Please enter a 5-letter word.', 'warning');
+        // Shake animation for input
+        const input = document.getElementById('guessInput');
+        input.classList.add('shake');
+        setTimeout(() => input.classList.remove('shake'), 500);
+        return;
+    }
+
+    if (gameCompleted) {
+        return;
+    }
+
+    // Show loading animation
+    setButtonLoading(submitBtn, true);
+
+    fetch(gameConfig.submitGuessUrl, {
+        method: 'POST',
+        headers: {
+            'X-CSRFToken': document.querySelector('[name=csrfmiddlewaretoken]').value,
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({
+            session_id: currentSessionId,
+            guess: guess
+        }),
+    })
+    .then(async response => {
+        const redirectedToLogin = response.url.includes('/login');
+        const contentType = response.headers.get('content-type') || '';
+        let data = null;
+        if (contentType.includes('application/json')) {
+            try { data = await response.json(); } catch (e) { data = null; }
+        }
+
+        if (redirectedToLogin) {
+            showNotification('🔒 Session expired. Please log in again.', 'warning', 4000);
+            setTimeout(() => { window.location.href = '/login/?next=/game/'; }, 500);
+            throw new Error('Redirected to login');
+        }
+
+        if (!response.ok) {
+            const errMsg = data && data.error ? data.error : `Request failed (HTTP ${response.status})`;
+            throw new Error(errMsg);
+        }
+
+        if (!data) {
+            throw new Error('Unexpected server response');
+        }
+
+        return data;
+    })
+    .then(data => {
+        console.log('Guess response:', data);
+        if (data.success) {
+            renderGuess(guess, data);
+            document.getElementById('guessInput').value = '';
+
+            if (data.is_completed) {
+                console.log('Game completed:', { is_won: data.is_won, is_completed: data.is_completed });
+                finishGame();
+                
+                if (data.is_won) {
+                    console.log('Player won! Showing victory modal...');
+                    // Create confetti celebration
+                    createConfetti();
+                    showGameResult(true, '🎉 Congratulations!', 'You guessed the word correctly!');
+                    showNotification('🏆 Amazing! You won!', 'success', 5000);
+                } else {
+                    console.log('Player lost! Showing defeat modal...');
+                    const lossMsg = data.correct_word ? `The word was ${data.correct_word}.` : 'You used all 5 attempts.';
+                    showGameResult(false, '😔 Better luck next time!', lossMsg, data.correct_word || null);
+                    showNotification('💪 Don\'t give up! Try again!', 'warning');
+                }
+            } else {
+                // Show feedback based on guess quality
+                const correctLetters = data.feedback.filter(f => f.status === 'correct').length;
+                if (correctLetters >= 3) {
+                    showNotification('🔥 Great guess! You\'re getting close!', 'success');
+                } else if (correctLetters >= 1) {
+                    showNotification('👍 Good try! Keep going!', 'info');
+                } else {
+                    showNotification('💡 Think of different letters!', 'info');
+                }
+            }
+        } else {
+            console.error('Guess submission error:', data.error);
+            showNotification(`❌ ${data.error}`, 'error');
+        }
+    })
+    .catch(error => {
+        console.error('Error:', error);
+        if (String(error.message).includes('Redirected to login')) return;
+        showNotification(`❌ ${error.message || 'Connection error. Please try again.'}`, 'error');
+    })
+    .finally(() => {
+        setButtonLoading(submitBtn, false);
+    });
+}
+
+function displayGuess(guess, feedback, rowIndex) {
+    const row = document.getElementById(`row-${rowIndex}`);
+    const tiles = row.querySelectorAll('.letter-tile');
+    
+    // Animate each letter with a delay
+    for (let i = 0; i < 5; i++) {
+        setTimeout(() => {
+            tiles[i].textContent = guess[i];
+            tiles[i].className = `letter-tile letter-${feedback[i].status} revealing`;
+            
+            // Add special animation for correct letters
+            if (feedback[i].status === 'correct') {
+                setTimeout(() => {
+                    tiles[i].classList.add('success-pulse');
+                    setTimeout(() => tiles[i].classList.remove('success-pulse'), 500);
+                }, 300);
+            }
+        }, i * 150); // Stagger the animations
+    }
+}
+
+function clearGameBoard() {
+    for (let i = 0; i < 5; i++) {
+        const row = document.getElementById(`row-${i}`);
+        const tiles = row.querySelectorAll('.letter-tile');
+        tiles.forEach(tile => {
+            tile.textContent = '';
+            tile.className = 'letter-tile letter-default';
+        });
+    }
+}
+
+function showGameResult(isWon, title, message, correctWord = null) {
+    console.log('Showing game result:', { isWon, title, message });
+    
+    const resultIcon = document.getElementById('resultIcon');
+    const resultTitle = document.getElementById('resultTitle');
+    const resultMessage = document.getElementById('resultMessage');
+    const correctWordReveal = document.getElementById('correctWordReveal');
+    
+    if (!resultIcon || !resultTitle || !resultMessage) {
+        console.error('Modal elements not found');
+        return;
+    }
+    
+    if (isWon) {
+        resultIcon.innerHTML = '<i class="bi bi-trophy-fill text-warning" style="font-size: 4rem;"></i>';
+        // Add celebration confetti
+        createConfetti();
+        if (correctWordReveal) {
+            correctWordReveal.style.display = 'none';
+            correctWordReveal.innerHTML = '';
+        }
+    } else {
+        resultIcon.innerHTML = '<i class="bi bi-x-circle-fill text-danger" style="font-size: 4rem;"></i>';
+        if (correctWordReveal) {
+            correctWordReveal.style.display = 'flex';
+            revealCorrectWord(correctWord);
+        }
+    }
+    
+    resultTitle.textContent = title;
+    resultMessage.textContent = message;
+    
+    if (gameResultModal) {
+        gameResultModal.show();
+        
+        // Add bounce animation to the modal
+        setTimeout(() => {
+            const modalContent = document.querySelector('.victory-modal .modal-content');
+            if (modalContent) {
+                modalContent.style.animation = 'bounce-in 0.6s ease-out';
+            }
+        }, 100);
+
+        // Configure action button
+        const actionBtn = document.getElementById('resultActionBtn');
+        if (actionBtn) {
+            // Reset previous listeners by cloning
+            const newBtn = actionBtn.cloneNode(true);
+            actionBtn.parentNode.replaceChild(newBtn, actionBtn);
+            newBtn.innerHTML = '<i class="bi bi-play-fill me-2"></i>' + (isWon ? 'Play Again' : 'Try Again');
+            newBtn.addEventListener('click', function() {
+                // Close modal and start a new game
+                if (gameResultModal) gameResultModal.hide();
+                // Small delay to allow modal to hide smoothly
+                setTimeout(() => startNewGame(), 150);
+            });
+        }
+    } else {
+        console.error('Game result modal not initialized');
+    }
+}
+
+function revealCorrectWord(word) {
+    const container = document.getElementById('correctWordReveal');
+    if (!container) return;
+    container.innerHTML = '';
+    if (!word) return;
+
+    // Create tiles and animate letters appearing
+    const letters = word.split('');
+    for (let i = 0; i < letters.length; i++) {
+        const tile = document.createElement('div');
+        tile.className = 'letter-tile letter-correct';
+        tile.style.minWidth = '48px';
+        tile.style.minHeight = '48px';
+        tile.style.fontSize = '1.25rem';
+        tile.textContent = '';
+        container.appendChild(tile);
+
+        setTimeout(() => {
+            tile.textContent = letters[i];
+            tile.classList.add('revealing');
+            setTimeout(() => {
+                tile.classList.add('success-pulse');
+                setTimeout(() => tile.classList.remove('success-pulse'), 500);
+            }, 250);
+        }, i * 180);
+    }
+}
+
+function applySessionState(data) {
+    clearGameBoard();
+    currentGuessCount = 0;
+    data.guesses.forEach((guess, index) => {
+        displayGuess(guess.word, guess.feedback, index);
+    });
+    currentGuessCount = data.guesses.length;
+    document.getElementById('attemptsCount').textContent = currentGuessCount;
+    
+    if (data.is_completed) {
+        finishGame();
+    } else {
+        gameCompleted = false;
+    }
+}